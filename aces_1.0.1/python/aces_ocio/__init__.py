@@ -33,6 +33,51 @@ The above command line call would be done as follows:
 
 $ create_aces_config --lutResolution1d 1024 --lutResolution3d 33 --keepTempImages
 
+Generated *LUTs* can be cached across runs by setting the
+*ACES_OCIO_CACHE_DIRECTORY* environment variable to a persistent directory,
+*ACES_OCIO_CACHE_SIZE* sets its maximum size in bytes. *LUTs* whose *CTL*
+files, imported modules and parameters did not change are then copied from
+the cache instead of being regenerated.
+
+The generated files are recorded in a *manifest.json* file in the
+configuration directory, regenerating the configuration only generates again
+the *LUTs* and baked *LUTs* whose inputs changed and removes the files that
+are not generated anymore, the *--fullRebuild* option disables it.
+
+The intermediate images of every *LUT* are written in a private temporary
+directory, created in the *ACES_OCIO_TEMPORARY_DIRECTORY* environment
+variable directory if set, e.g. a tmpfs mount, so that *LUTs* can be
+generated concurrently.
+
+External tools run concurrently, e.g. the baked *LUTs* *ociobakelut* calls,
+and the colorspaces builders worker processes are limited to the number of
+CPUs or to the *ACES_OCIO_CONCURRENCY* environment variable value. Setting
+the *ACES_OCIO_PROCESS_LOG* environment variable to a file appends a *JSON
+Lines* record to it whenever an external tool starts or finishes, allowing to
+follow the progress of long builds.
+External tools running for longer than the *ACES_OCIO_PROCESS_TIMEOUT*
+environment variable value in seconds, or without output for longer than
+the *ACES_OCIO_PROCESS_IDLE_TIMEOUT* environment variable value, are killed.
+
+The 3D *LUTs* generated concurrently are admitted while their estimated
+memory and temporary disk footprints fit in the *ACES_OCIO_MEMORY_BUDGET* and
+*ACES_OCIO_DISK_BUDGET* environment variables values in bytes.
+
+The *--plan* option prints the jobs a configuration generation would
+execute, their intermediate disk usage and estimated runtime without
+executing them. Setting the *ACES_OCIO_TIMINGS* environment variable to a
+file records the timings of every run in it, the estimates are then based on
+them instead of rough defaults.
+
+The *--colorspaceBuilders* option selects the builders creating the *Camera
+Input Transforms* and general colorspaces, e.g. *arri,general*. The builders
+are imported only when selected, additional builders can be registered in
+the *aces_ocio.colorspaces* entry point group.
+
+The *--configBackend yaml* option builds and writes the *config.ocio* file
+with the pure *Python* *aces_ocio.ocio_yaml* backend instead of
+*PyOpenColorIO*, its output matches the *OCIO* v1 serializer output.
+
 Testing the generated configuration is needs the
 *ACES_OCIO_CTL_DIRECTORY* environment variable to be set and is done as
 follows:
@@ -67,6 +112,11 @@ ___
 
 $ brew install -vd CTL
 
+NumPy
+_____
+
+$ pip install numpy
+
 OpenColorIO
 ___________
 
@@ -0,0 +1,682 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Defines a persistent, content addressed file cache and a manifest of the
+generated files used to avoid regenerating *LUTs* whose inputs did not change.
+"""
+
+from __future__ import division
+
+import hashlib
+import json
+import os
+import shutil
+import tempfile
+import threading
+
+__author__ = 'ACES Developers'
+__copyright__ = 'Copyright (C) 2014 - 2015 - ACES Developers'
+__license__ = ''
+__maintainer__ = 'ACES Developers'
+__email__ = 'aces@oscars.org'
+__status__ = 'Production'
+
+__all__ = ['ACES_OCIO_CACHE_DIRECTORY_ENVIRON',
+           'ACES_OCIO_CACHE_SIZE_ENVIRON',
+           'CACHE_VERSION',
+           'DEFAULT_CACHE_SIZE',
+           'file_digest',
+           'FileCache',
+           'default_cache',
+           'MANIFEST_FILENAME',
+           'Manifest',
+           'active_manifest']
+
+ACES_OCIO_CACHE_DIRECTORY_ENVIRON = 'ACES_OCIO_CACHE_DIRECTORY'
+ACES_OCIO_CACHE_SIZE_ENVIRON = 'ACES_OCIO_CACHE_SIZE'
+
+CACHE_VERSION = 1
+DEFAULT_CACHE_SIZE = 2 * 1024 * 1024 * 1024
+
+
+_FILE_DIGESTS = {}
+_FILE_DIGESTS_LOCK = threading.Lock()
+
+
+def file_digest(path, block_size=1024 * 1024):
+    """
+    Returns the *SHA-1* digest of the content of given file. Digests are
+    remembered for the lifetime of the process as long as the file size and
+    modification time don't change.
+
+    Parameters
+    ----------
+    path : str or unicode
+        The path of the file to hash
+    block_size : int, optional
+        The size of the blocks read from the file
+
+    Returns
+    -------
+    str
+        The hexadecimal digest
+    """
+
+    stat = os.stat(path)
+    signature = (os.path.abspath(path), stat.st_size, stat.st_mtime)
+    with _FILE_DIGESTS_LOCK:
+        digest = _FILE_DIGESTS.get(signature)
+    if digest is not None:
+        return digest
+
+    digest = hashlib.sha1()
+    with open(path, 'rb') as fp:
+        for block in iter(lambda: fp.read(block_size), b''):
+            digest.update(block)
+    digest = digest.hexdigest()
+
+    with _FILE_DIGESTS_LOCK:
+        _FILE_DIGESTS[signature] = digest
+    return digest
+
+
+class FileCache(object):
+    """
+    A persistent cache storing sets of files under a key computed from the
+    inputs that produced them.
+
+    Entries are stored as directories named after their key, the least
+    recently used entries are evicted once the cache grows over its maximum
+    size. The cache is only scanned for eviction once the size of the
+    entries it stored since the last scan may have made it grow over its
+    maximum size.
+    """
+
+    def __init__(self,
+                 directory,
+                 maximum_size=DEFAULT_CACHE_SIZE,
+                 hardlink=False):
+        """
+        Constructor for FileCache class
+
+        Parameters
+        ----------
+        directory : str or unicode
+            The directory storing the cache entries
+        maximum_size : int, optional
+            The maximum size of the cache in bytes
+        hardlink : bool, optional
+            Whether to hardlink cached files instead of copying them when
+            possible
+
+        Returns
+        -------
+        None
+        """
+
+        self.directory = directory
+        self.maximum_size = maximum_size
+        self.hardlink = hardlink
+        self.hits = 0
+        self.misses = 0
+        # The cache size as of the last scan plus the size of the entries
+        # stored since then, entries stored by other processes are ignored.
+        self.estimated_size = None
+        self.lock = threading.Lock()
+
+        try:
+            os.makedirs(directory)
+        except OSError:
+            # The directory may have been created concurrently, e.g. by the
+            # colorspaces builders worker processes.
+            if not os.path.isdir(directory):
+                raise
+
+    @staticmethod
+    def key(*components):
+        """
+        Returns a key for given components.
+
+        Parameters
+        ----------
+        \*components : list
+            The components identifying an entry, they must be serializable
+            to *JSON*, dictionaries are hashed independently of their order
+
+        Returns
+        -------
+        str
+            The key
+        """
+
+        return hashlib.sha1(json.dumps([CACHE_VERSION, components],
+                                       sort_keys=True)).hexdigest()
+
+    def entry_directory(self, key):
+        """
+        Returns the directory storing the entry with given key.
+
+        Parameters
+        ----------
+        key : str
+            The entry key
+
+        Returns
+        -------
+        str or unicode
+            The entry directory
+        """
+
+        return os.path.join(self.directory, key[:2], key)
+
+    def __contains__(self, key):
+        """
+        Returns whether the cache has an entry with given key, without
+        accounting for a hit or a miss.
+
+        Parameters
+        ----------
+        key : str
+            The entry key
+
+        Returns
+        -------
+        bool
+            Whether the entry exists
+        """
+
+        return os.path.isdir(self.entry_directory(key))
+
+    def restore(self, source, destination):
+        """
+        Restores given cached file to given destination.
+
+        Parameters
+        ----------
+        source : str or unicode
+            The cached file
+        destination : str or unicode
+            The path to restore the file to
+
+        Returns
+        -------
+        None
+        """
+
+        if os.path.exists(destination):
+            os.remove(destination)
+
+        if self.hardlink:
+            try:
+                os.link(source, destination)
+                return
+            except OSError:
+                pass
+
+        shutil.copyfile(source, destination)
+
+    def get(self, key, paths):
+        """
+        Restores the files of the entry with given key to given paths.
+
+        Parameters
+        ----------
+        key : str
+            The entry key
+        paths : array of str or unicode
+            The paths to restore the entry files to, in the order they were
+            stored
+
+        Returns
+        -------
+        bool
+            Whether the entry was found and restored
+        """
+
+        entry_directory = self.entry_directory(key)
+        sources = [os.path.join(entry_directory, str(i))
+                   for i in range(len(paths))]
+
+        if not all(map(os.path.isfile, sources)):
+            with self.lock:
+                self.misses += 1
+            return False
+
+        try:
+            for source, path in zip(sources, paths):
+                self.restore(source, path)
+
+            # The entry modification time tracks its last use for eviction.
+            os.utime(entry_directory, None)
+        except (IOError, OSError):
+            # The entry may have been evicted concurrently by another cache
+            # sharing the directory, the partially restored files are
+            # discarded.
+            for path in paths:
+                if os.path.exists(path):
+                    os.remove(path)
+
+            with self.lock:
+                self.misses += 1
+            return False
+
+        with self.lock:
+            self.hits += 1
+        return True
+
+    def put(self, key, paths):
+        """
+        Stores given files in the entry with given key.
+
+        Parameters
+        ----------
+        key : str
+            The entry key
+        paths : array of str or unicode
+            The files to store
+
+        Returns
+        -------
+        None
+        """
+
+        entry_directory = self.entry_directory(key)
+        parent_directory = os.path.dirname(entry_directory)
+        try:
+            os.makedirs(parent_directory)
+        except OSError:
+            # The directory may have been created concurrently.
+            if not os.path.isdir(parent_directory):
+                raise
+
+        # The entry is assembled aside and then renamed so that concurrent
+        # readers never see a partial entry.
+        staging_directory = tempfile.mkdtemp(prefix='.', dir=parent_directory)
+        try:
+            size = 0
+            for i, path in enumerate(paths):
+                shutil.copyfile(path,
+                                os.path.join(staging_directory, str(i)))
+                size += os.path.getsize(path)
+
+            try:
+                os.rename(staging_directory, entry_directory)
+            except OSError:
+                # An entry stored concurrently with the same key is kept, it
+                # was produced by the same inputs.
+                if not os.path.isdir(entry_directory):
+                    raise
+                size = 0
+        finally:
+            if os.path.exists(staging_directory):
+                shutil.rmtree(staging_directory)
+
+        with self.lock:
+            if self.estimated_size is None:
+                self.estimated_size = self.size()
+            else:
+                self.estimated_size += size
+
+            if self.estimated_size > self.maximum_size:
+                self.evict()
+
+    def entries(self):
+        """
+        Returns the entries of the cache.
+
+        Returns
+        -------
+        list
+            The (last use time, size, directory) of every entry
+        """
+
+        entries = []
+        for parent_directory in os.listdir(self.directory):
+            parent_directory = os.path.join(self.directory, parent_directory)
+            if not os.path.isdir(parent_directory):
+                continue
+
+            for entry_directory in os.listdir(parent_directory):
+                # Skipping entries being staged.
+                if entry_directory.startswith('.'):
+                    continue
+
+                entry_directory = os.path.join(parent_directory,
+                                               entry_directory)
+                try:
+                    size = sum([os.path.getsize(
+                        os.path.join(entry_directory, f))
+                        for f in os.listdir(entry_directory)])
+                    entries.append((os.path.getmtime(entry_directory),
+                                    size,
+                                    entry_directory))
+                except OSError:
+                    # The entry was evicted concurrently.
+                    continue
+        return entries
+
+    def size(self):
+        """
+        Returns the size of the cache in bytes.
+
+        Returns
+        -------
+        int
+            The cache size
+        """
+
+        return sum([size for _, size, _ in self.entries()])
+
+    def evict(self):
+        """
+        Removes the least recently used entries until the cache size is
+        within its maximum size.
+
+        Returns
+        -------
+        int
+            The number of evicted entries
+        """
+
+        entries = sorted(self.entries())
+        size = sum([entry_size for _, entry_size, _ in entries])
+
+        evicted = 0
+        for _, entry_size, entry_directory in entries:
+            if size <= self.maximum_size:
+                break
+
+            shutil.rmtree(entry_directory, ignore_errors=True)
+            size -= entry_size
+            evicted += 1
+
+        self.estimated_size = size
+
+        return evicted
+
+    def clear(self):
+        """
+        Removes all the entries of the cache.
+
+        Returns
+        -------
+        None
+        """
+
+        for _, _, entry_directory in self.entries():
+            shutil.rmtree(entry_directory, ignore_errors=True)
+
+        self.estimated_size = None
+
+    def statistics(self):
+        """
+        Returns the cache statistics.
+
+        Returns
+        -------
+        dict
+            The hits, misses and size of the cache
+        """
+
+        return {'hits': self.hits,
+                'misses': self.misses,
+                'size': self.size()}
+
+
+_DEFAULT_CACHE = {}
+_DEFAULT_CACHE_LOCK = threading.Lock()
+
+
+def default_cache():
+    """
+    Returns the cache configured through the *ACES_OCIO_CACHE_DIRECTORY* and
+    *ACES_OCIO_CACHE_SIZE* environment variables.
+
+    Returns
+    -------
+    FileCache
+        The default cache or *None* if no cache directory is configured
+    """
+
+    directory = os.environ.get(ACES_OCIO_CACHE_DIRECTORY_ENVIRON)
+    if not directory:
+        return None
+
+    maximum_size = int(os.environ.get(ACES_OCIO_CACHE_SIZE_ENVIRON,
+                                      DEFAULT_CACHE_SIZE))
+
+    with _DEFAULT_CACHE_LOCK:
+        cache = _DEFAULT_CACHE.get(directory)
+        if cache is None:
+            cache = _DEFAULT_CACHE[directory] = FileCache(directory,
+                                                          maximum_size)
+        cache.maximum_size = maximum_size
+
+    return cache
+
+
+MANIFEST_FILENAME = 'manifest.json'
+
+_ACTIVE_MANIFEST = None
+
+
+class Manifest(object):
+    """
+    A manifest recording, for every file generated in a directory, the key
+    of the inputs it was generated from and its digest. While a manifest is
+    active, i.e. used as a context manager, the files whose inputs did not
+    change since the previous generation are not generated again.
+
+    Files recorded by the previous generation that are not recorded by the
+    current one are stale and can be pruned.
+    """
+
+    def __init__(self, directory, reuse=True):
+        """
+        Constructor for Manifest class
+
+        Parameters
+        ----------
+        directory : str or unicode
+            The directory holding the generated files and the manifest
+        reuse : bool, optional
+            Whether the up to date files of the previous generation are
+            reused
+
+        Returns
+        -------
+        None
+        """
+
+        self.directory = os.path.abspath(directory)
+        self.path = os.path.join(self.directory, MANIFEST_FILENAME)
+        self.reuse = reuse
+        self.previous = {}
+        self.entries = {}
+        self.lock = threading.Lock()
+
+        if os.path.isfile(self.path):
+            with open(self.path) as fp:
+                manifest = json.load(fp)
+            if manifest.get('version') == CACHE_VERSION:
+                self.previous = manifest['entries']
+
+    def __enter__(self):
+        global _ACTIVE_MANIFEST
+        _ACTIVE_MANIFEST = self
+        return self
+
+    def __exit__(self, *args):
+        global _ACTIVE_MANIFEST
+        _ACTIVE_MANIFEST = None
+
+    def relative_path(self, path):
+        """
+        Returns given path relative to the manifest directory.
+
+        Parameters
+        ----------
+        path : str or unicode
+            The path of a generated file
+
+        Returns
+        -------
+        str or unicode
+            The relative path
+        """
+
+        return os.path.relpath(os.path.abspath(path), self.directory)
+
+    def up_to_date(self, path, key):
+        """
+        Returns whether given file was generated by the previous generation
+        from the same inputs and was not modified since.
+
+        Parameters
+        ----------
+        path : str or unicode
+            The path of the generated file
+        key : str
+            The key of the inputs of the file
+
+        Returns
+        -------
+        bool
+            Whether the file is up to date
+        """
+
+        if not self.reuse:
+            return False
+
+        entry = self.previous.get(self.relative_path(path))
+
+        return (entry is not None and
+                entry['key'] is not None and
+                entry['key'] == key and
+                os.path.isfile(path) and
+                file_digest(path) == entry['digest'])
+
+    def record(self, path, key=None):
+        """
+        Records given generated file.
+
+        Parameters
+        ----------
+        path : str or unicode
+            The path of the generated file
+        key : str, optional
+            The key of the inputs of the file, files without key are always
+            generated again
+
+        Returns
+        -------
+        None
+        """
+
+        entry = {'key': key, 'digest': file_digest(path)}
+        with self.lock:
+            self.entries[self.relative_path(path)] = entry
+
+    def merge(self, entries):
+        """
+        Merges given entries, e.g. the entries recorded by a worker process.
+
+        Parameters
+        ----------
+        entries : dict
+            The entries to merge, as stored in *entries* attribute
+
+        Returns
+        -------
+        None
+        """
+
+        with self.lock:
+            self.entries.update(entries)
+
+    def record_directory(self, directory, since):
+        """
+        Records the files of given directory modified since given time and
+        not recorded yet, e.g. the files written in-process.
+
+        Parameters
+        ----------
+        directory : str or unicode
+            The directory to record the files of
+        since : float
+            The time since which the files were modified
+
+        Returns
+        -------
+        None
+        """
+
+        for parent_directory, _, files in os.walk(directory):
+            for name in files:
+                path = os.path.join(parent_directory, name)
+                if (self.relative_path(path) not in self.entries and
+                        os.path.getmtime(path) >= since):
+                    self.record(path)
+
+    def stale(self):
+        """
+        Returns the files recorded by the previous generation only.
+
+        Returns
+        -------
+        list
+            The stale files paths
+        """
+
+        return [os.path.join(self.directory, path)
+                for path in sorted(self.previous)
+                if path not in self.entries]
+
+    def prune(self):
+        """
+        Removes the stale files.
+
+        Returns
+        -------
+        list
+            The removed files paths
+        """
+
+        pruned = []
+        for path in self.stale():
+            if os.path.isfile(path):
+                os.remove(path)
+                pruned.append(path)
+
+        return pruned
+
+    def save(self):
+        """
+        Writes the manifest of the current generation.
+
+        Returns
+        -------
+        None
+        """
+
+        staging_path = '%s.tmp' % self.path
+        with open(staging_path, 'w') as fp:
+            json.dump({'version': CACHE_VERSION, 'entries': self.entries},
+                      fp,
+                      indent=2,
+                      sort_keys=True)
+        os.rename(staging_path, self.path)
+
+
+def active_manifest():
+    """
+    Returns the active manifest.
+
+    Returns
+    -------
+    Manifest
+        The active manifest or *None* if no manifest is active
+    """
+
+    return _ACTIVE_MANIFEST
@@ -1,20 +1,120 @@
 #!/usr/bin/env python
 # -*- coding: utf-8 -*-
 
-import aces
-import arri
-import canon
-import general
-import gopro
-import panasonic
-import red
-import sony
-
-__all__ = ['aces',
-           'arri',
-           'canon',
-           'general',
-           'gopro',
-           'panasonic',
-           'red',
-           'sony']
+"""
+Defines the colorspaces builders registry.
+
+A colorspaces builder is a module, or any object, defining a
+*create_colorspaces(lut_directory, lut_resolution_1d)* definition that
+returns a list of *ColorSpace*, e.g. *aces_ocio.colorspaces.arri*. The
+builders are imported when they are selected only. Additional builders are
+discovered through the *aces_ocio.colorspaces* entry point group.
+"""
+
+from __future__ import division
+
+import importlib
+from collections import OrderedDict
+
+__author__ = 'ACES Developers'
+__copyright__ = 'Copyright (C) 2014 - 2015 - ACES Developers'
+__license__ = ''
+__maintainer__ = 'ACES Developers'
+__email__ = 'aces@oscars.org'
+__status__ = 'Production'
+
+__all__ = ['COLORSPACE_BUILDERS',
+           'COLORSPACE_BUILDERS_ENTRY_POINT_GROUP',
+           'colorspace_builder_entry_points',
+           'colorspace_builders',
+           'load_colorspace_builder']
+
+# The colorspaces builders of the package and their modules, in the order
+# their colorspaces are added to the configuration.
+COLORSPACE_BUILDERS = OrderedDict([
+    ('arri', 'aces_ocio.colorspaces.arri'),
+    ('canon', 'aces_ocio.colorspaces.canon'),
+    ('gopro', 'aces_ocio.colorspaces.gopro'),
+    ('panasonic', 'aces_ocio.colorspaces.panasonic'),
+    ('red', 'aces_ocio.colorspaces.red'),
+    ('sony', 'aces_ocio.colorspaces.sony'),
+    ('general', 'aces_ocio.colorspaces.general')])
+
+# The entry point group additional colorspaces builders are registered in.
+COLORSPACE_BUILDERS_ENTRY_POINT_GROUP = 'aces_ocio.colorspaces'
+
+
+def colorspace_builder_entry_points():
+    """
+    Returns the colorspaces builders registered in the
+    *COLORSPACE_BUILDERS_ENTRY_POINT_GROUP* entry point group, the builders
+    themselves are not loaded.
+
+    Returns
+    -------
+    OrderedDict
+         The entry points by builder name, empty if *setuptools* is not
+         available.
+    """
+
+    try:
+        import pkg_resources
+    except ImportError:
+        return OrderedDict()
+
+    return OrderedDict(
+        (entry_point.name, entry_point)
+        for entry_point in pkg_resources.iter_entry_points(
+            COLORSPACE_BUILDERS_ENTRY_POINT_GROUP))
+
+
+def colorspace_builders(entry_points=True):
+    """
+    Returns the names of the available colorspaces builders.
+
+    Parameters
+    ----------
+    entry_points : bool, optional
+        Whether to include the builders registered as entry points
+
+    Returns
+    -------
+    list
+         The builders names, the package builders first.
+    """
+
+    names = list(COLORSPACE_BUILDERS)
+    if entry_points:
+        names.extend(name for name in colorspace_builder_entry_points()
+                     if name not in COLORSPACE_BUILDERS)
+
+    return names
+
+
+def load_colorspace_builder(name):
+    """
+    Imports and returns the colorspaces builder with given name, the package
+    builders taking precedence over the entry points.
+
+    Parameters
+    ----------
+    name : str or unicode
+        The builder name, see *colorspace_builders*
+
+    Returns
+    -------
+    object
+         The builder, its *create_colorspaces* definition must be defined at
+         module level to be called in a worker process.
+    """
+
+    if name in COLORSPACE_BUILDERS:
+        return importlib.import_module(COLORSPACE_BUILDERS[name])
+
+    entry_point = colorspace_builder_entry_points().get(name)
+    if entry_point is None:
+        raise ValueError('Unknown colorspaces builder : "%s", available '
+                         'builders : %s' % (
+                             name, ', '.join(colorspace_builders())))
+
+    return entry_point.load()
@@ -9,23 +9,24 @@ from __future__ import division
 
 import copy
 import math
-import numpy
 import os
 import pprint
 import string
 import shutil
 
-import PyOpenColorIO as ocio
-
 from aces_ocio.generate_lut import (
     generate_1d_LUT_from_CTL,
     generate_3d_LUT_from_CTL,
     write_SPI_1d)
+from aces_ocio.ocio_yaml import Constants
 from aces_ocio.utilities import (
     ColorSpace,
     mat44_from_mat33,
     sanitize,
-    compact)
+    compact,
+    LazyModule)
+
+numpy = LazyModule('numpy')
 
 __author__ = 'ACES Developers'
 __copyright__ = 'Copyright (C) 2014 - 2015 - ACES Developers'
@@ -50,12 +51,16 @@ __all__ = ['ACES_AP1_TO_AP0',
            'create_LMTs',
            'create_ACES_RRT_plus_ODT',
            'create_ODTs',
-           'create_shapers_dolbypq'
+           'create_shapers_dolbypq',
            'create_shapers_log2',
            'create_shapers',
            'get_transform_info',
            'get_ODTs_info',
            'get_LMTs_info',
+           'DEFAULT_DISPLAY',
+           'COLOR_PICKING',
+           'create_base_colorspaces',
+           'create_roles',
            'create_colorspaces']
 
 # Matrix converting *ACES AP1* primaries to *ACES AP0*.
@@ -101,7 +106,7 @@ def create_ACES():
     aces2065_1.aliases = ['lin_ap0', 'aces']
     aces2065_1.family = 'ACES'
     aces2065_1.is_data = False
-    aces2065_1.allocation_type = ocio.Constants.ALLOCATION_LG2
+    aces2065_1.allocation_type = Constants.ALLOCATION_LG2
     aces2065_1.allocation_vars = [-8, 5, 0.00390625]
 
     return aces2065_1
@@ -149,7 +154,7 @@ def create_ACEScc(aces_ctl_directory,
     cs.equality_group = ''
     cs.family = 'ACES'
     cs.is_data = False
-    cs.allocation_type = ocio.Constants.ALLOCATION_UNIFORM
+    cs.allocation_type = Constants.ALLOCATION_UNIFORM
     cs.allocation_vars = [min_value, max_value]
     cs.aces_transform_id = 'ACEScsc.ACEScc_to_ACES.a1.0.1'
 
@@ -302,7 +307,7 @@ def create_ACEScg():
     cs.equality_group = ''
     cs.family = 'ACES'
     cs.is_data = False
-    cs.allocation_type = ocio.Constants.ALLOCATION_LG2
+    cs.allocation_type = Constants.ALLOCATION_LG2
     cs.allocation_vars = [-8, 5, 0.00390625]
 
     cs.aces_transform_id = 'ACEScsc.ACEScg_to_ACES.a1.0.1'
@@ -365,7 +370,7 @@ def create_ADX(lut_directory,
     if bit_depth == 10:
         cs.aces_transform_id = 'ACEScsc.ADX10_to_ACES.a1.0.1'
 
-        cs.bit_depth = ocio.Constants.BIT_DEPTH_UINT10
+        cs.bit_depth = Constants.BIT_DEPTH_UINT10
         ADX_to_CDD = [1023 / 500, 0, 0, 0,
                       0, 1023 / 500, 0, 0,
                       0, 0, 1023 / 500, 0,
@@ -374,7 +379,7 @@ def create_ADX(lut_directory,
     elif bit_depth == 16:
         cs.aces_transform_id = 'ACEScsc.ADX16_to_ACES.a1.0.1'
 
-        cs.bit_depth = ocio.Constants.BIT_DEPTH_UINT16
+        cs.bit_depth = Constants.BIT_DEPTH_UINT16
         ADX_to_CDD = [65535 / 8000, 0, 0, 0,
                       0, 65535 / 8000, 0, 0,
                       0, 0, 65535 / 8000, 0,
@@ -818,7 +823,7 @@ def create_ACES_LMT(lmt_name,
     cs.equality_group = ''
     cs.family = 'Look'
     cs.is_data = False
-    cs.allocation_type = ocio.Constants.ALLOCATION_LG2
+    cs.allocation_type = Constants.ALLOCATION_LG2
     cs.allocation_vars = [-8, 5, 0.00390625]
     cs.aces_transform_id = lmt_values['transformID']
 
@@ -1569,7 +1574,8 @@ def create_ODTs(aces_ctl_directory,
                 shaper_name,
                 cleanup,
                 linear_display_space,
-                log_display_space):
+                log_display_space,
+                shaper_data=None):
     """
     Create ColorSpaces representing the *ACES Output Transforms*
 
@@ -1594,6 +1600,9 @@ def create_ODTs(aces_ctl_directory,
         The name of the ColorSpace to use for the raw or linear View
     log_display_space : lstr or unicode
         The name of the ColorSpace to use for the log View
+    shaper_data : dict, optional
+        The Shapers as returned by *create_shapers*, the Shaper ColorSpaces
+        are created and returned first if not given
 
     Returns
     -------
@@ -1610,12 +1619,13 @@ def create_ODTs(aces_ctl_directory,
     # -------------------------------------------------------------------------
     # *RRT / ODT* Shaper Options
     # -------------------------------------------------------------------------
-    shaper_data, shaper_colorspaces = create_shapers(aces_ctl_directory,
-        lut_directory,
-        lut_resolution_1d,
-        cleanup)
+    if shaper_data is None:
+        shaper_data, shaper_colorspaces = create_shapers(aces_ctl_directory,
+            lut_directory,
+            lut_resolution_1d,
+            cleanup)
 
-    colorspaces.extend(shaper_colorspaces)
+        colorspaces.extend(shaper_colorspaces)
 
     # Assumes shaper has variants covering the range expected by the
     # 48 nit, 1000 nit, 2000 nit and 4000 nit Ouput Transforms 
@@ -1630,11 +1640,12 @@ def create_ODTs(aces_ctl_directory,
     for odt in sorted_odts:
         (odt_name, odt_values) = odt
 
+        odt_name_legal = odt_values['transformUserName']
+        odt_legal = odt_values.copy()
+
         if odt_values['transformHasFullLegalSwitch']:
             odt_legal['legalRange'] = 0
 
-        odt_name_legal = odt_values['transformUserName']
-        odt_legal = odt_values.copy()
         odt_aliases = ['out_%s' % compact(odt_name_legal)]
 
         if odt_name_legal in ['P3-D60 ST2048 (1000 nits)', 'Rec.2020 ST2048 (1000 nits)']:
@@ -1882,6 +1893,87 @@ def get_LMTs_info(aces_ctl_directory):
     return lmts
 
 
+# TODO: Investigate if there is a way to retrieve these values from *CTL*.
+# The name of the default *Display* and of the colorspace used for color
+# picking.
+DEFAULT_DISPLAY = 'sRGB (D60 sim.)'
+COLOR_PICKING = 'Rec.709'
+
+
+def create_base_colorspaces(aces_ctl_directory,
+                            lut_directory,
+                            lut_resolution_1d,
+                            cleanup):
+    """
+    Generates the *ACES* colorspaces that are neither Look nor Output
+    Transforms
+
+    Parameters
+    ----------
+    aces_ctl_directory : str or unicode
+        The path to the aces 'transforms/ctl/utilities'
+    lut_directory : str or unicode
+        The directory to use when generating LUTs
+    lut_resolution_1d : int
+        The resolution of generated 1D LUTs
+    cleanup : bool
+        Whether or not to clean up the intermediate images
+
+    Returns
+    -------
+    list of ColorSpaces
+         The *ACEScc*, *ACESproxy*, *ACEScg*, *ADX10* and *ADX16*
+         colorspaces.
+    """
+
+    ACEScc = create_ACEScc(aces_ctl_directory, lut_directory,
+                           lut_resolution_1d, cleanup,
+                           min_value=-0.35840, max_value=1.468)
+
+    ACESproxy = create_ACESproxy(aces_ctl_directory, lut_directory,
+                                 lut_resolution_1d, cleanup)
+
+    ACEScg = create_ACEScg()
+
+    ADX10 = create_ADX(lut_directory, bit_depth=10)
+
+    ADX16 = create_ADX(lut_directory, bit_depth=16)
+
+    return [ACEScc, ACESproxy, ACEScg, ADX10, ADX16]
+
+
+def create_roles(reference, log, linear):
+    """
+    Generates the *ACES* role assignments
+
+    Parameters
+    ----------
+    reference : ColorSpace
+        The reference colorspace, *ACES*
+    log : ColorSpace
+        The log colorspace, *ACEScc*
+    linear : ColorSpace
+        The linear rendering colorspace, *ACEScg*
+
+    Returns
+    -------
+    dict
+         The role assignments.
+    """
+
+    return {'color_picking': COLOR_PICKING,
+            'color_timing': log.name,
+            'compositing_log': log.name,
+            'data': '',
+            'default': reference.name,
+            'matte_paint': log.name,
+            'reference': '',
+            'scene_linear': linear.name,
+            'texture_paint': '',
+            'compositing_linear': linear.name,
+            'rendering': linear.name}
+
+
 def create_colorspaces(aces_ctl_directory,
                        lut_directory,
                        lut_resolution_1d,
@@ -1930,23 +2022,12 @@ def create_colorspaces(aces_ctl_directory,
 
     ACES = create_ACES()
 
-    ACEScc = create_ACEScc(aces_ctl_directory, lut_directory,
-                           lut_resolution_1d, cleanup,
-                           min_value=-0.35840, max_value=1.468)
-    colorspaces.append(ACEScc)
-
-    ACESproxy = create_ACESproxy(aces_ctl_directory, lut_directory,
-                                 lut_resolution_1d, cleanup)
-    colorspaces.append(ACESproxy)
-
-    ACEScg = create_ACEScg()
-    colorspaces.append(ACEScg)
-
-    ADX10 = create_ADX(lut_directory, bit_depth=10)
-    colorspaces.append(ADX10)
-
-    ADX16 = create_ADX(lut_directory, bit_depth=16)
-    colorspaces.append(ADX16)
+    base_colorspaces = create_base_colorspaces(aces_ctl_directory,
+                                               lut_directory,
+                                               lut_resolution_1d,
+                                               cleanup)
+    ACEScc, ACESproxy, ACEScg, ADX10, ADX16 = base_colorspaces
+    colorspaces.extend(base_colorspaces)
 
     lmts = create_LMTs(aces_ctl_directory,
                        lut_directory,
@@ -1967,20 +2048,6 @@ def create_colorspaces(aces_ctl_directory,
                                  ACEScc)
     colorspaces.extend(odts)
 
-    # TODO: Investigate if there is a way to retrieve these values from *CTL*.
-    default_display = 'sRGB (D60 sim.)'
-    color_picking = 'Rec.709'
-
-    roles = {'color_picking': color_picking,
-             'color_timing': ACEScc.name,
-             'compositing_log': ACEScc.name,
-             'data': '',
-             'default': ACES.name,
-             'matte_paint': ACEScc.name,
-             'reference': '',
-             'scene_linear': ACEScg.name,
-             'texture_paint': '',
-             'compositing_linear': ACEScg.name,
-             'rendering': ACEScg.name}
-
-    return ACES, colorspaces, displays, ACEScc, roles, default_display
+    roles = create_roles(ACES, ACEScc, ACEScg)
+
+    return ACES, colorspaces, displays, ACEScc, roles, DEFAULT_DISPLAY
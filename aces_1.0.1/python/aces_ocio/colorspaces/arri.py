@@ -11,10 +11,12 @@ import array
 import math
 import os
 
-import PyOpenColorIO as ocio
-
 import aces_ocio.generate_lut as genlut
-from aces_ocio.utilities import ColorSpace, mat44_from_mat33, sanitize
+from aces_ocio.ocio_yaml import Constants
+from aces_ocio.utilities import (
+    ColorSpace,
+    mat44_from_mat33,
+    sanitize)
 
 __author__ = 'ACES Developers'
 __copyright__ = 'Copyright (C) 2014 - 2015 - ACES Developers'
@@ -78,7 +80,7 @@ def create_log_c(gamut,
 
     # A linear space needs allocation variables.
     if transfer_function == '':
-        cs.allocation_type = ocio.Constants.ALLOCATION_LG2
+        cs.allocation_type = Constants.ALLOCATION_LG2
         cs.allocation_vars = [-8, 5, 0.00390625]
 
     IDT_maker_version = '0.08'
@@ -10,10 +10,9 @@ from __future__ import division
 import array
 import os
 
-import PyOpenColorIO as ocio
-
 import aces_ocio.generate_lut as genlut
 from aces_ocio.colorspaces import aces
+from aces_ocio.ocio_yaml import Constants
 from aces_ocio.utilities import ColorSpace, mat44_from_mat33
 
 __author__ = 'ACES Developers'
@@ -79,7 +78,7 @@ def create_matrix_colorspace(name='matrix',
     cs.is_data = False
 
     # A linear space needs allocation variables.
-    cs.allocation_type = ocio.Constants.ALLOCATION_UNIFORM
+    cs.allocation_type = Constants.ALLOCATION_UNIFORM
     cs.allocation_vars = [0, 1]
 
     cs.to_reference_transforms = []
@@ -145,7 +144,7 @@ def create_transfer_colorspace(name='transfer',
     cs.is_data = False
 
     # A linear space needs allocation variables.
-    cs.allocation_type = ocio.Constants.ALLOCATION_UNIFORM
+    cs.allocation_type = Constants.ALLOCATION_UNIFORM
     cs.allocation_vars = [0, 1]
 
     # Sampling the transfer function.
@@ -236,7 +235,7 @@ def create_matrix_plus_transfer_colorspace(
     cs.is_data = False
 
     # A linear space needs allocation variables.
-    cs.allocation_type = ocio.Constants.ALLOCATION_UNIFORM
+    cs.allocation_type = Constants.ALLOCATION_UNIFORM
     cs.allocation_vars = [0, 1]
 
     # Sampling the transfer function.
@@ -10,10 +10,9 @@ from __future__ import division
 import array
 import os
 
-import PyOpenColorIO as ocio
-
 import aces_ocio.generate_lut as genlut
-from aces_ocio.utilities import (ColorSpace, sanitize)
+from aces_ocio.ocio_yaml import Constants
+from aces_ocio.utilities import ColorSpace, sanitize
 
 __author__ = 'ACES Developers'
 __copyright__ = 'Copyright (C) 2014 - 2015 - ACES Developers'
@@ -72,7 +71,7 @@ def create_protune(gamut,
 
     # A linear space needs allocation variables.
     if transfer_function == '':
-        cs.allocation_type = ocio.Constants.ALLOCATION_LG2
+        cs.allocation_type = Constants.ALLOCATION_LG2
         cs.allocation_vars = [-8, 5, 0.00390625]
 
     def protune_to_linear(normalized_code_value):
@@ -9,9 +9,8 @@ functions.
 import array
 import os
 
-import PyOpenColorIO as ocio
-
 import aces_ocio.generate_lut as genlut
+from aces_ocio.ocio_yaml import Constants
 from aces_ocio.utilities import ColorSpace
 
 __author__ = 'ACES Developers'
@@ -69,7 +68,7 @@ def create_v_log(gamut,
 
     # A linear space needs allocation variables
     if transfer_function == '':
-        cs.allocation_type = ocio.Constants.ALLOCATION_LG2
+        cs.allocation_type = Constants.ALLOCATION_LG2
         cs.allocation_vars = [-8, 5, 0.00390625]
 
     def v_log_to_linear(x):
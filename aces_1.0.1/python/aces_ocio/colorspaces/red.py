@@ -10,9 +10,8 @@ from __future__ import division
 import array
 import os
 
-import PyOpenColorIO as ocio
-
 import aces_ocio.generate_lut as genlut
+from aces_ocio.ocio_yaml import Constants
 from aces_ocio.utilities import ColorSpace, mat44_from_mat33
 
 __author__ = 'ACES Developers'
@@ -73,7 +72,7 @@ def create_red_log_film(gamut,
 
     # A linear space needs allocation variables
     if transfer_function == '':
-        cs.allocation_type = ocio.Constants.ALLOCATION_LG2
+        cs.allocation_type = Constants.ALLOCATION_LG2
         cs.allocation_vars = [-8, 5, 0.00390625]
 
     def cineon_to_linear(code_value):
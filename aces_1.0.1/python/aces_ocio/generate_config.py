@@ -8,28 +8,49 @@ Defines objects creating the *ACES* configuration.
 from __future__ import division
 
 import copy
+import multiprocessing
 import os
 import shutil
 import sys
-
-import PyOpenColorIO as ocio
+import tempfile
+import time
+from collections import OrderedDict
+
+from aces_ocio.cache import (
+    FileCache,
+    Manifest,
+    active_manifest,
+    default_cache,
+    file_digest)
+from aces_ocio.colorspaces import (
+    COLORSPACE_BUILDERS,
+    load_colorspace_builder)
 from aces_ocio.colorspaces import aces
-from aces_ocio.colorspaces import arri
-from aces_ocio.colorspaces import canon
-from aces_ocio.colorspaces import general
-from aces_ocio.colorspaces import gopro
-from aces_ocio.colorspaces import panasonic
-from aces_ocio.colorspaces import red
-from aces_ocio.colorspaces import sony
-from aces_ocio.process import Process
+from aces_ocio.generate_lut import IDENTITY_IMAGE_POOL
+from aces_ocio import ocio_yaml
+from aces_ocio.plan import (
+    Plan,
+    active_plan,
+    pop_timings,
+    record_timing,
+    save_timings)
+from aces_ocio.process import (
+    Process,
+    admission_controller,
+    default_concurrency,
+    execute_all)
 
 from aces_ocio.utilities import (
     ColorSpace,
-    colorspace_prefixed_name,
+    ColorSpaceRegistry,
+    LazyModule,
     compact,
+    files_walker,
     replace,
     unpack_default)
 
+ocio = LazyModule('PyOpenColorIO')
+
 __author__ = 'ACES Developers'
 __copyright__ = 'Copyright (C) 2014 - 2015 - ACES Developers'
 __license__ = ''
@@ -39,22 +60,35 @@ __status__ = 'Production'
 
 __all__ = ['ACES_OCIO_CTL_DIRECTORY_ENVIRON',
            'ACES_OCIO_CONFIGURATION_DIRECTORY_ENVIRON',
+           'CONFIG_BACKENDS',
            'set_config_roles',
            'create_ocio_transform',
            'add_colorspace_aliases',
            'add_look',
            'add_looks_to_views',
            'create_config',
+           'initialize_builder_worker',
+           'build_colorspaces',
+           'ColorSpaceBuilderPool',
            'create_config_data',
            'write_config',
+           'create_baked_LUT_processes',
            'generate_baked_LUTs',
            'generate_config_directory',
            'generate_config',
+           'generate_config_files',
+           'plan_config',
            'main']
 
 ACES_OCIO_CTL_DIRECTORY_ENVIRON = 'ACES_OCIO_CTL_DIRECTORY'
 ACES_OCIO_CONFIGURATION_DIRECTORY_ENVIRON = 'ACES_OCIO_CONFIGURATION_DIRECTORY'
 
+# The backends building and writing the *OCIO* configuration: *PyOpenColorIO*
+# or the pure *Python* backend that doesn't need the *OCIO* bindings.
+CONFIG_BACKENDS = OrderedDict([
+    ('ocio', ocio),
+    ('yaml', ocio_yaml)])
+
 
 def set_config_roles(config,
                      color_picking=None,
@@ -67,7 +101,8 @@ def set_config_roles(config,
                      scene_linear=None,
                      texture_paint=None,
                      rendering=None,
-                     compositing_linear=None):
+                     compositing_linear=None,
+                     backend=None):
     """
     Sets given *OCIO* configuration roles to the config.
     Parameters
@@ -96,28 +131,35 @@ def set_config_roles(config,
         Rendering role title.
     compositing_linear : str or unicode, optional
         Compositing Linear role title.
+    backend : object, optional
+        *OCIO* configuration backend, defaults to *PyOpenColorIO*, see
+        *CONFIG_BACKENDS* attribute.
     Returns
     -------
     bool
          Definition success.
     """
 
+    if backend is None:
+        backend = ocio
+
     if color_picking is not None:
-        config.setRole(ocio.Constants.ROLE_COLOR_PICKING, color_picking)
+        config.setRole(backend.Constants.ROLE_COLOR_PICKING, color_picking)
     if color_timing is not None:
-        config.setRole(ocio.Constants.ROLE_COLOR_TIMING, color_timing)
+        config.setRole(backend.Constants.ROLE_COLOR_TIMING, color_timing)
     if compositing_log is not None:
-        config.setRole(ocio.Constants.ROLE_COMPOSITING_LOG, compositing_log)
+        config.setRole(backend.Constants.ROLE_COMPOSITING_LOG,
+                       compositing_log)
     if data is not None:
-        config.setRole(ocio.Constants.ROLE_DATA, data)
+        config.setRole(backend.Constants.ROLE_DATA, data)
     if default is not None:
-        config.setRole(ocio.Constants.ROLE_DEFAULT, default)
+        config.setRole(backend.Constants.ROLE_DEFAULT, default)
     if matte_paint is not None:
-        config.setRole(ocio.Constants.ROLE_MATTE_PAINT, matte_paint)
+        config.setRole(backend.Constants.ROLE_MATTE_PAINT, matte_paint)
     if reference is not None:
-        config.setRole(ocio.Constants.ROLE_REFERENCE, reference)
+        config.setRole(backend.Constants.ROLE_REFERENCE, reference)
     if texture_paint is not None:
-        config.setRole(ocio.Constants.ROLE_TEXTURE_PAINT, texture_paint)
+        config.setRole(backend.Constants.ROLE_TEXTURE_PAINT, texture_paint)
 
     # *rendering* and *compositing_linear* roles default to the *scene_linear*
     # value if not set explicitly.
@@ -126,7 +168,7 @@ def set_config_roles(config,
     if compositing_linear is not None:
         config.setRole('compositing_linear', compositing_linear)
     if scene_linear is not None:
-        config.setRole(ocio.Constants.ROLE_SCENE_LINEAR, scene_linear)
+        config.setRole(backend.Constants.ROLE_SCENE_LINEAR, scene_linear)
         if rendering is None:
             config.setRole('rendering', scene_linear)
         if compositing_linear is None:
@@ -135,7 +177,7 @@ def set_config_roles(config,
     return True
 
 
-def create_ocio_transform(transforms):
+def create_ocio_transform(transforms, backend=None):
     """
     Returns an *OCIO* transform from given array of transform descriptions.
 
@@ -144,6 +186,9 @@ def create_ocio_transform(transforms):
     transforms : array_like
         Transform descriptions as an array_like of dicts:
         {'type', 'src', 'dst', 'direction'}
+    backend : object, optional
+        *OCIO* configuration backend, defaults to *PyOpenColorIO*, see
+        *CONFIG_BACKENDS* attribute.
 
     Returns
     -------
@@ -151,9 +196,12 @@ def create_ocio_transform(transforms):
          *OCIO* transform.
     """
 
+    if backend is None:
+        backend = ocio
+
     direction_options = {
-        'forward': ocio.Constants.TRANSFORM_DIR_FORWARD,
-        'inverse': ocio.Constants.TRANSFORM_DIR_INVERSE}
+        'forward': backend.Constants.TRANSFORM_DIR_FORWARD,
+        'inverse': backend.Constants.TRANSFORM_DIR_INVERSE}
 
     ocio_transforms = []
 
@@ -161,7 +209,7 @@ def create_ocio_transform(transforms):
 
         # *lutFile* transform
         if transform['type'] == 'lutFile':
-            ocio_transform = ocio.FileTransform()
+            ocio_transform = backend.FileTransform()
 
             if 'path' in transform:
                 ocio_transform.setSrc(transform['path'])
@@ -172,7 +220,8 @@ def create_ocio_transform(transforms):
             if 'interpolation' in transform:
                 ocio_transform.setInterpolation(transform['interpolation'])
             else:
-                ocio_transform.setInterpolation(ocio.Constants.INTERP_BEST)
+                ocio_transform.setInterpolation(
+                    backend.Constants.INTERP_BEST)
 
             if 'direction' in transform:
                 ocio_transform.setDirection(
@@ -182,7 +231,7 @@ def create_ocio_transform(transforms):
 
         # *matrix* transform
         elif transform['type'] == 'matrix':
-            ocio_transform = ocio.MatrixTransform()
+            ocio_transform = backend.MatrixTransform()
             # `MatrixTransform` member variables can't be initialized directly,
             # each must be set individually.
             ocio_transform.setMatrix(transform['matrix'])
@@ -198,7 +247,7 @@ def create_ocio_transform(transforms):
 
         # *exponent* transform
         elif transform['type'] == 'exponent':
-            ocio_transform = ocio.ExponentTransform()
+            ocio_transform = backend.ExponentTransform()
 
             if 'value' in transform:
                 ocio_transform.setValue(transform['value'])
@@ -207,7 +256,7 @@ def create_ocio_transform(transforms):
 
         # *log* transform
         elif transform['type'] == 'log':
-            ocio_transform = ocio.LogTransform()
+            ocio_transform = backend.LogTransform()
 
             if 'base' in transform:
                 ocio_transform.setBase(transform['base'])
@@ -220,7 +269,7 @@ def create_ocio_transform(transforms):
 
         # *colorspace* transform
         elif transform['type'] == 'colorspace':
-            ocio_transform = ocio.ColorSpaceTransform()
+            ocio_transform = backend.ColorSpaceTransform()
 
             if 'src' in transform:
                 ocio_transform.setSrc(transform['src'])
@@ -236,7 +285,7 @@ def create_ocio_transform(transforms):
 
         # *look* transform
         elif transform['type'] == 'look':
-            ocio_transform = ocio.LookTransform()
+            ocio_transform = backend.LookTransform()
             if 'look' in transform:
                 ocio_transform.setLooks(transform['look'])
 
@@ -257,7 +306,7 @@ def create_ocio_transform(transforms):
             print('Ignoring unknown transform type : %s' % transform['type'])
 
     if len(ocio_transforms) > 1:
-        group_transform = ocio.GroupTransform()
+        group_transform = backend.GroupTransform()
         for transform in ocio_transforms:
             group_transform.push_back(transform)
         transform = group_transform
@@ -271,7 +320,9 @@ def add_colorspace_aliases(config,
                            reference_colorspace,
                            colorspace,
                            colorspace_alias_names,
-                           family='Aliases'):
+                           family='Aliases',
+                           registry=None,
+                           backend=None):
     """
     Adds given colorspace aliases to the *OCIO* config.
 
@@ -285,6 +336,11 @@ def add_colorspace_aliases(config,
         Colorspace to set the aliases into the *OCIO* config.
     family : unicode
         Family.
+    registry : ColorSpaceRegistry, optional
+        Registry resolving the colorspaces names written in the *OCIO* config.
+    backend : object, optional
+        *OCIO* configuration backend, defaults to *PyOpenColorIO*, see
+        *CONFIG_BACKENDS* attribute.
 
     Returns
     -------
@@ -292,15 +348,25 @@ def add_colorspace_aliases(config,
         Definition success.
     """
 
+    if backend is None:
+        backend = ocio
+
+    if registry is None:
+        colorspace_name = colorspace.name
+        reference_name = reference_colorspace.name
+    else:
+        colorspace_name = registry.name(colorspace)
+        reference_name = registry.name(reference_colorspace)
+
     for alias_name in colorspace_alias_names:
-        if alias_name.lower() == colorspace.name.lower():
+        if alias_name.lower() == colorspace_name.lower():
             print('Skipping alias creation for %s, alias %s, '
                   'because lower cased names match' % (
-                      colorspace.name, alias_name))
+                      colorspace_name, alias_name))
             continue
 
         print('Adding alias colorspace space %s, alias to %s' % (
-            alias_name, colorspace.name))
+            alias_name, colorspace_name))
 
         compact_family_name = family
 
@@ -309,7 +375,7 @@ def add_colorspace_aliases(config,
             description += (
                 '\n\nACES Transform ID : %s' % colorspace.aces_transform_id)
 
-        ocio_colorspace_alias = ocio.ColorSpace(
+        ocio_colorspace_alias = backend.ColorSpace(
             name=alias_name,
             bitDepth=colorspace.bit_depth,
             description=description,
@@ -323,23 +389,25 @@ def add_colorspace_aliases(config,
             print('\tGenerating To-Reference transforms')
             ocio_transform = create_ocio_transform(
                 [{'type': 'colorspace',
-                  'src': colorspace.name,
-                  'dst': reference_colorspace.name,
-                  'direction': 'forward'}])
+                  'src': colorspace_name,
+                  'dst': reference_name,
+                  'direction': 'forward'}],
+                backend)
             ocio_colorspace_alias.setTransform(
                 ocio_transform,
-                ocio.Constants.COLORSPACE_DIR_TO_REFERENCE)
+                backend.Constants.COLORSPACE_DIR_TO_REFERENCE)
 
         if colorspace.from_reference_transforms:
             print('\tGenerating From-Reference transforms')
             ocio_transform = create_ocio_transform(
                 [{'type': 'colorspace',
-                  'src': reference_colorspace.name,
-                  'dst': colorspace.name,
-                  'direction': 'forward'}])
+                  'src': reference_name,
+                  'dst': colorspace_name,
+                  'direction': 'forward'}],
+                backend)
             ocio_colorspace_alias.setTransform(
                 ocio_transform,
-                ocio.Constants.COLORSPACE_DIR_FROM_REFERENCE)
+                backend.Constants.COLORSPACE_DIR_FROM_REFERENCE)
 
         config.addColorSpace(ocio_colorspace_alias)
 
@@ -348,7 +416,8 @@ def add_look(config,
              look,
              custom_lut_dir,
              reference_name,
-             config_data):
+             config_data,
+             backend=None):
     """
     Adds given look to the *OCIO* config.
 
@@ -365,6 +434,9 @@ def add_look(config,
     config_data : dict
         Colorspaces and transforms converting between those colorspaces and
         the reference colorspace, *ACES*.
+    backend : object, optional
+        *OCIO* configuration backend, defaults to *PyOpenColorIO*, see
+        *CONFIG_BACKENDS* attribute.
 
     Returns
     -------
@@ -372,6 +444,9 @@ def add_look(config,
         Definition success.
     """
 
+    if backend is None:
+        backend = ocio
+
     look_name, look_colorspace, look_lut, look_cccid = unpack_default(look, 4)
 
     print('Adding look %s - %s' % (look_name, ', '.join(look)))
@@ -386,7 +461,7 @@ def add_look(config,
             print('Skipping LUT copy because path contains a context variable')
 
     print('Adding look to config')
-    ocio_look = ocio.Look()
+    ocio_look = backend.Look()
     ocio_look.setName(look_name)
     ocio_look.setProcessSpace(look_colorspace)
 
@@ -396,7 +471,7 @@ def add_look(config,
     if look_cccid:
         keys['cccid'] = look_cccid
 
-    ocio_transform = create_ocio_transform([keys])
+    ocio_transform = create_ocio_transform([keys], backend)
     ocio_look.setTransform(ocio_transform)
 
     config.addLook(ocio_look)
@@ -410,7 +485,10 @@ def add_look(config,
     colorspace = ColorSpace(look_name,
                             aliases=look_aliases,
                             description='The %s Look colorspace' % look_name,
-                            family='Look')
+                            family='Look',
+                            bit_depth=backend.Constants.BIT_DEPTH_F32,
+                            allocation_type=(
+                                backend.Constants.ALLOCATION_UNIFORM))
 
     colorspace.from_reference_transforms = [{'type': 'look',
                                              'look': look_name,
@@ -533,7 +611,8 @@ def create_config(config_data,
                   prefix=False,
                   multiple_displays=False,
                   look_info=None,
-                  custom_lut_dir=None):
+                  custom_lut_dir=None,
+                  backend=None):
     """
     Create the *OCIO* config based on the configuration data
 
@@ -554,6 +633,9 @@ def create_config(config_data,
         Paths and names for look data
     custom_lut_dir : str or unicode, optional
         Directory to use for storing custom look files
+    backend : object, optional
+        *OCIO* configuration backend building the configuration, defaults to
+        *PyOpenColorIO*, see *CONFIG_BACKENDS* attribute
 
     Returns
     -------
@@ -564,10 +646,12 @@ def create_config(config_data,
     if look_info is None:
         look_info = []
 
-    prefixed_names = {}
+    if backend is None:
+        backend = ocio
+
     alias_colorspaces = []
 
-    config = ocio.Config()
+    config = backend.Config()
 
     config.setDescription('An ACES config generated from python')
 
@@ -579,16 +663,15 @@ def create_config(config_data,
     reference_data = config_data['referenceColorSpace']
 
     # Adding the colorspace *Family* into the name which helps with
-    # applications that presenting colorspaces as one a flat list.
-    if prefix:
-        prefixed_name = colorspace_prefixed_name(reference_data)
-        prefixed_names[reference_data.name] = prefixed_name
-        reference_data.name = prefixed_name
+    # applications that presenting colorspaces as one a flat list. The
+    # registry resolves the prefixed names, the colorspaces are not renamed.
+    registry = ColorSpaceRegistry(reference_data, prefix=prefix)
+    reference_name = registry.name(reference_data)
 
-    print('Adding the reference color space : %s' % reference_data.name)
+    print('Adding the reference color space : %s' % reference_name)
 
-    reference = ocio.ColorSpace(
-        name=reference_data.name,
+    reference = backend.ColorSpace(
+        name=reference_name,
         bitDepth=reference_data.bit_depth,
         description=reference_data.description,
         equalityGroup=reference_data.equality_group,
@@ -625,36 +708,35 @@ def create_config(config_data,
             add_look(config,
                      look,
                      custom_lut_dir,
-                     reference_data.name,
-                     config_data)
+                     reference_name,
+                     config_data,
+                     backend)
 
         add_looks_to_views(look_info,
-                           reference_data.name,
+                           reference_name,
                            config_data,
                            multiple_displays)
 
         print('')
 
+    # Indexing the colorspaces once the colorspaces incorporating the looks
+    # have been added.
+    registry.extend(config_data['colorSpaces'])
+
     print('Adding regular colorspaces')
 
-    for colorspace in sorted(config_data['colorSpaces'],
-        cmp=lambda x,y: cmp(x.family.lower(), y.family.lower())):
-        # Adding the colorspace *Family* into the name which helps with
-        # applications that presenting colorspaces as one a flat list.
-        if prefix:
-            prefixed_name = colorspace_prefixed_name(colorspace)
-            prefixed_names[colorspace.name] = prefixed_name
-            colorspace.name = prefixed_name
+    for colorspace in registry.by_family():
+        colorspace_name = registry.name(colorspace)
 
-        print('Creating new color space : %s' % colorspace.name)
+        print('Creating new color space : %s' % colorspace_name)
 
         description = colorspace.description
         if colorspace.aces_transform_id:
             description += (
                 '\n\nACES Transform ID : %s' % colorspace.aces_transform_id)
 
-        ocio_colorspace = ocio.ColorSpace(
-            name=colorspace.name,
+        ocio_colorspace = backend.ColorSpace(
+            name=colorspace_name,
             bitDepth=colorspace.bit_depth,
             description=description,
             equalityGroup=colorspace.equality_group,
@@ -666,18 +748,18 @@ def create_config(config_data,
         if colorspace.to_reference_transforms:
             print('\tGenerating To-Reference transforms')
             ocio_transform = create_ocio_transform(
-                colorspace.to_reference_transforms)
+                colorspace.to_reference_transforms, backend)
             ocio_colorspace.setTransform(
                 ocio_transform,
-                ocio.Constants.COLORSPACE_DIR_TO_REFERENCE)
+                backend.Constants.COLORSPACE_DIR_TO_REFERENCE)
 
         if colorspace.from_reference_transforms:
             print('\tGenerating From-Reference transforms')
             ocio_transform = create_ocio_transform(
-                colorspace.from_reference_transforms)
+                colorspace.from_reference_transforms, backend)
             ocio_colorspace.setTransform(
                 ocio_transform,
-                ocio.Constants.COLORSPACE_DIR_FROM_REFERENCE)
+                backend.Constants.COLORSPACE_DIR_FROM_REFERENCE)
 
         config.addColorSpace(ocio_colorspace)
 
@@ -698,95 +780,45 @@ def create_config(config_data,
     # to the configuration.
     print('Setting the roles')
 
-    if prefix:
-        set_config_roles(
-            config,
-            color_picking=prefixed_names[
-                config_data['roles']['color_picking']],
-            color_timing=prefixed_names[config_data['roles']['color_timing']],
-            compositing_log=prefixed_names[
-                config_data['roles']['compositing_log']],
-            data=prefixed_names[config_data['roles']['data']],
-            default=prefixed_names[config_data['roles']['default']],
-            matte_paint=prefixed_names[config_data['roles']['matte_paint']],
-            reference=prefixed_names[config_data['roles']['reference']],
-            scene_linear=prefixed_names[config_data['roles']['scene_linear']],
-            compositing_linear=prefixed_names[config_data['roles']['scene_linear']],
-            rendering=prefixed_names[config_data['roles']['scene_linear']],
-            texture_paint=prefixed_names[
-                config_data['roles']['texture_paint']])
-
-        # Add the aliased colorspaces for each role
-        for role_name, role_colorspace_name in config_data['roles'].iteritems():
-            role_colorspace_prefixed_name = prefixed_names[role_colorspace_name]
-
-            #print( 'Finding colorspace : %s' % role_colorspace_prefixed_name )
-            # Find the colorspace pointed to by the role
-            role_colorspaces = [colorspace
-                for colorspace in config_data['colorSpaces']
-                if colorspace.name == role_colorspace_prefixed_name]
-            role_colorspace = None
-            if len(role_colorspaces) > 0:
-                role_colorspace = role_colorspaces[0]
-            else:
-                if reference_data.name == role_colorspace_prefixed_name:
-                    role_colorspace = reference_data
-
-            if role_colorspace:
-                # The alias colorspace shouldn't match the role name exactly
-                role_name_alias1 = "role_%s" % role_name
-                role_name_alias2 = "Role - %s" % role_name
-
-                print( 'Adding a role colorspace named %s, pointing to %s' % (
-                    role_name_alias2, role_colorspace.name))
-
-                alias_colorspaces.append(
-                (reference_data, role_colorspace, [role_name_alias1]))
-
-                add_colorspace_aliases(
-                config, reference_data, role_colorspace, [role_name_alias2], 'Roles')
-
-    else:
-        set_config_roles(
-            config,
-            color_picking=config_data['roles']['color_picking'],
-            color_timing=config_data['roles']['color_timing'],
-            compositing_log=config_data['roles']['compositing_log'],
-            data=config_data['roles']['data'],
-            default=config_data['roles']['default'],
-            matte_paint=config_data['roles']['matte_paint'],
-            reference=config_data['roles']['reference'],
-            scene_linear=config_data['roles']['scene_linear'],
-            compositing_linear=config_data['roles']['scene_linear'],
-            rendering=config_data['roles']['scene_linear'],
-            texture_paint=config_data['roles']['texture_paint'])
-
-        # Add the aliased colorspaces for each role
-        for role_name, role_colorspace_name in config_data['roles'].iteritems():
-            # Find the colorspace pointed to by the role
-            role_colorspaces = [colorspace
-            for colorspace in config_data['colorSpaces']
-            if colorspace.name == role_colorspace_name]
-            role_colorspace = None
-            if len(role_colorspaces) > 0:
-                role_colorspace = role_colorspaces[0]
-            else:
-                if reference_data.name == role_colorspace_name:
-                    role_colorspace = reference_data
-
-            if role_colorspace:
-                # The alias colorspace shouldn't match the role name exactly
-                role_name_alias1 = "role_%s" % role_name
-                role_name_alias2 = "Role - %s" % role_name
-
-                print('Adding a role colorspace named %s, pointing to %s' % (
-                    role_name_alias2, role_colorspace.name))
+    roles = config_data['roles']
+    set_config_roles(
+        config,
+        color_picking=registry.resolve(roles['color_picking']),
+        color_timing=registry.resolve(roles['color_timing']),
+        compositing_log=registry.resolve(roles['compositing_log']),
+        data=registry.resolve(roles['data']),
+        default=registry.resolve(roles['default']),
+        matte_paint=registry.resolve(roles['matte_paint']),
+        reference=registry.resolve(roles['reference']),
+        scene_linear=registry.resolve(roles['scene_linear']),
+        compositing_linear=registry.resolve(roles['scene_linear']),
+        rendering=registry.resolve(roles['scene_linear']),
+        texture_paint=registry.resolve(roles['texture_paint']),
+        backend=backend)
+
+    # Add the aliased colorspaces for each role
+    for role_name, role_colorspace_name in roles.iteritems():
+        # Find the colorspace pointed to by the role
+        role_colorspace = registry.get(role_colorspace_name)
+
+        if role_colorspace:
+            # The alias colorspace shouldn't match the role name exactly
+            role_name_alias1 = "role_%s" % role_name
+            role_name_alias2 = "Role - %s" % role_name
+
+            print('Adding a role colorspace named %s, pointing to %s' % (
+                role_name_alias2, registry.name(role_colorspace)))
 
-                alias_colorspaces.append(
+            alias_colorspaces.append(
                 (reference_data, role_colorspace, [role_name_alias1]))
 
-                add_colorspace_aliases(
-                config, reference_data, role_colorspace, [role_name_alias2], 'Roles')
+            add_colorspace_aliases(config,
+                                   reference_data,
+                                   role_colorspace,
+                                   [role_name_alias2],
+                                   'Roles',
+                                   registry,
+                                   backend)
 
     print('')
 
@@ -798,7 +830,12 @@ def create_config(config_data,
     # using the configuration order.
     print('Adding the alias colorspaces')
     for reference, colorspace, aliases in alias_colorspaces:
-        add_colorspace_aliases(config, reference, colorspace, aliases)
+        add_colorspace_aliases(config,
+                               reference,
+                               colorspace,
+                               aliases,
+                               registry=registry,
+                               backend=backend)
 
     print('')
 
@@ -824,17 +861,18 @@ def create_config(config_data,
         # is written to disk.
         for display, view_list in config_data['displays'].iteritems():
             for view_name, colorspace in view_list.iteritems():
-                config.addDisplay(display, view_name, colorspace.name, looks)
+                colorspace_name = registry.name(colorspace)
+                config.addDisplay(display, view_name, colorspace_name, looks)
                 if 'Output Transform' in view_name and looks != '':
                     # *Views* without *Looks*.
-                    config.addDisplay(display, view_name, colorspace.name)
+                    config.addDisplay(display, view_name, colorspace_name)
 
                     # *Views* with *Looks*.
                     view_name_with_looks = '%s with %s' % (view_name, looks)
                     config.addDisplay(display, view_name_with_looks,
-                                      colorspace.name, looks)
+                                      colorspace_name, looks)
                 else:
-                    config.addDisplay(display, view_name, colorspace.name)
+                    config.addDisplay(display, view_name, colorspace_name)
                 if not (view_name in views):
                     views.append(view_name)
             displays.append(display)
@@ -880,11 +918,11 @@ def create_config(config_data,
                         if views_with_looks_at_end:
                             displays_views_colorspaces.append(
                                 [single_display_name, sanitised_display,
-                                 colorspace.name])
+                                 registry.name(colorspace)])
                         else:
                             config.addDisplay(single_display_name,
                                               sanitised_display,
-                                              colorspace.name)
+                                              registry.name(colorspace))
 
                             if not (sanitised_display in views):
                                 views.append(sanitised_display)
@@ -893,7 +931,7 @@ def create_config(config_data,
                     else:
                         config.addDisplay(single_display_name,
                                           sanitised_display,
-                                          colorspace.name)
+                                          registry.name(colorspace))
 
                         if not (sanitised_display in views):
                             views.append(sanitised_display)
@@ -913,12 +951,8 @@ def create_config(config_data,
             if not (sanitised_display in views):
                 views.append(sanitised_display)
 
-        raw_display_space_name = config_data['roles']['data']
-        log_display_space_name = config_data['roles']['compositing_log']
-
-        if prefix:
-            raw_display_space_name = prefixed_names[raw_display_space_name]
-            log_display_space_name = prefixed_names[log_display_space_name]
+        raw_display_space_name = registry.resolve(roles['data'])
+        log_display_space_name = registry.resolve(roles['compositing_log'])
 
         config.addDisplay(single_display_name, 'Raw', raw_display_space_name)
         views.append('Raw')
@@ -933,30 +967,165 @@ def create_config(config_data,
     # Ensuring the configuration is valid.
     config.sanityCheck()
 
-    # Resetting colorspace names to their non-prefixed versions.
-    if prefix:
-        prefixed_names_inverse = {}
-        for original, prefixed in prefixed_names.iteritems():
-            prefixed_names_inverse[prefixed] = original
+    return config
 
-        reference_data.name = prefixed_names_inverse[reference_data.name]
 
-        try:
-            for colorspace in config_data['colorSpaces']:
-                colorspace.name = prefixed_names_inverse[colorspace.name]
-        except:
-            print('Error with Prefixed names')
-            for original, prefixed in prefixed_names.iteritems():
-                print('%s, %s' % (original, prefixed))
+def initialize_builder_worker():
+    """
+    Initializes a *ColorSpaceBuilderPool* worker process: the timings
+    inherited from the parent process are forgotten. The identity images
+    inherited from the parent process are shared by the workers and cleaned
+    up by the parent process.
 
-            print('\n')
+    Returns
+    -------
+    None
+    """
 
-            print('Inverse Lookup of Prefixed names')
-            for prefixed, original in prefixed_names_inverse.iteritems():
-                print('%s, %s' % (prefixed, original))
-            raise
+    # The parent process timings are not the worker ones.
+    pop_timings()
 
-    return config
+
+def build_colorspaces(builder, args):
+    """
+    Calls given colorspaces builder in a *ColorSpaceBuilderPool* worker
+    process and returns its result along with the state it recorded that the
+    parent process needs.
+
+    Parameters
+    ----------
+    builder : callable
+        The colorspaces builder, a module level definition
+    args : tuple
+        The builder arguments
+
+    Returns
+    -------
+    tuple
+         The builder result, the manifest entries, the stage timings and the
+         cache hits and misses recorded by the builder.
+    """
+
+    manifest = active_manifest()
+    if manifest is not None:
+        manifest.entries = {}
+
+    cache = default_cache()
+    if cache is not None:
+        cache.hits = cache.misses = 0
+
+    result = builder(*args)
+
+    return (result,
+            manifest.entries if manifest is not None else {},
+            pop_timings(),
+            (cache.hits, cache.misses) if cache is not None else (0, 0))
+
+
+class ColorSpaceBuilderPool(object):
+    """
+    Calls the colorspaces builders, e.g. *arri.create_colorspaces*, on a pool
+    of worker processes, the builders being independent of each other. The
+    builders are called serially in-process when the concurrency is 1 or a
+    plan is active.
+    """
+
+    def __init__(self, concurrency=None):
+        """
+        Constructor for ColorSpaceBuilderPool class
+
+        Parameters
+        ----------
+        concurrency : int, optional
+            The number of worker processes, defaults to
+            *default_concurrency*
+
+        Returns
+        -------
+        None
+        """
+
+        if concurrency is None:
+            concurrency = default_concurrency()
+
+        self.pool = None
+        if concurrency > 1 and active_plan() is None:
+            # The admission controller must exist before the workers are
+            # forked for them to share it.
+            admission_controller()
+            self.pool = multiprocessing.Pool(concurrency,
+                                             initialize_builder_worker)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exception_type, *args):
+        if self.pool is None:
+            return
+
+        if exception_type is None:
+            self.pool.close()
+        else:
+            self.pool.terminate()
+        self.pool.join()
+
+    def submit(self, builder, *args):
+        """
+        Submits given colorspaces builder call.
+
+        Parameters
+        ----------
+        builder : callable
+            The colorspaces builder, a module level definition
+        \*args : list, optional
+            The builder arguments
+
+        Returns
+        -------
+        object
+             The job to pass to *result* method.
+        """
+
+        if self.pool is None:
+            return builder(*args)
+
+        return self.pool.apply_async(build_colorspaces, (builder, args))
+
+    def result(self, job):
+        """
+        Waits for given job and returns its builder result, the manifest
+        entries, timings and cache statistics recorded by the worker being
+        merged into the current process ones.
+
+        Parameters
+        ----------
+        job : object
+            The job returned by *submit* method
+
+        Returns
+        -------
+        object
+             The builder result.
+        """
+
+        if self.pool is None:
+            return job
+
+        result, entries, timings, (hits, misses) = job.get()
+
+        manifest = active_manifest()
+        if manifest is not None:
+            manifest.merge(entries)
+
+        for stage, timing in timings.items():
+            record_timing(stage, timing['units'], timing['seconds'])
+
+        cache = default_cache()
+        if cache is not None:
+            cache.hits += hits
+            cache.misses += misses
+
+        return result
 
 
 def create_config_data(odt_info,
@@ -966,7 +1135,8 @@ def create_config_data(odt_info,
                        lut_directory,
                        lut_resolution_1d=4096,
                        lut_resolution_3d=64,
-                       cleanup=True):
+                       cleanup=True,
+                       colorspace_builders=None):
     """
     Create the *ACES* LUTs and data structures needed for later *OCIO* 
     configuration generation
@@ -990,6 +1160,10 @@ def create_config_data(odt_info,
         The resolution of generated 3D LUTs
     cleanup : bool
         Whether or not to clean up the intermediate images 
+    colorspace_builders : array of str or unicode, optional
+        The names of the colorspaces builders creating the *Camera Input
+        Transforms* and general colorspaces, defaults to the package
+        builders, see *aces_ocio.colorspaces.colorspace_builders*
 
     Returns
     -------
@@ -998,94 +1172,110 @@ def create_config_data(odt_info,
          colorspaces and the reference colorspace, *ACES*.
     """
 
+    if colorspace_builders is None:
+        colorspace_builders = list(COLORSPACE_BUILDERS)
+
+    # The 3D LUTs identity image is created before the builder workers are
+    # forked so that they all share it.
+    if active_plan() is None:
+        if not cleanup:
+            IDENTITY_IMAGE_POOL.keep = True
+        IDENTITY_IMAGE_POOL.get(lut_resolution_3d, 'float')
+
     print('create_config_data - begin')
     config_data = {}
 
     config_data['displays'] = {}
     config_data['colorSpaces'] = []
 
-    # -------------------------------------------------------------------------
-    # *ACES Color Spaces*
-    # -------------------------------------------------------------------------
-
-    # *ACES* colorspaces
-    (aces_reference,
-     aces_colorspaces,
-     aces_displays,
-     aces_log_display_space,
-     aces_roles,
-     aces_default_display) = aces.create_colorspaces(aces_ctl_directory,
-                                                     lut_directory,
-                                                     lut_resolution_1d,
-                                                     lut_resolution_3d,
-                                                     lmt_info,
-                                                     odt_info,
-                                                     shaper_name,
-                                                     cleanup)
-
-    config_data['referenceColorSpace'] = aces_reference
-    config_data['roles'] = aces_roles
-
-    for cs in aces_colorspaces:
-        config_data['colorSpaces'].append(cs)
-
-    for name, data in aces_displays.iteritems():
-        config_data['displays'][name] = data
-
-    config_data['defaultDisplay'] = aces_default_display
-    config_data['linearDisplaySpace'] = aces_reference
-    config_data['logDisplaySpace'] = aces_log_display_space
-
-    # -------------------------------------------------------------------------
-    # *Camera Input Transforms*
-    # -------------------------------------------------------------------------
-
-    # *ARRI Log-C* to *ACES*
-    arri_colorspaces = arri.create_colorspaces(lut_directory,
-                                               lut_resolution_1d)
-    for cs in arri_colorspaces:
-        config_data['colorSpaces'].append(cs)
-
-    # *Canon-Log* to *ACES*
-    canon_colorspaces = canon.create_colorspaces(lut_directory,
-                                                 lut_resolution_1d)
-    for cs in canon_colorspaces:
-        config_data['colorSpaces'].append(cs)
-
-    # *GoPro Protune* to *ACES*
-    gopro_colorspaces = gopro.create_colorspaces(lut_directory,
-                                                 lut_resolution_1d)
-    for cs in gopro_colorspaces:
-        config_data['colorSpaces'].append(cs)
-
-    # *Panasonic V-Log* to *ACES*
-    panasonic_colorspaces = panasonic.create_colorspaces(lut_directory,
-                                                         lut_resolution_1d)
-    for cs in panasonic_colorspaces:
-        config_data['colorSpaces'].append(cs)
-
-    # *RED* colorspaces to *ACES*
-    red_colorspaces = red.create_colorspaces(lut_directory,
-                                             lut_resolution_1d)
-    for cs in red_colorspaces:
-        config_data['colorSpaces'].append(cs)
-
-    # *S-Log* to *ACES*
-    sony_colorspaces = sony.create_colorspaces(lut_directory,
-                                               lut_resolution_1d)
-    for cs in sony_colorspaces:
-        config_data['colorSpaces'].append(cs)
-
-    # -------------------------------------------------------------------------
-    # General Colorspaces
-    # -------------------------------------------------------------------------
-    general_colorspaces = general.create_colorspaces(lut_directory,
-                                                     lut_resolution_1d)
-    for cs in general_colorspaces:
-        config_data['colorSpaces'].append(cs)
+    # The colorspaces builders are independent of each other and are called
+    # concurrently, their colorspaces are merged in a deterministic order.
+    # The *ACES* colorspaces are split into the shapers, the *LMTs* and one
+    # builder per *ODT* so that no builder is the long pole.
+    with ColorSpaceBuilderPool() as builders:
+        # *ACES* colorspaces
+        aces_job = builders.submit(aces.create_base_colorspaces,
+                                   aces_ctl_directory,
+                                   lut_directory,
+                                   lut_resolution_1d,
+                                   cleanup)
+        lmts_job = builders.submit(aces.create_LMTs,
+                                   aces_ctl_directory,
+                                   lut_directory,
+                                   lut_resolution_1d,
+                                   lut_resolution_3d,
+                                   lmt_info,
+                                   cleanup)
+        shapers_job = builders.submit(aces.create_shapers,
+                                      aces_ctl_directory,
+                                      lut_directory,
+                                      lut_resolution_1d,
+                                      cleanup)
+
+        # *Camera Input Transforms* and general colorspaces, e.g. *ARRI
+        # Log-C*, *Canon-Log*, *GoPro Protune*, *Panasonic V-Log*, *RED*
+        # colorspaces and *S-Log* to *ACES*.
+        vendor_jobs = [builders.submit(
+            load_colorspace_builder(name).create_colorspaces,
+            lut_directory,
+            lut_resolution_1d)
+            for name in colorspace_builders]
+
+        aces_reference = aces.create_ACES()
+        shaper_data, shaper_colorspaces = builders.result(shapers_job)
+
+        # *RRT + ODT* combinations, in *aces.create_ODTs* definition order.
+        # The *ODTs* don't wait for the *ACEScc* colorspace, their views are
+        # given the configuration colorspaces below.
+        odt_jobs = [builders.submit(aces.create_ODTs,
+                                    aces_ctl_directory,
+                                    lut_directory,
+                                    lut_resolution_1d,
+                                    lut_resolution_3d,
+                                    {odt_name: odt_values},
+                                    shaper_name,
+                                    cleanup,
+                                    aces_reference,
+                                    None,
+                                    shaper_data)
+                    for odt_name, odt_values in sorted(odt_info.iteritems(),
+                                                       key=lambda x: x[1])]
+
+        aces_colorspaces = builders.result(aces_job)
+        (aces_log_display_space,
+         aces_proxy,
+         aces_scene_linear,
+         adx_10,
+         adx_16) = aces_colorspaces
+
+        config_data['referenceColorSpace'] = aces_reference
+        config_data['roles'] = aces.create_roles(aces_reference,
+                                                 aces_log_display_space,
+                                                 aces_scene_linear)
+
+        config_data['colorSpaces'].extend(aces_colorspaces)
+        config_data['colorSpaces'].extend(builders.result(lmts_job))
+        config_data['colorSpaces'].extend(shaper_colorspaces)
+
+        for odt_job in odt_jobs:
+            odt_colorspaces, odt_displays = builders.result(odt_job)
+            config_data['colorSpaces'].extend(odt_colorspaces)
+            for name, data in odt_displays.iteritems():
+                # The workers views colorspaces are copies, the views must
+                # reference the configuration colorspaces.
+                data['Raw'] = aces_reference
+                data['Log'] = aces_log_display_space
+                config_data['displays'][name] = data
+
+        config_data['defaultDisplay'] = aces.DEFAULT_DISPLAY
+        config_data['linearDisplaySpace'] = aces_reference
+        config_data['logDisplaySpace'] = aces_log_display_space
+
+        for vendor_job in vendor_jobs:
+            config_data['colorSpaces'].extend(builders.result(vendor_job))
 
     # The *Raw* colorspace
-    raw = general.create_raw()
+    raw = load_colorspace_builder('general').create_raw()
     config_data['colorSpaces'].append(raw)
 
     # Overriding various roles
@@ -1126,19 +1316,23 @@ def write_config(config, config_path, sanity_check=True):
             return
 
     with open(config_path, mode='w') as fp:
-        fp.write(config.serialize())
+        # The pure *Python* backend streams the configuration to the file.
+        if isinstance(config, ocio_yaml.Config):
+            config.write(fp)
+        else:
+            fp.write(config.serialize())
 
 
-def generate_baked_LUTs(odt_info,
-                        shaper_name,
-                        baked_directory,
-                        config_path,
-                        lut_resolution_3d,
-                        lut_resolution_shaper=1024,
-                        prefix=False):
+def create_baked_LUT_processes(odt_info,
+                               shaper_name,
+                               baked_directory,
+                               config_path,
+                               lut_resolution_3d,
+                               lut_resolution_shaper=1024,
+                               prefix=False):
     """
-    Generate baked representations of the transforms from the *ACES* *OCIO*
-    configuration
+    Creates the processes baking representations of the transforms from the
+    *ACES* *OCIO* configuration, without executing them
 
     Parameters
     ----------
@@ -1161,11 +1355,15 @@ def generate_baked_LUTs(odt_info,
 
     Returns
     -------
-    None
+    list
+         The *ociobakelut* processes, the baked file being their last
+         argument
     """
 
     odt_info_C = dict(odt_info)
 
+    bake_luts = []
+
     # Older behavior for *ODTs* that have support for full and legal ranges,
     # generating a LUT for both ranges.
     """
@@ -1229,7 +1427,7 @@ def generate_baked_LUTs(odt_info,
             bake_lut = Process(description='bake a LUT',
                                cmd='ociobakelut',
                                args=args)
-            bake_lut.execute()
+            bake_luts.append(bake_lut)
 
         # *Flame*, *Lustre*
         for input_space in ['ACEScc', 'ACESproxy']:
@@ -1261,7 +1459,7 @@ def generate_baked_LUTs(odt_info,
             bake_lut = Process(description='bake a LUT',
                                cmd='ociobakelut',
                                args=(args + fargs))
-            bake_lut.execute()
+            bake_luts.append(bake_lut)
 
             largs = ['--format',
                      'lustre',
@@ -1272,7 +1470,7 @@ def generate_baked_LUTs(odt_info,
             bake_lut = Process(description='bake a LUT',
                                cmd='ociobakelut',
                                args=(args + largs))
-            bake_lut.execute()
+            bake_luts.append(bake_lut)
 
         # *Maya*, *Houdini*
         for input_space in ['ACEScg', 'ACES2065-1']:
@@ -1307,7 +1505,7 @@ def generate_baked_LUTs(odt_info,
             bake_lut = Process(description='bake a LUT',
                                cmd='ociobakelut',
                                args=(args + margs))
-            bake_lut.execute()
+            bake_luts.append(bake_lut)
 
             hargs = ['--format',
                      'houdini',
@@ -1318,7 +1516,92 @@ def generate_baked_LUTs(odt_info,
             bake_lut = Process(description='bake a LUT',
                                cmd='ociobakelut',
                                args=(args + hargs))
-            bake_lut.execute()
+            bake_luts.append(bake_lut)
+
+    return bake_luts
+
+
+def generate_baked_LUTs(odt_info,
+                        shaper_name,
+                        baked_directory,
+                        config_path,
+                        lut_resolution_3d,
+                        lut_resolution_shaper=1024,
+                        prefix=False):
+    """
+    Generate baked representations of the transforms from the *ACES* *OCIO*
+    configuration
+
+    Parameters
+    ----------
+    odt_info : array of dicts of str or unicode
+        Descriptions of the *ACES* Output Transforms
+    shaper_name : str or unicode
+        The name of the Shaper function to use when generating LUTs. 
+        Options: Log2, DolbyPQ
+    baked_directory : str or unicode
+        The path to use when writing baked LUTs
+    config_path : str or unicode
+        The path to the *OCIO* configuration
+    lut_resolution_3d : int, optional
+        The resolution of generated 3D LUTs
+    lut_resolution_shaper : int, optional
+        The resolution of shaper used as part of some 3D LUTs
+    prefix : bool, optional
+        Whether or not colorspace names will use their Family names as prefixes
+        in the *OCIO* config
+
+    Returns
+    -------
+    None
+    """
+
+    # The bakes are independent from each other and are executed
+    # concurrently once all of them are defined.
+    bake_luts = create_baked_LUT_processes(odt_info,
+                                           shaper_name,
+                                           baked_directory,
+                                           config_path,
+                                           lut_resolution_3d,
+                                           lut_resolution_shaper,
+                                           prefix)
+
+    # The bakes only depend on the configuration and its *LUTs*, they are
+    # memoized so that unchanged bakes are restored from the cache.
+    bake_inputs = [config_path] + sorted(files_walker(
+        os.path.join(os.path.dirname(config_path), 'luts')))
+    for bake_lut in bake_luts:
+        bake_lut.memoize(inputs=bake_inputs, outputs=[bake_lut.args[-1]])
+
+    # The bakes that are up to date according to the active manifest are not
+    # executed again.
+    manifest = active_manifest()
+    bake_keys = {}
+    if manifest is not None:
+        input_digests = [file_digest(path) for path in bake_inputs]
+        for bake_lut in list(bake_luts):
+            key = bake_keys[id(bake_lut)] = FileCache.key(
+                'ociobakelut',
+                bake_lut.args,
+                input_digests)
+            if manifest.up_to_date(bake_lut.args[-1], key):
+                print('%s is up to date' % bake_lut.args[-1])
+                manifest.record(bake_lut.args[-1], key)
+                bake_luts.remove(bake_lut)
+
+    execute_all(bake_luts)
+
+    for bake_lut in bake_luts:
+        if bake_lut.status != 0:
+            continue
+
+        if manifest is not None:
+            manifest.record(bake_lut.args[-1], bake_keys[id(bake_lut)])
+
+        if not bake_lut.restored:
+            record_timing('bake',
+                          lut_resolution_3d ** 3,
+                          (bake_lut.end - bake_lut.start).total_seconds())
 
 
 def generate_config_directory(config_directory,
@@ -1371,11 +1654,19 @@ def generate_config(aces_ctl_directory,
                     copy_custom_luts=True,
                     cleanup=True,
                     prefix_colorspaces_with_family_names=True,
-                    shaper_base_name='Log2'):
+                    shaper_base_name='Log2',
+                    incremental=True,
+                    colorspace_builders=None,
+                    config_backend='ocio'):
     """
     Generates LUTs, matrices and configuration data and then creates the 
     *ACES* configuration.
 
+    The generated files are recorded in a manifest in the configuration
+    directory: when regenerating the configuration incrementally, the *LUTs*
+    and baked *LUTs* whose inputs did not change are not generated again and
+    the files that are not generated anymore are removed.
+
     Parameters
     ----------
     aces_ctl_directory : str or unicode
@@ -1404,6 +1695,15 @@ def generate_config(aces_ctl_directory,
     shaper_base_name : str or unicode
         The name of the Shaper function to use when generating LUTs. 
         Options: Log2, DolbyPQ
+    incremental : bool, optional
+        Whether to reuse the up to date files of the previous generation
+    colorspace_builders : array of str or unicode, optional
+        The names of the colorspaces builders creating the *Camera Input
+        Transforms* and general colorspaces, defaults to the package
+        builders
+    config_backend : str or unicode, optional
+        The name of the backend building and writing the configuration, see
+        *CONFIG_BACKENDS* attribute
 
     Returns
     -------
@@ -1421,6 +1721,71 @@ def generate_config(aces_ctl_directory,
     lut_directory = generate_config_directory(config_directory,
                                               bake_secondary_luts,
                                               custom_lut_dir)
+
+    # Files are recorded from the start of the second the generation started
+    # in, matching coarse modification times.
+    start = int(time.time())
+    with Manifest(config_directory, reuse=incremental) as manifest:
+        generate_config_files(aces_ctl_directory,
+                              config_directory,
+                              lut_directory,
+                              lut_resolution_1d,
+                              lut_resolution_3d,
+                              bake_secondary_luts,
+                              multiple_displays,
+                              look_info,
+                              custom_lut_dir,
+                              cleanup,
+                              prefix_colorspaces_with_family_names,
+                              shaper_base_name,
+                              colorspace_builders,
+                              config_backend)
+
+    manifest.record_directory(lut_directory, start)
+    for path in manifest.prune():
+        print('Removed stale %s' % path)
+    manifest.save()
+
+    cache = default_cache()
+    if cache is not None:
+        print('LUT cache statistics : %s' % cache.statistics())
+
+    save_timings()
+
+    return True
+
+
+def generate_config_files(aces_ctl_directory,
+                          config_directory,
+                          lut_directory,
+                          lut_resolution_1d,
+                          lut_resolution_3d,
+                          bake_secondary_luts,
+                          multiple_displays,
+                          look_info,
+                          custom_lut_dir,
+                          cleanup,
+                          prefix_colorspaces_with_family_names,
+                          shaper_base_name,
+                          colorspace_builders=None,
+                          config_backend='ocio'):
+    """
+    Generates the *LUTs*, the configuration and the baked *LUTs* in
+    existing configuration directories, the parameters are the ones of
+    *generate_config* definition.
+
+    Parameters
+    ----------
+    lut_directory : str or unicode
+        The directory that will hold the generated LUTs
+    custom_lut_dir : str or unicode
+        The directory that will hold the copied custom look LUTs
+
+    Returns
+    -------
+    None
+    """
+
     odt_info = aces.get_ODTs_info(aces_ctl_directory)
     lmt_info = aces.get_LMTs_info(aces_ctl_directory)
 
@@ -1436,7 +1801,13 @@ def generate_config(aces_ctl_directory,
                                      lut_directory,
                                      lut_resolution_1d,
                                      lut_resolution_3d,
-                                     cleanup)
+                                     cleanup,
+                                     colorspace_builders)
+
+    # Every *LUT* has been generated, the shared identity images are not
+    # needed anymore unless the intermediate images are kept.
+    if cleanup:
+        IDENTITY_IMAGE_POOL.cleanup()
 
     print('Creating config - with prefixes, with aliases')
     config = create_config(config_data,
@@ -1444,7 +1815,8 @@ def generate_config(aces_ctl_directory,
                            aliases=True,
                            multiple_displays=multiple_displays,
                            look_info=look_info,
-                           custom_lut_dir=custom_lut_dir)
+                           custom_lut_dir=custom_lut_dir,
+                           backend=CONFIG_BACKENDS[config_backend])
     print('\n\n\n')
 
     write_config(config,
@@ -1459,7 +1831,103 @@ def generate_config(aces_ctl_directory,
                             lut_resolution_1d,
                             prefix=prefix_colorspaces_with_family_names)
 
-    return True
+
+def plan_config(aces_ctl_directory,
+                config_directory,
+                lut_resolution_1d=4096,
+                lut_resolution_3d=64,
+                bake_secondary_luts=True,
+                cleanup=True,
+                prefix_colorspaces_with_family_names=True,
+                shaper_base_name='Log2',
+                colorspace_builders=None):
+    """
+    Plans the generation of the *ACES* configuration without executing it:
+    the configuration data is created with the *LUT* generation functions
+    recording their jobs instead of executing them, the in-process *LUTs*
+    being written in a temporary directory.
+
+    Parameters
+    ----------
+    aces_ctl_directory : str or unicode
+        The path to the aces 'transforms/ctl/utilities'
+    config_directory : str or unicode
+        The directory that would hold the generated configuration and LUTs
+    lut_resolution_1d : int, optional
+        The resolution of generated 1D LUTs
+    lut_resolution_3d : int, optional
+        The resolution of generated 3D LUTs
+    bake_secondary_luts : bool, optional
+        Whether or not baked LUTs would be generated
+    cleanup : bool, optional
+        Whether or not the intermediate images would be cleaned up
+    prefix_colorspaces_with_family_names : bool, optional
+        Whether or not colorspace names will use their Family names as prefixes
+        in the *OCIO* config
+    shaper_base_name : str or unicode
+        The name of the Shaper function to use when generating LUTs. 
+        Options: Log2, DolbyPQ
+    colorspace_builders : array of str or unicode, optional
+        The names of the colorspaces builders creating the *Camera Input
+        Transforms* and general colorspaces, defaults to the package
+        builders
+
+    Returns
+    -------
+    Plan
+         The configuration generation plan.
+    """
+
+    odt_info = aces.get_ODTs_info(aces_ctl_directory)
+    lmt_info = aces.get_LMTs_info(aces_ctl_directory)
+
+    if shaper_base_name == 'DolbyPQ':
+        shaper_name = 'Dolby PQ 48 nits Shaper'
+    else:
+        shaper_name = 'Log2 48 nits Shaper'
+
+    # The colorspaces builders are executed by a pool of *default_concurrency*
+    # workers, see *ColorSpaceBuilderPool*.
+    plan = Plan(cleanup, default_concurrency())
+    lut_directory = tempfile.mkdtemp(prefix='aces_ocio_plan_')
+    try:
+        with plan:
+            create_config_data(odt_info,
+                               lmt_info,
+                               shaper_name,
+                               aces_ctl_directory,
+                               lut_directory,
+                               lut_resolution_1d,
+                               lut_resolution_3d,
+                               cleanup,
+                               colorspace_builders)
+
+        luts = [plan.add('write', os.path.basename(path))
+                for path in sorted(files_walker(lut_directory))]
+    finally:
+        shutil.rmtree(lut_directory)
+
+    config = plan.add('config',
+                      'config.ocio',
+                      dependencies=[identifier
+                                    for identifier, job in plan.jobs.items()
+                                    if job['stage'] == 'extract'] + luts)
+
+    if bake_secondary_luts:
+        for bake_lut in create_baked_LUT_processes(
+                odt_info,
+                shaper_name,
+                os.path.join(config_directory, 'baked'),
+                os.path.join(config_directory, 'config.ocio'),
+                lut_resolution_3d,
+                lut_resolution_1d,
+                prefix=prefix_colorspaces_with_family_names):
+            plan.add('bake',
+                     os.path.relpath(bake_lut.args[-1], config_directory),
+                     lut_resolution_3d ** 3,
+                     dependencies=[config])
+
+    return plan
 
 
 def main():
@@ -1538,6 +2006,13 @@ def main():
               '--lutResolution1d 1024 --lutResolution3d 33 -c aces_1.0.0 '
               '--shaper DolbyPQ')
     usage += '\n'
+    usage += '\n'
+    usage += ('Print the jobs, intermediate disk usage and estimated runtime '
+              'of a config generation without executing it: \n')
+    usage += ('\tcreate_aces_config -a /path/to/aces-dev/transforms/ctl '
+              '--lutResolution1d 4096 --lutResolution3d 64 -c aces_1.0.0 '
+              '--plan')
+    usage += '\n'
  
     look_info = []
 
@@ -1580,6 +2055,18 @@ def main():
     p.add_option('--copyCustomLUTs', action='store_true', default=False)
 
     p.add_option('--shaper', '-s', default='Log2')
+    p.add_option('--plan', action='store_true', default=False)
+    p.add_option('--fullRebuild', action='store_true', default=False)
+    p.add_option('--colorspaceBuilders', default=None,
+                 help='Comma separated names of the colorspaces builders '
+                      'creating the Camera Input Transforms and general '
+                      'colorspaces, e.g. "arri,general", defaults to the '
+                      'package builders : %s' % ','.join(COLORSPACE_BUILDERS))
+    p.add_option('--configBackend', type='choice',
+                 choices=list(CONFIG_BACKENDS), default='ocio',
+                 help='Backend building and writing the configuration : %s, '
+                      '"yaml" doesn\'t need the OCIO Python bindings' %
+                      ', '.join(CONFIG_BACKENDS))
 
     options, arguments = p.parse_args()
 
@@ -1593,6 +2080,11 @@ def main():
     copy_custom_luts = options.copyCustomLUTs
     shaper_base_name = options.shaper
     prefix = True
+    colorspace_builders = None
+    if options.colorspaceBuilders is not None:
+        colorspace_builders = [
+            name.strip() for name in options.colorspaceBuilders.split(',')
+            if name.strip()]
 
     print(look_info)
 
@@ -1608,6 +2100,18 @@ def main():
         'directory specified'.format(
             ACES_OCIO_CONFIGURATION_DIRECTORY_ENVIRON))
 
+    if options.plan:
+        plan_config(aces_ctl_directory,
+                    config_directory,
+                    lut_resolution_1d,
+                    lut_resolution_3d,
+                    bake_secondary_luts,
+                    cleanup_temp_images,
+                    prefix,
+                    shaper_base_name,
+                    colorspace_builders).report()
+        return True
+
     return generate_config(aces_ctl_directory,
                            config_directory,
                            lut_resolution_1d,
@@ -1618,7 +2122,10 @@ def main():
                            copy_custom_luts,
                            cleanup_temp_images,
                            prefix,
-                           shaper_base_name)
+                           shaper_base_name,
+                           not options.fullRebuild,
+                           colorspace_builders,
+                           options.configBackend)
 
 
 if __name__ == '__main__':
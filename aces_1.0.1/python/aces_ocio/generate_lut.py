@@ -8,12 +8,26 @@ formats.
 
 from __future__ import division
 
-import array
+import atexit
+import hashlib
+import itertools
 import os
-
-import OpenImageIO as oiio
-
-from aces_ocio.process import Process
+import re
+import shutil
+import tempfile
+import threading
+
+from aces_ocio.cache import (
+    FileCache,
+    active_manifest,
+    default_cache,
+    file_digest)
+from aces_ocio.plan import active_plan, timed
+from aces_ocio.process import Process, admission_controller
+from aces_ocio.utilities import LazyModule
+
+numpy = LazyModule('numpy')
+oiio = LazyModule('OpenImageIO')
 
 __author__ = 'ACES Developers'
 __copyright__ = 'Copyright (C) 2014 - 2015 - ACES Developers'
@@ -22,21 +36,242 @@ __maintainer__ = 'ACES Developers'
 __email__ = 'aces@oscars.org'
 __status__ = 'Production'
 
-__all__ = ['generate_1d_LUT_image',
+__all__ = ['ACES_OCIO_TEMPORARY_DIRECTORY_ENVIRON',
+           'BIT_DEPTHS',
+           'LUT_3D_MEMORY_PER_POINT',
+           'LUT_3D_TEXT_BYTES_PER_POINT',
+           'LUT_3D_FORMATS_CUBE_SIZES',
+           'image_pixel_bytes',
+           'quantize_image_data',
+           'read_image_data',
+           'write_image_data',
+           'write_rows',
+           'generate_1d_LUT_image',
+           'format_1d_rows',
            'write_SPI_1d',
            'write_CSP_1d',
            'write_CTL_1d',
            'write_1d',
            'generate_1d_LUT_from_image',
+           'generate_3d_identity_lattice',
            'generate_3d_LUT_image',
+           'lattice_from_image_data',
+           'resample_3d_lattice',
+           'write_SPI_3d',
+           'write_CSP_3d',
+           'write_3DL_3d',
+           'write_3d',
            'generate_3d_LUT_from_image',
+           'CTL_module_path',
+           'CTL_digest',
+           'create_workspace',
            'apply_CTL_to_image',
            'convert_bit_depth',
+           'retrieve_LUT',
+           'store_LUT',
+           'generate_1d_LUT_cache_key',
            'generate_1d_LUT_from_CTL',
+           'correct_LUT_image_data',
            'correct_LUT_image',
+           'IdentityImagePool',
+           'IDENTITY_IMAGE_POOL',
+           'estimate_3d_LUT_footprint',
            'generate_3d_LUT_from_CTL',
            'main']
 
+ACES_OCIO_TEMPORARY_DIRECTORY_ENVIRON = 'ACES_OCIO_TEMPORARY_DIRECTORY'
+
+# Supported image bit depths, mapping to the *OpenImageIO* type name, the
+# *NumPy* type name used in memory and the bits per sample stored in the
+# file. uint10 and uint12 are held as uint16 in memory, as *OpenImageIO* does.
+BIT_DEPTHS = {'uint8': ('UINT8', 'uint8', 8),
+              'sint8': ('INT8', 'int8', 8),
+              'uint10': ('UINT16', 'uint16', 10),
+              'uint12': ('UINT16', 'uint16', 12),
+              'uint16': ('UINT16', 'uint16', 16),
+              'sint16': ('INT16', 'int16', 16),
+              'half': ('HALF', 'float16', 16),
+              'float': ('FLOAT', 'float32', 32),
+              'double': ('DOUBLE', 'float64', 64)}
+
+# Bytes of memory used per lattice point by the most demanding stage of a 3D
+# LUT generation, the extraction: the transformed *RGBA* float image and the
+# double precision *spi3d* table.
+LUT_3D_MEMORY_PER_POINT = 4 * 4 + 6 * 8
+
+# Approximate size of a 3D LUT text entry, e.g. a *spi3d* line.
+LUT_3D_TEXT_BYTES_PER_POINT = 48
+
+# Cube sizes of the 3D LUTs formats written natively, matching the
+# *ociobakelut* command defaults.
+LUT_3D_FORMATS_CUBE_SIZES = {'cinespace': 32,
+                             'flame': 17,
+                             'lustre': 33}
+
+
+def image_pixel_bytes(depth, channels=3):
+    """
+    Returns the size in bytes of a pixel of the intermediate images with
+    given bit depth, *half* images being written as *float* images.
+
+    Parameters
+    ----------
+    depth : str or unicode
+        The bit depth, see *BIT_DEPTHS*
+    channels : int, optional
+        The number of channels of the image
+
+    Returns
+    -------
+    int
+        The pixel size in bytes
+    """
+
+    if depth == 'half':
+        depth = 'float'
+
+    return numpy.dtype(BIT_DEPTHS[depth][1]).itemsize * channels
+
+
+def quantize_image_data(data, depth):
+    """
+    Quantizes given image data to given bit depth using *OpenImageIO*
+    conversion semantics: float values are scaled by the maximum value of the
+    integer type, rounded half away from zero and clamped to the type range.
+
+    Parameters
+    ----------
+    data : ndarray
+        The image data
+    depth : str or unicode
+        The bit depth to quantize to, see *BIT_DEPTHS*
+
+    Returns
+    -------
+    ndarray
+        The quantized image data
+    """
+
+    type = numpy.dtype(BIT_DEPTHS[depth][1])
+
+    data = numpy.asarray(data, dtype=numpy.float32)
+    if numpy.issubdtype(type, numpy.floating):
+        return data.astype(type)
+
+    limits = numpy.iinfo(type)
+
+    # *OpenImageIO* converts in single precision and truncates the rounded
+    # value on the final cast.
+    scaled = data * numpy.float32(limits.max)
+    scaled += numpy.where(scaled < 0,
+                          numpy.float32(-0.5),
+                          numpy.float32(0.5))
+    numpy.clip(scaled, limits.min, limits.max, out=scaled)
+
+    return scaled.astype(type)
+
+
+def read_image_data(image_path):
+    """
+    Reads the image at given path into an array using *OpenImageIO*.
+
+    Parameters
+    ----------
+    image_path : str or unicode
+        The path of the image to be read
+
+    Returns
+    -------
+    ndarray
+        The image data with shape (height, width, channels) as single
+        precision float
+    """
+
+    image = oiio.ImageInput.open(image_path)
+
+    spec = image.spec()
+
+    # Forcibly read data as float, the Python API doesn't handle half-float
+    # well yet.
+    type = oiio.FLOAT
+    data = numpy.frombuffer(image.read_image(type), dtype=numpy.float32)
+
+    image.close()
+
+    return data.reshape(spec.height, spec.width, spec.nchannels)
+
+
+def write_image_data(image_path, data, depth='float'):
+    """
+    Writes given image data to given path using *OpenImageIO*.
+
+    Parameters
+    ----------
+    image_path : str or unicode
+        The path of the image to be written
+    data : ndarray
+        The image data with shape (height, width, channels), float data is
+        quantized to given bit depth, integer data is written as is
+    depth : str or unicode, optional
+        The bit depth of the written image, see *BIT_DEPTHS*
+
+    Returns
+    -------
+    None
+    """
+
+    type_name, type, bits_per_sample = BIT_DEPTHS[depth]
+
+    if numpy.asarray(data).dtype != type:
+        data = quantize_image_data(data, depth)
+    data = numpy.ascontiguousarray(data)
+    height, width, channels = data.shape
+
+    image = oiio.ImageOutput.create(image_path)
+
+    spec = oiio.ImageSpec()
+    spec.set_format(getattr(oiio, type_name))
+    if bits_per_sample != 8 * data.dtype.itemsize:
+        # The writer reduces the uint16 data to the requested bits.
+        spec.attribute('oiio:BitsPerSample', bits_per_sample)
+    spec.width = width
+    spec.height = height
+    spec.nchannels = channels
+
+    image.open(image_path, spec, oiio.Create)
+
+    # The contiguous buffer is handed as is to *OpenImageIO*.
+    image.write_image(spec.format, data)
+    image.close()
+
+
+def write_rows(fp, row_format, rows, chunk_size=32768):
+    """
+    Writes given rows to given file handle, formatting whole chunks of rows
+    with a single string formatting operation and a single write call.
+
+    Parameters
+    ----------
+    fp : file
+        The file handle to write into
+    row_format : str or unicode
+        The format of a single row, including its line ending
+    rows : array_like
+        The rows to write as a 2D array
+    chunk_size : int, optional
+        The number of rows formatted at once, bounding the size of the
+        intermediate strings
+
+    Returns
+    -------
+    None
+    """
+
+    rows = numpy.asarray(rows)
+    for i in range(0, len(rows), chunk_size):
+        chunk = rows[i:i + chunk_size]
+        fp.write((row_format * len(chunk)) % tuple(chunk.ravel().tolist()))
+
 
 def generate_1d_LUT_image(ramp_1d_path,
                           resolution=1024,
@@ -49,7 +284,8 @@ def generate_1d_LUT_image(ramp_1d_path,
     Parameters
     ----------
     ramp_1d_path : str or unicode
-        The path of the 1D ramp image to be written
+        The path of the 1D ramp image to be written, if None, the ramp is
+        only kept in memory
     resolution : int, optional
         The resolution of the 1D ramp image to be written
     min_value : float, optional
@@ -59,31 +295,60 @@ def generate_1d_LUT_image(ramp_1d_path,
 
     Returns
     -------
-    None
+    ndarray
+        The 1D ramp image data with shape (1, resolution, 3) so that callers
+        can reuse it without reading the image back.
     """
 
-    ramp = oiio.ImageOutput.create(ramp_1d_path)
+    # The ramp values are computed in double precision exactly as the
+    # per-sample loop used to do, then broadcast to every channel of the
+    # single precision buffer in one pass.
+    values = (numpy.arange(resolution, dtype=numpy.float64) /
+              (resolution - 1) * (max_value - min_value) + min_value)
+    data = numpy.empty((1, resolution, 3), dtype=numpy.float32)
+    data[...] = values[:, numpy.newaxis]
 
-    spec = oiio.ImageSpec()
-    spec.set_format(oiio.FLOAT)
-    # spec.format.basetype = oiio.FLOAT
-    spec.width = resolution
-    spec.height = 1
-    spec.nchannels = 3
+    if ramp_1d_path is not None:
+        write_image_data(ramp_1d_path, data)
+
+    return data
 
-    ramp.open(ramp_1d_path, spec, oiio.Create)
 
-    data = array.array('f',
-                       '\0' * spec.width * spec.height * spec.nchannels * 4)
-    for i in range(resolution):
-        value = float(i) / (resolution - 1) * (
-            max_value - min_value) + min_value
-        data[i * spec.nchannels + 0] = value
-        data[i * spec.nchannels + 1] = value
-        data[i * spec.nchannels + 2] = value
+def format_1d_rows(row_format, data, entries, channels, indexes):
+    """
+    Formats the entries of a 1D LUT in a single operation, *row_format*
+    being applied to the given channels of every entry.
+
+    The values are passed as they are to the string formatting, thus the
+    output is the same as formatting the entries one by one.
+
+    Parameters
+    ----------
+    row_format : str or unicode
+        The format of a row, with one conversion specification per index
+    data : array of floats
+        The entries in the LUT
+    entries : int
+        The resolution of the LUT, i.e. number of entries in the data set
+    channels : int
+        The number of channels in the data
+    indexes : array of int
+        The indexes of the channels to format in each row
+
+    Returns
+    -------
+    str or unicode
+        The formatted rows
+    """
+
+    length = entries * channels
+    if list(indexes) == range(channels):
+        values = data[:length]
+    else:
+        values = itertools.chain.from_iterable(
+            zip(*[data[index:length:channels] for index in indexes]))
 
-    ramp.write_image(spec.format, data)
-    ramp.close()
+    return (row_format * entries) % tuple(values)
 
 
 def write_SPI_1d(filename,
@@ -131,11 +396,11 @@ def write_SPI_1d(filename,
         fp.write('Length %d\n' % entries)
         fp.write('Components %d\n' % components)
         fp.write('{\n')
-        for i in range(0, entries):
-            entry = ''
-            for j in range(0, components):
-                entry = '%s %s' % (entry, data[i * channels + j])
-            fp.write('        %s\n' % entry)
+        fp.write(format_1d_rows('        %s\n' % (' %s' * components),
+                                data,
+                                entries,
+                                channels,
+                                range(components)))
         fp.write('}\n')
 
 
@@ -198,17 +463,14 @@ def write_CSP_1d(filename,
 
         fp.write('%d\n' % entries)
         if components == 1:
-            for i in range(0, entries):
-                entry = ''
-                for j in range(3):
-                    entry = '%s %s' % (entry, data[i * channels])
-                fp.write('%s\n' % entry)
+            indexes = [0, 0, 0]
         else:
-            for i in range(entries):
-                entry = ''
-                for j in range(components):
-                    entry = '%s %s' % (entry, data[i * channels + j])
-                fp.write('%s\n' % entry)
+            indexes = range(components)
+        fp.write(format_1d_rows('%s\n' % (' %s' * len(indexes)),
+                                data,
+                                entries,
+                                channels,
+                                indexes))
         fp.write('\n')
 
 
@@ -257,23 +519,17 @@ def write_CTL_1d(filename,
         fp.write('\n')
 
         # Write LUT
+        lut = format_1d_rows('%s,\n', data, entries, channels, [0])
+        lut = '%s\n' % lut[:-2]
         if components == 1:
             fp.write('const float lut[] = {\n')
-            for i in range(0, entries):
-                fp.write('%s' % data[i * channels])
-                if i != (entries - 1):
-                    fp.write(',')
-                fp.write('\n')
+            fp.write(lut)
             fp.write('};\n')
             fp.write('\n')
         else:
             for j in range(components):
                 fp.write('const float lut%d[] = {\n' % j)
-                for i in range(0, entries):
-                    fp.write('%s' % data[i * channels])
-                    if i != (entries - 1):
-                        fp.write(',')
-                    fp.write('\n')
+                fp.write(lut)
                 fp.write('};\n')
                 fp.write('\n')
 
@@ -426,34 +682,335 @@ def generate_1d_LUT_from_image(ramp_1d_path,
              ramp_data, ramp_width, ramp_channels, channels, format)
 
 
+def generate_3d_identity_lattice(resolution=32):
+    """
+    Generates the identity lattice of a 3D LUT laid out the way *OCIO*'s
+    *ociolutimage* command does: the lattice is stored red fastest, one blue
+    slice per row, in an image of resolution * resolution by resolution
+    pixels.
+
+    Parameters
+    ----------
+    resolution : int, optional
+        The resolution of the 3D LUT
+
+    Returns
+    -------
+    ndarray
+        The lattice image data with shape
+        (resolution, resolution * resolution, 3)
+    """
+
+    # Matching *ociolutimage* single precision arithmetic so that the lattice
+    # is bit-identical to the one it generates.
+    values = (numpy.arange(resolution, dtype=numpy.float32) *
+              (numpy.float32(1) / numpy.float32(resolution - 1)))
+
+    lattice = numpy.empty((resolution, resolution, resolution, 3),
+                          dtype=numpy.float32)
+    lattice[..., 0] = values[numpy.newaxis, numpy.newaxis, :]
+    lattice[..., 1] = values[numpy.newaxis, :, numpy.newaxis]
+    lattice[..., 2] = values[:, numpy.newaxis, numpy.newaxis]
+
+    return lattice.reshape(resolution, resolution * resolution, 3)
+
+
 def generate_3d_LUT_image(ramp_3d_path, resolution=32):
     """
-    Generates a 3D LUT image covering the specified resolution
-    Relies on OCIO's ociolutimage command
+    Generates a 3D LUT image covering the specified resolution.
 
     Parameters
     ----------
     ramp_3d_path : str or unicode
-        The path of the 3D ramp image to be written
+        The path of the 3D ramp image to be written, if None, the lattice is
+        only kept in memory
     resolution : int, optional
         The resolution of the 3D ramp image to be written
 
+    Returns
+    -------
+    ndarray
+        The 3D ramp image data with shape
+        (resolution, resolution * resolution, 3)
+    """
+
+    data = generate_3d_identity_lattice(resolution)
+
+    if ramp_3d_path is not None:
+        write_image_data(ramp_3d_path, data)
+
+    return data
+
+
+def lattice_from_image_data(data, resolution):
+    """
+    Returns the 3D LUT lattice stored in given image data laid out the way
+    *OCIO*'s *ociolutimage* command does.
+
+    Parameters
+    ----------
+    data : ndarray
+        The image data with shape (height, width, channels)
+    resolution : int
+        The resolution of the 3D LUT represented in the image
+
+    Returns
+    -------
+    ndarray
+        The lattice with shape (resolution, resolution, resolution, 3) indexed
+        as [blue, green, red]
+    """
+
+    pixels = numpy.asarray(data, dtype=numpy.float32)
+    pixels = pixels.reshape(-1, pixels.shape[-1])
+
+    if len(pixels) < resolution ** 3:
+        raise ValueError(
+            'Image is not big enough to store a %d^3 3D LUT: %d pixels' % (
+                resolution, len(pixels)))
+
+    return pixels[:resolution ** 3, :3].reshape(
+        resolution, resolution, resolution, 3)
+
+
+def resample_3d_lattice(lattice, resolution, size):
+    """
+    Resamples given 3D LUT lattice to given size with trilinear
+    interpolation, the way *OCIO* applies a 3D LUT.
+
+    Parameters
+    ----------
+    lattice : ndarray
+        The lattice with shape (resolution, resolution, resolution, 3)
+        indexed as [blue, green, red]
+    resolution : int
+        The resolution of the lattice
+    size : int
+        The resolution of the resampled lattice
+
+    Returns
+    -------
+    ndarray
+        The lattice with shape (size, size, size, 3) indexed as
+        [blue, green, red]
+    """
+
+    if size == resolution:
+        return lattice
+
+    positions = numpy.linspace(0, resolution - 1, size)
+    lower = numpy.minimum(numpy.floor(positions).astype(numpy.int64),
+                          resolution - 2)
+    weights = positions - lower
+
+    # Trilinear interpolation is separable, the axes are interpolated one
+    # after another.
+    lattice = numpy.asarray(lattice, dtype=numpy.float64)
+    for axis in range(3):
+        shape = [1, 1, 1, 1]
+        shape[axis] = size
+        axis_weights = weights.reshape(shape)
+        lattice = (numpy.take(lattice, lower, axis) * (1 - axis_weights) +
+                   numpy.take(lattice, lower + 1, axis) * axis_weights)
+
+    return lattice
+
+
+def write_SPI_3d(filename, lattice, resolution):
+    """
+    Writes a 3D LUT in the Sony Pictures Imageworks .spi3d format, matching
+    the output of *OCIO*'s *ociolutimage* command.
+
+    Parameters
+    ----------
+    filename : str or unicode
+        The path of the 3D LUT to be written
+    lattice : ndarray
+        The lattice with shape (resolution, resolution, resolution, 3)
+        indexed as [blue, green, red]
+    resolution : int
+        The resolution of the 3D LUT
+
+    Returns
+    -------
+    None
+    """
+
+    # The *spi3d* entries are written with blue changing fastest, each entry
+    # preceded by its lattice indexes.
+    table = numpy.empty((resolution, resolution, resolution, 6))
+    table[..., 0:3] = numpy.indices(
+        (resolution, resolution, resolution)).transpose(1, 2, 3, 0)
+    table[..., 3:6] = numpy.transpose(lattice, (2, 1, 0, 3))
+
+    with open(filename, 'w') as fp:
+        fp.write('SPILUT 1.0\n')
+        fp.write('3 3\n')
+        fp.write('%d %d %d\n' % (resolution, resolution, resolution))
+        write_rows(fp, '%d %d %d %g %g %g\n', table.reshape(-1, 6))
+
+
+def write_CSP_3d(filename, lattice, resolution):
+    """
+    Writes a 3D LUT in the Rising Sun Research Cinespace .csp format.
+
+    Parameters
+    ----------
+    filename : str or unicode
+        The path of the 3D LUT to be written
+    lattice : ndarray
+        The lattice with shape (resolution, resolution, resolution, 3)
+        indexed as [blue, green, red]
+    resolution : int
+        The resolution of the 3D LUT
+
+    Returns
+    -------
+    None
+    """
+
+    with open(filename, 'w') as fp:
+        fp.write('CSPLUTV100\n')
+        fp.write('3D\n')
+        fp.write('\n')
+        fp.write('BEGIN METADATA\n')
+        fp.write('END METADATA\n')
+
+        fp.write('\n')
+
+        fp.write('2\n')
+        fp.write('0.0 1.0\n')
+        fp.write('0.0 1.0\n')
+        fp.write('2\n')
+        fp.write('0.0 1.0\n')
+        fp.write('0.0 1.0\n')
+        fp.write('2\n')
+        fp.write('0.0 1.0\n')
+        fp.write('0.0 1.0\n')
+
+        fp.write('\n')
+
+        # The *csp* entries are written with red changing fastest, i.e. in
+        # the lattice storage order.
+        fp.write('%d %d %d\n' % (resolution, resolution, resolution))
+        write_rows(fp, '%.6f %.6f %.6f\n', lattice.reshape(-1, 3))
+        fp.write('\n')
+
+
+def write_3DL_3d(filename, lattice, resolution, format='flame'):
+    """
+    Writes a 3D LUT in the Autodesk .3dl format, either the *Flame* or the
+    *Lustre* variant, with a 10 bit input and 12 bit output depth.
+
+    Parameters
+    ----------
+    filename : str or unicode
+        The path of the 3D LUT to be written
+    lattice : ndarray
+        The lattice with shape (resolution, resolution, resolution, 3)
+        indexed as [blue, green, red]
+    resolution : int
+        The resolution of the 3D LUT
+    format : str or unicode, optional
+        The variant to write, either 'flame' or 'lustre'
+
+    Returns
+    -------
+    None
+    """
+
+    input_max_value = 2 ** 10 - 1
+    output_max_value = 2 ** 12 - 1
+
+    mesh_bit_depth = 0
+    while 2 ** mesh_bit_depth < resolution - 1:
+        mesh_bit_depth += 1
+
+    if format == 'lustre' and 2 ** mesh_bit_depth + 1 != resolution:
+        raise ValueError(
+            'Lustre 3D LUTs resolution must be a power of 2 plus 1: %d' %
+            resolution)
+
+    # Values are rounded half away from zero as *OCIO* does.
+    shaper = numpy.floor(numpy.arange(resolution) / (resolution - 1) *
+                         input_max_value + 0.5).astype(numpy.int64)
+
+    # The *3dl* entries are written with blue changing fastest.
+    table = numpy.floor(numpy.clip(numpy.transpose(lattice, (2, 1, 0, 3)),
+                                   0, 1) * output_max_value + 0.5)
+
+    with open(filename, 'w') as fp:
+        if format == 'lustre':
+            fp.write('3DMESH\n')
+            fp.write('Mesh %d %d\n' % (mesh_bit_depth, 12))
+
+        fp.write('%s\n' % ' '.join(map(str, shaper.tolist())))
+        write_rows(fp, '%d %d %d\n', table.reshape(-1, 3))
+
+        if format == 'lustre':
+            fp.write('\n')
+            fp.write('LUT8\n')
+            fp.write('gamma 1.0\n')
+
+
+def write_3d(filename, lattice, resolution, format='spi3d'):
+    """
+    Writes a 3D LUT in the specified format.
+
+    Parameters
+    ----------
+    filename : str or unicode
+        The path of the 3D LUT to be written
+    lattice : ndarray
+        The lattice with shape (resolution, resolution, resolution, 3)
+        indexed as [blue, green, red]
+    resolution : int
+        The resolution of the 3D LUT
+    format : str or unicode, optional
+        The format of the the 3D LUT that will be written
+
     Returns
     -------
     None
     """
 
-    args = ['--generate',
-            '--cubesize',
-            str(resolution),
-            '--maxwidth',
-            str(resolution * resolution),
-            '--output',
-            ramp_3d_path]
-    lut_extract = Process(description='generate a 3d LUT image',
-                          cmd='ociolutimage',
-                          args=args)
-    lut_extract.execute()
+    ocio_formats_to_extensions = {'cinespace': 'csp',
+                                  'flame': '3dl',
+                                  'icc': 'icc',
+                                  'houdini': 'lut',
+                                  'lustre': '3dl'}
+
+    if format in ocio_formats_to_extensions:
+        if format in LUT_3D_FORMATS_CUBE_SIZES:
+            # The natively written formats are resampled to the cube size
+            # *ociobakelut* would have used.
+            size = LUT_3D_FORMATS_CUBE_SIZES[format]
+            lattice = resample_3d_lattice(lattice, resolution, size)
+            resolution = size
+
+        if ocio_formats_to_extensions[format] == 'csp':
+            write_CSP_3d(filename, lattice, resolution)
+        elif ocio_formats_to_extensions[format] == '3dl':
+            write_3DL_3d(filename, lattice, resolution, format)
+        else:
+            # Formats without a native writer are baked by *OCIO*'s
+            # *ociobakelut* command from an intermediate *spi3d* LUT.
+            filename_spi3d = '%s.%s' % (filename, 'spi3d')
+            write_SPI_3d(filename_spi3d, lattice, resolution)
+
+            args = ['--lut',
+                    filename_spi3d,
+                    '--format',
+                    format,
+                    filename]
+            lut_convert = Process(description='convert a 3d LUT',
+                                  cmd='ociobakelut',
+                                  args=args)
+            lut_convert.execute()
+
+            os.remove(filename_spi3d)
+    else:
+        write_SPI_3d(filename, lattice, resolution)
 
 
 def generate_3d_LUT_from_image(ramp_3d_path,
@@ -462,14 +1019,13 @@ def generate_3d_LUT_from_image(ramp_3d_path,
                                format='spi3d'):
     """
     Reads a 3D LUT image and writes a 3D LUT in the specified format.
-    Relies on OCIO's ociolutimage command
 
     Parameters
     ----------
-    ramp_3d_path : str or unicode
-        The path of the 3D ramp image to be read
+    ramp_3d_path : str or unicode or ndarray
+        The path of the 3D ramp image to be read or its image data
     output_path : str or unicode, optional
-        The path of the 1D LUT to be written
+        The path of the 3D LUT to be written
     resolution : int, optional
         The resolution of the 3D LUT represented in the image
     format : str or unicode, optional
@@ -480,59 +1036,120 @@ def generate_3d_LUT_from_image(ramp_3d_path,
     None
     """
 
+    if isinstance(ramp_3d_path, numpy.ndarray):
+        ramp_data = ramp_3d_path
+        assert output_path is not None, (
+            'An output path is required when passing the image data!')
+    else:
+        ramp_data = read_image_data(ramp_3d_path)
+
     if output_path is None:
         output_path = '%s.%s' % (ramp_3d_path, 'spi3d')
 
-    ocio_formats_to_extensions = {'cinespace': 'csp',
-                                  'flame': '3dl',
-                                  'icc': 'icc',
-                                  'houdini': 'lut',
-                                  'lustre': '3dl'}
+    write_3d(output_path,
+             lattice_from_image_data(ramp_data, resolution),
+             resolution,
+             format)
+
 
-    if format == 'spi3d' or not (format in ocio_formats_to_extensions):
-        # Extract a spi3d LUT
-        args = ['--extract',
-                '--cubesize',
-                str(resolution),
-                '--maxwidth',
-                str(resolution * resolution),
-                '--input',
-                ramp_3d_path,
-                '--output',
-                output_path]
-        lut_extract = Process(description='extract a 3d LUT',
-                              cmd='ociolutimage',
-                              args=args)
-        lut_extract.execute()
+def CTL_module_path(aces_ctl_directory):
+    """
+    Returns the *CTL* module path, i.e. the aces 'transforms/ctl/utilities'
+    directory, for given aces *CTL* directory.
 
+    Parameters
+    ----------
+    aces_ctl_directory : str or unicode
+        The path to the aces 'transforms/ctl' or 'transforms/ctl/utilities'
+        directory
+
+    Returns
+    -------
+    str or unicode
+        The *CTL* module path
+    """
+
+    if os.path.split(aces_ctl_directory)[1] != 'utilities':
+        return os.path.join(aces_ctl_directory, 'utilities')
     else:
-        output_path_spi3d = '%s.%s' % (output_path, 'spi3d')
-
-        # Extract a spi3d LUT
-        args = ['--extract',
-                '--cubesize',
-                str(resolution),
-                '--maxwidth',
-                str(resolution * resolution),
-                '--input',
-                ramp_3d_path,
-                '--output',
-                output_path_spi3d]
-        lut_extract = Process(description='extract a 3d LUT',
-                              cmd='ociolutimage',
-                              args=args)
-        lut_extract.execute()
-
-        # Convert to a different format
-        args = ['--lut',
-                output_path_spi3d,
-                '--format',
-                format,
-                output_path]
-        lut_convert = Process(description='convert a 3d LUT',
-                              cmd='ociobakelut',
-                              args=args)
-        lut_convert.execute()
+        return aces_ctl_directory
+
+
+def CTL_digest(ctl_paths, aces_ctl_directory=None):
+    """
+    Returns a digest of the content of given *CTL* files and of the modules
+    they import, recursively.
+
+    Parameters
+    ----------
+    ctl_paths : array of str or unicode
+        The CTL files to hash
+    aces_ctl_directory : str or unicode, optional
+        The path to the aces 'transforms/ctl/utilities'
+
+    Returns
+    -------
+    str
+        The hexadecimal digest
+    """
+
+    module_directories = []
+    if aces_ctl_directory is not None:
+        module_directories.append(CTL_module_path(aces_ctl_directory))
+
+    digest = hashlib.sha1()
+    hashed = set()
+
+    def hash_CTL(path, directories):
+        if path in hashed:
+            return
+        hashed.add(path)
+
+        digest.update('%s\n%s\n' % (os.path.basename(path),
+                                     file_digest(path)))
+
+        with open(path) as fp:
+            modules = re.findall(r'^\s*import\s+"([^"]+)"\s*;',
+                                 fp.read(),
+                                 re.MULTILINE)
+
+        for module in modules:
+            for directory in directories + [os.path.dirname(path)]:
+                module_path = os.path.join(directory, '%s.ctl' % module)
+                if os.path.isfile(module_path):
+                    hash_CTL(module_path, directories)
+                    break
+            else:
+                digest.update('%s\nmissing\n' % module)
+
+    for ctl_path in ctl_paths:
+        hash_CTL(ctl_path, module_directories)
+
+    return digest.hexdigest()
+
+
+def create_workspace(lut_path):
+    """
+    Creates a private temporary directory holding the intermediate images of
+    the job generating given LUT, so that concurrent jobs never collide.
+    The directory is created in the *ACES_OCIO_TEMPORARY_DIRECTORY*
+    environment variable directory if set, e.g. a tmpfs mount, or in the
+    system temporary directory otherwise.
+
+    Parameters
+    ----------
+    lut_path : str or unicode
+        The path of the LUT generated by the job
+
+    Returns
+    -------
+    str or unicode
+        The path to the workspace directory
+    """
+
+    return tempfile.mkdtemp(
+        prefix='%s.' % os.path.splitext(os.path.basename(lut_path))[0],
+        dir=os.environ.get(ACES_OCIO_TEMPORARY_DIRECTORY_ENVIRON))
 
 
 def apply_CTL_to_image(input_image,
@@ -584,17 +1201,14 @@ def apply_CTL_to_image(input_image,
         global_params = {}
 
     if len(ctl_paths) > 0:
-        ctlenv = os.environ
+        # The environment is copied so that concurrent jobs don't share it.
+        ctlenv = dict(os.environ)
 
         if "/usr/local/bin" not in ctlenv['PATH'].split(':'):
             ctlenv['PATH'] = "%s:/usr/local/bin" % ctlenv['PATH']
 
         if aces_ctl_directory is not None:
-            if os.path.split(aces_ctl_directory)[1] != 'utilities':
-                ctl_module_path = os.path.join(aces_ctl_directory, 'utilities')
-            else:
-                ctl_module_path = aces_ctl_directory
-            ctlenv['CTL_MODULE_PATH'] = ctl_module_path
+            ctlenv['CTL_MODULE_PATH'] = CTL_module_path(aces_ctl_directory)
 
         args = []
         for ctl in ctl_paths:
@@ -618,32 +1232,150 @@ def apply_CTL_to_image(input_image,
 def convert_bit_depth(input_image, output_image, depth):
     """
     Convert the input image to the specified bit depth and write a new image
-    Relies on the OIIO oiiotool command
+    The conversion is done in-process and matches the OIIO oiiotool command
+    rounding and clamping
 
     Parameters
     ----------
-    input_image : str or unicode
-        The path to the image to transform using the CTL files
+    input_image : str or unicode or ndarray
+        The path to the image to convert or the image data itself
     output_image : str or unicode
-        The path to write the result of the transforms
+        The path to write the result of the conversion
     depth : str or unicode
         The bit depth of the output image
         Data types include: uint8, sint8, uint10, uint12, uint16, sint16, half, float, double
 
+    Returns
+    -------
+    ndarray
+        The quantized image data
+    """
+
+    if isinstance(input_image, numpy.ndarray):
+        input_data = input_image
+    else:
+        input_data = read_image_data(input_image)
+
+    output_data = quantize_image_data(input_data, depth)
+
+    write_image_data(output_image, output_data, depth)
+
+    return output_data
+
+
+def retrieve_LUT(lut_path, key, cache=None):
+    """
+    Returns whether the LUT with given key does not need to be generated,
+    either because the active manifest reports it as up to date or because
+    it is retrieved from the cache. When planning, cached LUTs are added to
+    the active plan instead of being retrieved.
+
+    Parameters
+    ----------
+    lut_path : str or unicode
+        The path of the LUT
+    key : str
+        The key of the LUT inputs
+    cache : FileCache, optional
+        The cache to retrieve the LUT from
+
+    Returns
+    -------
+    bool
+        Whether the LUT does not need to be generated
+    """
+
+    plan = active_plan()
+    manifest = active_manifest()
+
+    if manifest is not None and manifest.up_to_date(lut_path, key):
+        manifest.record(lut_path, key)
+        print('%s is up to date' % lut_path)
+        return True
+
+    if cache is None:
+        return False
+
+    if plan is not None:
+        if key in cache:
+            plan.add_cached(lut_path)
+            return True
+        return False
+
+    if cache.get(key, [lut_path]):
+        print('Retrieved %s from the cache' % lut_path)
+        if manifest is not None:
+            manifest.record(lut_path, key)
+        return True
+
+    return False
+
+
+def store_LUT(lut_path, key, cache=None):
+    """
+    Stores the generated LUT with given key in the cache and records it in
+    the active manifest.
+
+    Parameters
+    ----------
+    lut_path : str or unicode
+        The path of the LUT
+    key : str
+        The key of the LUT inputs
+    cache : FileCache, optional
+        The cache to store the LUT into
+
     Returns
     -------
     None
     """
 
-    args = [input_image,
-            '-d',
-            depth,
-            '-o',
-            output_image]
-    convert = Process(description='convert image bit depth',
-                      cmd='oiiotool',
-                      args=args)
-    convert.execute()
+    if cache is not None:
+        cache.put(key, [lut_path])
+
+    manifest = active_manifest()
+    if manifest is not None:
+        manifest.record(lut_path, key)
+
+
+def generate_1d_LUT_cache_key(cache,
+                              ctl_paths,
+                              lut_resolution,
+                              identity_lut_bit_depth,
+                              input_scale,
+                              output_scale,
+                              global_params,
+                              aces_ctl_directory,
+                              min_value,
+                              max_value,
+                              channels,
+                              format):
+    """
+    Returns the cache key of a 1D LUT generated from CTL files, the
+    parameters are the ones of *generate_1d_LUT_from_CTL* definition.
+
+    Parameters
+    ----------
+    cache : FileCache
+        The cache to compute the key for, or the *FileCache* class itself
+
+    Returns
+    -------
+    str
+        The cache key
+    """
+
+    return cache.key('generate_1d_LUT_from_CTL',
+                     CTL_digest(ctl_paths, aces_ctl_directory),
+                     lut_resolution,
+                     identity_lut_bit_depth,
+                     input_scale,
+                     output_scale,
+                     global_params,
+                     min_value,
+                     max_value,
+                     channels,
+                     format)
 
 
 def generate_1d_LUT_from_CTL(lut_path,
@@ -658,7 +1390,8 @@ def generate_1d_LUT_from_CTL(lut_path,
                              min_value=0,
                              max_value=1,
                              channels=3,
-                             format='spi1d'):
+                             format='spi1d',
+                             cache=None):
     """
     Creates a 1D LUT from the specified CTL files by creating a 1D LUT image,
     applying the CTL files and then extracting and writing a LUT based on the
@@ -701,6 +1434,10 @@ def generate_1d_LUT_from_CTL(lut_path,
         The number of channels to use for the LUT. 1 or 3 are valid.
     format : str or unicode, optional
         The format to use when writing the LUT
+    cache : FileCache, optional
+        The cache to retrieve the LUT from or store it into, defaults to the
+        cache configured with the *ACES_OCIO_CACHE_DIRECTORY* environment
+        variable, if any
 
     Returns
     -------
@@ -710,43 +1447,127 @@ def generate_1d_LUT_from_CTL(lut_path,
     if global_params is None:
         global_params = {}
 
-    lut_path_base = os.path.splitext(lut_path)[0]
+    if cache is None:
+        cache = default_cache()
+
+    key = generate_1d_LUT_cache_key(FileCache,
+                                    ctl_paths,
+                                    lut_resolution,
+                                    identity_lut_bit_depth,
+                                    input_scale,
+                                    output_scale,
+                                    global_params,
+                                    aces_ctl_directory,
+                                    min_value,
+                                    max_value,
+                                    channels,
+                                    format)
+    if retrieve_LUT(lut_path, key, cache):
+        return
+
+    plan = active_plan()
+    if plan is not None:
+        plan.add_1d_LUTs([lut_path],
+                         [lut_resolution],
+                         identity_lut_bit_depth,
+                         image_pixel_bytes(identity_lut_bit_depth))
+        return
+
+    workspace = create_workspace(lut_path)
+    try:
+        lut_path_base = os.path.join(
+            workspace, os.path.splitext(os.path.basename(lut_path))[0])
+
+        if identity_lut_bit_depth not in ['half', 'float']:
+            identity_lut_image = '%s.%s.%s' % (lut_path_base,
+                                               'uint16',
+                                               'tiff')
+            with timed('convert', lut_resolution):
+                convert_bit_depth(generate_1d_LUT_image(None,
+                                                        lut_resolution,
+                                                        min_value,
+                                                        max_value),
+                                  identity_lut_image,
+                                  identity_lut_bit_depth)
+        else:
+            identity_lut_image = '%s.%s.%s' % (lut_path_base,
+                                               'float',
+                                               'tiff')
+            with timed('identity', lut_resolution):
+                generate_1d_LUT_image(identity_lut_image,
+                                      lut_resolution,
+                                      min_value,
+                                      max_value)
+
+        transformed_lut_image = '%s.%s.%s' % (lut_path_base,
+                                              'transformed',
+                                              'exr')
+        with timed('render', lut_resolution):
+            apply_CTL_to_image(identity_lut_image,
+                               transformed_lut_image,
+                               ctl_paths,
+                               input_scale,
+                               output_scale,
+                               global_params,
+                               aces_ctl_directory)
+
+        with timed('extract', lut_resolution):
+            generate_1d_LUT_from_image(transformed_lut_image,
+                                       lut_path,
+                                       min_value,
+                                       max_value,
+                                       channels,
+                                       format)
+
+        store_LUT(lut_path, key, cache)
+    finally:
+        if cleanup:
+            shutil.rmtree(workspace, ignore_errors=True)
+        else:
+            print('Intermediate images kept in %s' % workspace)
+
 
-    identity_lut_image_float = '%s.%s.%s' % (lut_path_base, 'float', 'tiff')
-    generate_1d_LUT_image(identity_lut_image_float,
-                          lut_resolution,
-                          min_value,
-                          max_value)
+def correct_LUT_image_data(transformed_lut_data, lut_resolution):
+    """
+    For some combinations of resolution and bit depth, ctlrender would generate
+    images with the right number of pixels but with the values for width and 
+    height transposed. This function returns the image data with corrected
+    dimensions. The function acts as a pass through if the problem is not
+    detected.
 
-    if identity_lut_bit_depth not in ['half', 'float']:
-        identity_lut_image = '%s.%s.%s' % (lut_path_base, 'uint16', 'tiff')
-        convert_bit_depth(identity_lut_image_float,
-                          identity_lut_image,
-                          identity_lut_bit_depth)
-    else:
-        identity_lut_image = identity_lut_image_float
-
-    transformed_lut_image = '%s.%s.%s' % (lut_path_base, 'transformed', 'exr')
-    apply_CTL_to_image(identity_lut_image,
-                       transformed_lut_image,
-                       ctl_paths,
-                       input_scale,
-                       output_scale,
-                       global_params,
-                       aces_ctl_directory)
-
-    generate_1d_LUT_from_image(transformed_lut_image,
-                               lut_path,
-                               min_value,
-                               max_value,
-                               channels,
-                               format)
-
-    if cleanup:
-        os.remove(identity_lut_image)
-        if identity_lut_image != identity_lut_image_float:
-            os.remove(identity_lut_image_float)
-        os.remove(transformed_lut_image)
+    Parameters
+    ----------
+    transformed_lut_data : ndarray
+        The data of an image generated by cltrender with shape
+        (height, width, channels)
+    lut_resolution : int
+        The resolution of the 3D LUT that should be contained in 
+        transformed_lut_data
+
+    Returns
+    -------
+    ndarray
+        The corrected image data, or the original, if no correction was
+        needed.
+    """
+
+    height, width, channels = transformed_lut_data.shape
+
+    if width != lut_resolution * lut_resolution or height != lut_resolution:
+        print(('Correcting image as resolution is off. '
+               'Found %d x %d. Expected %d x %d') % (
+                  width,
+                  height,
+                  lut_resolution * lut_resolution,
+                  lut_resolution))
+
+        # The pixels are stored in the expected order, only the width and
+        # height are swapped, thus reshaping the array is enough and doesn't
+        # copy the data.
+        transformed_lut_data = transformed_lut_data.reshape(
+            width, height, channels)
+
+    return transformed_lut_data
 
 
 def correct_LUT_image(transformed_lut_image,
@@ -776,62 +1597,153 @@ def correct_LUT_image(transformed_lut_image,
         needed.
     """
 
-    transformed = oiio.ImageInput.open(transformed_lut_image)
-
-    transformed_spec = transformed.spec()
-    width = transformed_spec.width
-    height = transformed_spec.height
-    channels = transformed_spec.nchannels
+    transformed_lut_data = read_image_data(transformed_lut_image)
+    corrected_lut_data = correct_LUT_image_data(transformed_lut_data,
+                                                lut_resolution)
 
-    if width != lut_resolution * lut_resolution or height != lut_resolution:
-        print(('Correcting image as resolution is off. '
-               'Found %d x %d. Expected %d x %d') % (
-                  width,
-                  height,
-                  lut_resolution * lut_resolution,
-                  lut_resolution))
+    if corrected_lut_data is not transformed_lut_data:
         print('Generating %s' % corrected_lut_image)
 
-        # Forcibly read data as float, the Python API doesn't handle half-float
-        # well yet.
-        type = oiio.FLOAT
-        source_data = transformed.read_image(type)
-
-        correct = oiio.ImageOutput.create(corrected_lut_image)
-
-        correct_spec = oiio.ImageSpec()
-        correct_spec.set_format(oiio.FLOAT)
-        correct_spec.width = height
-        correct_spec.height = width
-        correct_spec.nchannels = channels
-
-        correct.open(corrected_lut_image, correct_spec, oiio.Create)
-
-        dest_data = array.array('f',
-                                ('\0' * correct_spec.width *
-                                 correct_spec.height *
-                                 correct_spec.nchannels * 4))
-        for j in range(0, correct_spec.height):
-            for i in range(0, correct_spec.width):
-                for c in range(0, correct_spec.nchannels):
-                    dest_data[(correct_spec.nchannels *
-                               correct_spec.width * j +
-                               correct_spec.nchannels * i + c)] = (
-                        source_data[correct_spec.nchannels *
-                                    correct_spec.width * j +
-                                    correct_spec.nchannels * i + c])
-
-        correct.write_image(correct_spec.format, dest_data)
-        correct.close()
+        write_image_data(corrected_lut_image, corrected_lut_data)
     else:
         # shutil.copy(transformedLUTImage, correctedLUTImage)
         corrected_lut_image = transformed_lut_image
 
-    transformed.close()
-
     return corrected_lut_image
 
 
+class IdentityImagePool(object):
+    """
+    A pool of 3D LUT identity images, created once per resolution and bit
+    depth and shared read-only by every 3D LUT generated from CTL files. The
+    images are kept on cleanup once a 3D LUT was generated without cleaning
+    up its intermediate images.
+    """
+
+    def __init__(self):
+        """
+        Constructor for IdentityImagePool class
+
+        Parameters
+        ----------
+        None
+
+        Returns
+        -------
+        None
+        """
+
+        self.directory = None
+        self.images = {}
+        self.keep = False
+        self.lock = threading.Lock()
+
+    def get(self, resolution, bit_depth):
+        """
+        Returns the identity image with given resolution and bit depth,
+        creating it if needed.
+
+        Parameters
+        ----------
+        resolution : int
+            The resolution of the 3D LUT identity image
+        bit_depth : str or unicode
+            The bit depth of the 3D LUT identity image
+
+        Returns
+        -------
+        str or unicode
+            The path to the identity image
+        """
+
+        if bit_depth in ['half', 'float']:
+            bit_depth = 'float'
+
+        with self.lock:
+            image = self.images.get((resolution, bit_depth))
+            if image is not None:
+                return image
+
+            if self.directory is None:
+                self.directory = tempfile.mkdtemp(
+                    prefix='aces_ocio_identity_',
+                    dir=os.environ.get(ACES_OCIO_TEMPORARY_DIRECTORY_ENVIRON))
+
+            image = os.path.join(
+                self.directory, 'identity_%d.%s.%s' % (resolution,
+                                                       bit_depth,
+                                                       'tiff'))
+            with timed('identity', resolution ** 3):
+                if bit_depth != 'float':
+                    # The lattice is quantized in memory, no float image is
+                    # written for it.
+                    convert_bit_depth(generate_3d_LUT_image(None, resolution),
+                                      image,
+                                      bit_depth)
+                else:
+                    generate_3d_LUT_image(image, resolution)
+            self.images[(resolution, bit_depth)] = image
+
+            return image
+
+    def cleanup(self):
+        """
+        Removes the pool identity images, unless they are kept.
+
+        Parameters
+        ----------
+        None
+
+        Returns
+        -------
+        None
+        """
+
+        with self.lock:
+            if self.directory is not None:
+                if self.keep:
+                    print('Identity images kept in %s' % self.directory)
+                else:
+                    shutil.rmtree(self.directory, ignore_errors=True)
+
+            self.directory = None
+            self.images = {}
+
+
+IDENTITY_IMAGE_POOL = IdentityImagePool()
+atexit.register(IDENTITY_IMAGE_POOL.cleanup)
+
+
+def estimate_3d_LUT_footprint(resolution, bit_depth='half'):
+    """
+    Estimates the peak memory and temporary disk footprints of the
+    generation of a 3D LUT from CTL files.
+
+    Parameters
+    ----------
+    resolution : int
+        The resolution of the 3D LUT
+    bit_depth : str or unicode, optional
+        The bit depth of the identity image
+
+    Returns
+    -------
+    tuple
+        The memory and temporary disk footprints in bytes
+    """
+
+    points = resolution ** 3
+
+    memory = points * LUT_3D_MEMORY_PER_POINT
+    # The identity image, which may already be in the pool, the transformed
+    # *RGBA* float image and the written LUT.
+    disk = points * (image_pixel_bytes(bit_depth) +
+                     image_pixel_bytes('float', 4) +
+                     LUT_3D_TEXT_BYTES_PER_POINT)
+
+    return memory, disk
+
+
 def generate_3d_LUT_from_CTL(lut_path,
                              ctl_paths,
                              lut_resolution=64,
@@ -841,11 +1753,14 @@ def generate_3d_LUT_from_CTL(lut_path,
                              global_params=None,
                              cleanup=True,
                              aces_ctl_directory=None,
-                             format='spi3d'):
+                             format='spi3d',
+                             cache=None,
+                             admission=None):
     """
     Creates a 3D LUT from the specified CTL files by creating a 3D LUT image,
     applying the CTL files and then extracting and writing a LUT based on the
-    resulting image
+    resulting image. The generation waits until its estimated memory and
+    temporary disk footprints fit in the admission controller budgets
 
     Parameters
     ----------
@@ -878,6 +1793,13 @@ def generate_3d_LUT_from_CTL(lut_path,
         The path to the aces 'transforms/ctl/utilities'
     format : str or unicode, optional
         The format to use when writing the LUT
+    cache : FileCache, optional
+        The cache to retrieve the LUT from or store it into, defaults to the
+        cache configured with the *ACES_OCIO_CACHE_DIRECTORY* environment
+        variable, if any
+    admission : AdmissionController, optional
+        The admission controller limiting the concurrent generations,
+        defaults to the controller shared by the run
 
     Returns
     -------
@@ -887,50 +1809,75 @@ def generate_3d_LUT_from_CTL(lut_path,
     if global_params is None:
         global_params = {}
 
-    lut_path_base = os.path.splitext(lut_path)[0]
-
-    identity_lut_image_float = '%s.%s.%s' % (lut_path_base, 'float', 'tiff')
-    generate_3d_LUT_image(identity_lut_image_float, lut_resolution)
-
-    if identity_lut_bit_depth not in ['half', 'float']:
-        identity_lut_image = '%s.%s.%s' % (lut_path_base,
-                                           identity_lut_bit_depth,
-                                           'tiff')
-        convert_bit_depth(identity_lut_image_float,
-                          identity_lut_image,
-                          identity_lut_bit_depth)
-    else:
-        identity_lut_image = identity_lut_image_float
-
-    transformed_lut_image = '%s.%s.%s' % (lut_path_base, 'transformed', 'exr')
-    apply_CTL_to_image(identity_lut_image,
-                       transformed_lut_image,
-                       ctl_paths,
-                       input_scale,
-                       output_scale,
-                       global_params,
-                       aces_ctl_directory)
-
-    corrected_lut_image = '%s.%s.%s' % (lut_path_base, 'correct', 'exr')
-    corrected_lut_image = correct_LUT_image(transformed_lut_image,
-                                            corrected_lut_image,
-                                            lut_resolution)
-
-    generate_3d_LUT_from_image(corrected_lut_image,
-                               lut_path,
-                               lut_resolution,
-                               format)
-
-    if cleanup:
-        os.remove(identity_lut_image)
-        if identity_lut_image != identity_lut_image_float:
-            os.remove(identity_lut_image_float)
-        os.remove(transformed_lut_image)
-        if corrected_lut_image != transformed_lut_image:
-            os.remove(corrected_lut_image)
-        if format != 'spi3d':
-            lut_path_spi3d = '%s.%s' % (lut_path, 'spi3d')
-            os.remove(lut_path_spi3d)
+    if cache is None:
+        cache = default_cache()
+
+    if admission is None:
+        admission = admission_controller()
+
+    key = FileCache.key('generate_3d_LUT_from_CTL',
+                        CTL_digest(ctl_paths, aces_ctl_directory),
+                        lut_resolution,
+                        identity_lut_bit_depth,
+                        input_scale,
+                        output_scale,
+                        global_params,
+                        format)
+    if retrieve_LUT(lut_path, key, cache):
+        return
+
+    plan = active_plan()
+    if plan is not None:
+        plan.add_3d_LUT(lut_path,
+                        lut_resolution,
+                        identity_lut_bit_depth,
+                        image_pixel_bytes(identity_lut_bit_depth))
+        return
+
+    memory, disk = estimate_3d_LUT_footprint(lut_resolution,
+                                             identity_lut_bit_depth)
+    with admission.admit(memory, disk):
+        workspace = create_workspace(lut_path)
+        try:
+            lut_path_base = os.path.join(
+                workspace, os.path.splitext(os.path.basename(lut_path))[0])
+
+            # The identity image is shared with the other 3D LUTs of the run
+            # and is removed when the pool is cleaned up.
+            if not cleanup:
+                IDENTITY_IMAGE_POOL.keep = True
+            identity_lut_image = IDENTITY_IMAGE_POOL.get(
+                lut_resolution, identity_lut_bit_depth)
+
+            transformed_lut_image = '%s.%s.%s' % (lut_path_base,
+                                                  'transformed',
+                                                  'exr')
+            with timed('render', lut_resolution ** 3):
+                apply_CTL_to_image(identity_lut_image,
+                                   transformed_lut_image,
+                                   ctl_paths,
+                                   input_scale,
+                                   output_scale,
+                                   global_params,
+                                   aces_ctl_directory)
+
+            with timed('extract', lut_resolution ** 3):
+                # The corrected lattice is kept in memory and handed directly
+                # to the extraction stage.
+                corrected_lut_data = correct_LUT_image_data(
+                    read_image_data(transformed_lut_image), lut_resolution)
+
+                generate_3d_LUT_from_image(corrected_lut_data,
+                                           lut_path,
+                                           lut_resolution,
+                                           format)
+
+            store_LUT(lut_path, key, cache)
+        finally:
+            if cleanup:
+                shutil.rmtree(workspace, ignore_errors=True)
+            else:
+                print('Intermediate images kept in %s' % workspace)
 
 
 def main():
@@ -0,0 +1,1128 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Defines a pure *Python* *OCIO* configuration backend writing the *OCIO* v1
+*YAML* configuration files without *PyOpenColorIO*.
+
+The objects mirror the subset of the *PyOpenColorIO* *API* used by
+:func:`aces_ocio.generate_config.create_config`, thus their *camelCase*
+methods, so that the module can be given as the configuration backend. The
+configuration is streamed to the file and its output matches the output of
+the *OCIO* v1 serializer.
+"""
+
+from __future__ import division
+
+import struct
+
+try:
+    from StringIO import StringIO
+except ImportError:
+    from io import StringIO
+
+__author__ = 'ACES Developers'
+__copyright__ = 'Copyright (C) 2014 - 2015 - ACES Developers'
+__license__ = ''
+__maintainer__ = 'ACES Developers'
+__email__ = 'aces@oscars.org'
+__status__ = 'Production'
+
+__all__ = ['OCIO_PROFILE_VERSION',
+           'Constants',
+           'is_plain_scalar',
+           'format_string',
+           'format_float',
+           'Emitter',
+           'Transform',
+           'FileTransform',
+           'MatrixTransform',
+           'ExponentTransform',
+           'LogTransform',
+           'ColorSpaceTransform',
+           'LookTransform',
+           'GroupTransform',
+           'ColorSpace',
+           'Look',
+           'Config']
+
+# The *OCIO* configuration profile version written by the backend.
+OCIO_PROFILE_VERSION = 1
+
+
+class Constants(object):
+    """
+    Defines the *OCIO* v1 constants, their values are the ones exposed by
+    *PyOpenColorIO.Constants*, thus the colorspaces builders use them
+    whatever the configuration backend.
+    """
+
+    TRANSFORM_DIR_UNKNOWN = 'unknown'
+    TRANSFORM_DIR_FORWARD = 'forward'
+    TRANSFORM_DIR_INVERSE = 'inverse'
+
+    COLORSPACE_DIR_UNKNOWN = 'unknown'
+    COLORSPACE_DIR_TO_REFERENCE = 'to_reference'
+    COLORSPACE_DIR_FROM_REFERENCE = 'from_reference'
+
+    BIT_DEPTH_UNKNOWN = 'unknown'
+    BIT_DEPTH_UINT8 = '8ui'
+    BIT_DEPTH_UINT10 = '10ui'
+    BIT_DEPTH_UINT12 = '12ui'
+    BIT_DEPTH_UINT14 = '14ui'
+    BIT_DEPTH_UINT16 = '16ui'
+    BIT_DEPTH_UINT32 = '32ui'
+    BIT_DEPTH_F16 = '16f'
+    BIT_DEPTH_F32 = '32f'
+
+    ALLOCATION_UNKNOWN = 'unknown'
+    ALLOCATION_UNIFORM = 'uniform'
+    ALLOCATION_LG2 = 'lg2'
+
+    INTERP_UNKNOWN = 'unknown'
+    INTERP_NEAREST = 'nearest'
+    INTERP_LINEAR = 'linear'
+    INTERP_TETRAHEDRAL = 'tetrahedral'
+    INTERP_BEST = 'best'
+
+    ROLE_DEFAULT = 'default'
+    ROLE_REFERENCE = 'reference'
+    ROLE_DATA = 'data'
+    ROLE_COLOR_PICKING = 'color_picking'
+    ROLE_SCENE_LINEAR = 'scene_linear'
+    ROLE_COMPOSITING_LOG = 'compositing_log'
+    ROLE_COLOR_TIMING = 'color_timing'
+    ROLE_TEXTURE_PAINT = 'texture_paint'
+    ROLE_MATTE_PAINT = 'matte_paint'
+
+
+# The smallest positive normalized single precision float, the tolerance
+# *OCIO* compares the matrices and offsets with.
+_FLOAT32_MINIMUM = 1.17549435e-38
+
+
+def _is_blank_or_break(text, index):
+    """
+    Returns whether given text has a blank or a line break at given index,
+    mirroring the *yaml-cpp* expressions.
+    """
+
+    return (text[index:index + 1] in (u' ', u'\t', u'\n') or
+            text[index:index + 2] == u'\r\n')
+
+
+def _is_not_printable(character):
+    """
+    Returns whether given character can't be written in a plain scalar.
+    """
+
+    code_point = ord(character)
+
+    return (code_point < 0x09 or
+            code_point in (0x0A, 0x0B, 0x0C) or
+            0x0E <= code_point <= 0x1F or
+            0x7F <= code_point <= 0x84 or
+            0x86 <= code_point <= 0x9F or
+            code_point == 0xFEFF)
+
+
+def is_plain_scalar(text, flow=False):
+    """
+    Returns whether given text can be written as a plain scalar, following
+    the *yaml-cpp* 0.3 rules the *OCIO* v1 serializer is built with.
+
+    Parameters
+    ----------
+    text : unicode
+        The text to write
+    flow : bool, optional
+        Whether the text is written in a flow collection
+
+    Returns
+    -------
+    bool
+        Whether the text can be written without quotes
+    """
+
+    if not text or text.endswith(u' '):
+        return False
+
+    if _is_blank_or_break(text, 0):
+        return False
+
+    if flow:
+        if (text[0] in u'?,[]{}#&*!|>\'"%@`' or
+                (text[0] in u'-:' and text[1:2] in (u' ', u'\t'))):
+            return False
+    else:
+        if (text[0] in u',[]{}#&*!|>\'"%@`' or
+                (text[0] in u'-?:' and
+                 (len(text) == 1 or _is_blank_or_break(text, 1)))):
+            return False
+
+    for i, character in enumerate(text):
+        if character == u':':
+            following = text[i + 1:i + 2]
+            if not following or _is_blank_or_break(text, i + 1):
+                return False
+            if flow and following in u',]}':
+                return False
+
+        if flow and character in u',?[]{}':
+            return False
+
+        if _is_blank_or_break(text, i) and text[i + 1:i + 2] == u'#':
+            return False
+
+        if _is_not_printable(character):
+            return False
+
+    return True
+
+
+def _double_quoted(text):
+    """
+    Returns given text as a double quoted scalar.
+    """
+
+    characters = []
+    for character in text:
+        code_point = ord(character)
+        if character in u'"\\':
+            characters.append(u'\\%s' % character)
+        elif (code_point < 0x20 or
+              0x80 <= code_point <= 0xA0 or
+              code_point == 0xFEFF):
+            characters.append(u'\\x%02x' % code_point
+                              if code_point < 0xFF else
+                              u'\\u%04x' % code_point)
+        else:
+            characters.append(character)
+
+    return u'"%s"' % u''.join(characters)
+
+
+def format_string(value, flow=False):
+    """
+    Formats given string as a *YAML* scalar, quoting it when it can't be
+    written as a plain scalar.
+
+    Parameters
+    ----------
+    value : str or unicode
+        The string to format
+    flow : bool, optional
+        Whether the string is written in a flow collection
+
+    Returns
+    -------
+    str or unicode
+        The formatted string
+    """
+
+    encoded = isinstance(value, bytes)
+    text = value.decode('utf-8') if encoded else value
+
+    if is_plain_scalar(text, flow):
+        return value
+
+    text = _double_quoted(text)
+
+    return text.encode('utf-8') if encoded else text
+
+
+def _float32(value):
+    """
+    Returns given value rounded to single precision, *OCIO* storing its
+    parameters as floats.
+    """
+
+    return struct.unpack('f', struct.pack('f', value))[0]
+
+
+def format_float(value):
+    """
+    Formats given value as *OCIO* writes its single precision parameters.
+
+    Parameters
+    ----------
+    value : numeric
+        The value to format
+
+    Returns
+    -------
+    str
+        The formatted value
+    """
+
+    return '%g' % _float32(value)
+
+
+def _flow_sequence(values, formatter=format_float):
+    """
+    Formats given values as a flow sequence.
+    """
+
+    return '[%s]' % ', '.join([formatter(value) for value in values])
+
+
+def _flow_map(tag, items):
+    """
+    Formats given (key, formatted value) items as a tagged flow map.
+    """
+
+    return '!<%s> {%s}' % (tag, ', '.join(['%s: %s' % item
+                                           for item in items]))
+
+
+def _split_env_style(value):
+    """
+    Splits given comma, or colon, separated list as *OCIO* does.
+    """
+
+    value = value.strip()
+    if not value:
+        return []
+
+    separator = ',' if ',' in value else ':'
+
+    return [item.strip() for item in value.split(separator)]
+
+
+class Emitter(object):
+    """
+    Streams the lines of a block *YAML* document to a file object, the
+    *OCIO* serializer starting every line on write and inserting the blank
+    lines explicitly.
+    """
+
+    def __init__(self, fp):
+        """
+        Constructor for Emitter class
+
+        Parameters
+        ----------
+        fp : file
+            The file object to write to
+
+        Returns
+        -------
+        None
+        """
+
+        self.fp = fp
+        self.started = False
+
+    def line(self, indent, text):
+        """
+        Writes given text on a new line.
+
+        Parameters
+        ----------
+        indent : int
+            The line indentation
+        text : str or unicode
+            The line text
+
+        Returns
+        -------
+        None
+        """
+
+        if self.started:
+            self.fp.write('\n')
+        self.fp.write(' ' * indent)
+        self.fp.write(text)
+        self.started = True
+
+    def newline(self):
+        """
+        Ends the current line, the next line being preceded by a blank line.
+
+        Returns
+        -------
+        None
+        """
+
+        self.fp.write('\n')
+
+    def key(self, indent, key, value):
+        """
+        Writes given key and formatted value on a new line.
+
+        Parameters
+        ----------
+        indent : int
+            The line indentation
+        key : str or unicode
+            The key, formatted as a string
+        value : str or unicode
+            The formatted value
+
+        Returns
+        -------
+        None
+        """
+
+        self.line(indent, '%s: %s' % (format_string(key), value))
+
+    def literal(self, indent, key, text):
+        """
+        Writes given key and text as a literal block scalar.
+
+        Parameters
+        ----------
+        indent : int
+            The key indentation
+        key : str or unicode
+            The key
+        text : str or unicode
+            The text
+
+        Returns
+        -------
+        None
+        """
+
+        text_indent = '\n%s' % (' ' * (indent + 2))
+        self.line(indent, '%s: |%s%s' % (
+            key, text_indent, text.replace('\n', text_indent)))
+
+    def transform(self, indent, prefix, transform):
+        """
+        Writes given transform on a new line.
+
+        Parameters
+        ----------
+        indent : int
+            The line indentation
+        prefix : str or unicode
+            The text preceding the transform, e.g. a key or a sequence entry
+            indicator
+        transform : Transform
+            The transform
+
+        Returns
+        -------
+        None
+        """
+
+        if not isinstance(transform, GroupTransform):
+            self.line(indent, '%s%s' % (prefix, transform.flow()))
+            return
+
+        self.line(indent, '%s!<GroupTransform>' % prefix)
+        for item in transform.base_items():
+            self.key(indent + 2, *item)
+
+        if not transform.transforms:
+            self.key(indent + 2, 'children', '[]')
+            return
+
+        self.line(indent + 2, 'children:')
+        for child in transform.transforms:
+            self.transform(indent + 4, '- ', child)
+
+
+class Transform(object):
+    """
+    Defines the base class of the *OCIO* transforms.
+    """
+
+    tag = None
+
+    def __init__(self):
+        """
+        Constructor for Transform class
+
+        Returns
+        -------
+        None
+        """
+
+        self.direction = Constants.TRANSFORM_DIR_FORWARD
+
+    def getDirection(self):
+        return self.direction
+
+    def setDirection(self, direction):
+        self.direction = direction
+
+    def items(self):
+        """
+        Returns the transform (key, formatted value) items, its direction
+        excepted.
+
+        Returns
+        -------
+        list
+            The transform items
+        """
+
+        return []
+
+    def base_items(self):
+        """
+        Returns the (key, formatted value) items shared by all transforms.
+
+        Returns
+        -------
+        list
+            The transform direction item unless it is forward
+        """
+
+        if self.direction == Constants.TRANSFORM_DIR_FORWARD:
+            return []
+
+        return [('direction', format_string(self.direction, True))]
+
+    def flow(self):
+        """
+        Returns the transform formatted as a tagged flow map.
+
+        Returns
+        -------
+        str or unicode
+            The formatted transform
+        """
+
+        return _flow_map(self.tag, self.items() + self.base_items())
+
+
+class FileTransform(Transform):
+    """
+    Defines the *OCIO* file transform.
+    """
+
+    tag = 'FileTransform'
+
+    def __init__(self):
+        super(FileTransform, self).__init__()
+
+        self.src = ''
+        self.cccid = ''
+        self.interpolation = Constants.INTERP_UNKNOWN
+
+    def setSrc(self, src):
+        self.src = src
+
+    def setCCCId(self, cccid):
+        self.cccid = cccid
+
+    def setInterpolation(self, interpolation):
+        self.interpolation = interpolation
+
+    def items(self):
+        items = [('src', format_string(self.src, True))]
+        if self.cccid:
+            items.append(('cccid', format_string(self.cccid, True)))
+        items.append(('interpolation',
+                      format_string(self.interpolation, True)))
+
+        return items
+
+
+class MatrixTransform(Transform):
+    """
+    Defines the *OCIO* matrix transform.
+    """
+
+    tag = 'MatrixTransform'
+
+    def __init__(self):
+        super(MatrixTransform, self).__init__()
+
+        self.matrix = [1, 0, 0, 0,
+                       0, 1, 0, 0,
+                       0, 0, 1, 0,
+                       0, 0, 0, 1]
+        self.offset = [0, 0, 0, 0]
+
+    def setMatrix(self, matrix):
+        self.matrix = list(matrix)
+
+    def setOffset(self, offset):
+        self.offset = list(offset)
+
+    def items(self):
+        items = []
+        if any(abs(_float32(value) - (1 if i % 5 == 0 else 0)) >
+               _FLOAT32_MINIMUM for i, value in enumerate(self.matrix)):
+            items.append(('matrix', _flow_sequence(self.matrix)))
+        if any(abs(_float32(value)) > _FLOAT32_MINIMUM
+               for value in self.offset):
+            items.append(('offset', _flow_sequence(self.offset)))
+
+        return items
+
+
+class ExponentTransform(Transform):
+    """
+    Defines the *OCIO* exponent transform.
+    """
+
+    tag = 'ExponentTransform'
+
+    def __init__(self):
+        super(ExponentTransform, self).__init__()
+
+        self.value = [1, 1, 1, 1]
+
+    def setValue(self, value):
+        self.value = list(value)
+
+    def items(self):
+        return [('value', _flow_sequence(self.value))]
+
+
+class LogTransform(Transform):
+    """
+    Defines the *OCIO* log transform.
+    """
+
+    tag = 'LogTransform'
+
+    def __init__(self):
+        super(LogTransform, self).__init__()
+
+        self.base = 2
+
+    def setBase(self, base):
+        self.base = base
+
+    def items(self):
+        if _float32(self.base) == 2:
+            return []
+
+        return [('base', format_float(self.base))]
+
+
+class ColorSpaceTransform(Transform):
+    """
+    Defines the *OCIO* colorspace transform.
+    """
+
+    tag = 'ColorSpaceTransform'
+
+    def __init__(self):
+        super(ColorSpaceTransform, self).__init__()
+
+        self.src = ''
+        self.dst = ''
+
+    def setSrc(self, src):
+        self.src = src
+
+    def setDst(self, dst):
+        self.dst = dst
+
+    def items(self):
+        return [('src', format_string(self.src, True)),
+                ('dst', format_string(self.dst, True))]
+
+
+class LookTransform(ColorSpaceTransform):
+    """
+    Defines the *OCIO* look transform.
+    """
+
+    tag = 'LookTransform'
+
+    def __init__(self):
+        super(LookTransform, self).__init__()
+
+        self.looks = ''
+
+    def setLooks(self, looks):
+        self.looks = looks
+
+    def items(self):
+        return (super(LookTransform, self).items() +
+                [('looks', format_string(self.looks, True))])
+
+
+class GroupTransform(Transform):
+    """
+    Defines the *OCIO* group transform.
+    """
+
+    tag = 'GroupTransform'
+
+    def __init__(self):
+        super(GroupTransform, self).__init__()
+
+        self.transforms = []
+
+    def push_back(self, transform):
+        self.transforms.append(transform)
+
+
+class ColorSpace(object):
+    """
+    Defines the *OCIO* colorspace.
+    """
+
+    def __init__(self,
+                 name='',
+                 family='',
+                 equalityGroup='',
+                 description='',
+                 bitDepth=Constants.BIT_DEPTH_UNKNOWN,
+                 isData=False,
+                 allocation=Constants.ALLOCATION_UNIFORM,
+                 allocationVars=None):
+        """
+        Constructor for ColorSpace class
+
+        Parameters
+        ----------
+        name : str or unicode, optional
+            Name of the colorspace.
+        family : str or unicode, optional
+            Family of the colorspace.
+        equalityGroup : str or unicode, optional
+            Equality group of the colorspace.
+        description : str or unicode, optional
+            Description of the colorspace.
+        bitDepth : str, optional
+            Bit depth of the colorspace.
+        isData : bool, optional
+            Whether the colorspace holds data.
+        allocation : str, optional
+            Allocation of the colorspace.
+        allocationVars : array_like, optional
+            Allocation variables of the colorspace.
+
+        Returns
+        -------
+        None
+        """
+
+        self.name = name
+        self.family = family or ''
+        self.equality_group = equalityGroup or ''
+        self.description = description or ''
+        self.bit_depth = bitDepth
+        self.is_data = isData
+        self.allocation = allocation
+        self.allocation_vars = list(allocationVars or [])
+        self.transforms = {}
+
+    def getName(self):
+        return self.name
+
+    def setTransform(self, transform, direction):
+        self.transforms[direction] = transform
+
+    def getTransform(self, direction):
+        return self.transforms.get(direction)
+
+    def write(self, emitter, indent):
+        """
+        Writes the colorspace as a sequence entry.
+
+        Parameters
+        ----------
+        emitter : Emitter
+            The emitter to write to
+        indent : int
+            The sequence entry indentation
+
+        Returns
+        -------
+        None
+        """
+
+        emitter.line(indent, '- !<ColorSpace>')
+        indent += 2
+        emitter.key(indent, 'name', format_string(self.name))
+        emitter.key(indent, 'family', format_string(self.family))
+        emitter.key(indent, 'equalitygroup',
+                    format_string(self.equality_group))
+        emitter.key(indent, 'bitdepth', format_string(self.bit_depth))
+        if self.description:
+            emitter.literal(indent, 'description', self.description)
+        emitter.key(indent, 'isdata', 'true' if self.is_data else 'false')
+        emitter.key(indent, 'allocation', format_string(self.allocation))
+        if self.allocation_vars:
+            emitter.key(indent, 'allocationvars',
+                        _flow_sequence(self.allocation_vars))
+        for direction in (Constants.COLORSPACE_DIR_TO_REFERENCE,
+                          Constants.COLORSPACE_DIR_FROM_REFERENCE):
+            transform = self.transforms.get(direction)
+            if transform is not None:
+                emitter.transform(indent, '%s: ' % direction, transform)
+        emitter.newline()
+
+
+class Look(object):
+    """
+    Defines the *OCIO* look.
+    """
+
+    def __init__(self, name='', processSpace='', transform=None):
+        """
+        Constructor for Look class
+
+        Parameters
+        ----------
+        name : str or unicode, optional
+            Name of the look.
+        processSpace : str or unicode, optional
+            Colorspace the look is applied in.
+        transform : Transform, optional
+            Transform of the look.
+
+        Returns
+        -------
+        None
+        """
+
+        self.name = name
+        self.process_space = processSpace
+        self.transform = transform
+
+    def getName(self):
+        return self.name
+
+    def setName(self, name):
+        self.name = name
+
+    def setProcessSpace(self, process_space):
+        self.process_space = process_space
+
+    def setTransform(self, transform):
+        self.transform = transform
+
+    def write(self, emitter, indent):
+        """
+        Writes the look as a sequence entry.
+
+        Parameters
+        ----------
+        emitter : Emitter
+            The emitter to write to
+        indent : int
+            The sequence entry indentation
+
+        Returns
+        -------
+        None
+        """
+
+        emitter.line(indent, '- !<Look>')
+        indent += 2
+        emitter.key(indent, 'name', format_string(self.name))
+        emitter.key(indent, 'process_space',
+                    format_string(self.process_space))
+        if self.transform is not None:
+            emitter.transform(indent, 'transform: ', self.transform)
+        emitter.newline()
+
+
+class Config(object):
+    """
+    Defines the *OCIO* configuration.
+    """
+
+    def __init__(self):
+        """
+        Constructor for Config class
+
+        Returns
+        -------
+        None
+        """
+
+        self.description = ''
+        self.search_path = ''
+        self.strict_parsing = True
+        self.luma = [0.2126, 0.7152, 0.0722]
+        self.roles = {}
+        self.displays = {}
+        self.active_displays = []
+        self.active_views = []
+        self.looks = []
+        self.colorspaces = []
+
+    def setDescription(self, description):
+        self.description = description
+
+    def setSearchPath(self, search_path):
+        self.search_path = search_path
+
+    def setStrictParsingEnabled(self, strict_parsing):
+        self.strict_parsing = strict_parsing
+
+    def setDefaultLumaCoefs(self, luma):
+        self.luma = list(luma)
+
+    @staticmethod
+    def _index(items, name):
+        """
+        Returns the index of the item with given name, names being compared
+        case insensitively.
+        """
+
+        name = name.lower()
+        for i, item in enumerate(items):
+            if item.getName().lower() == name:
+                return i
+
+        return -1
+
+    def addColorSpace(self, colorspace):
+        """
+        Adds given colorspace, replacing the colorspace with the same name.
+
+        Parameters
+        ----------
+        colorspace : ColorSpace
+            The colorspace to add
+
+        Returns
+        -------
+        None
+        """
+
+        index = self._index(self.colorspaces, colorspace.name)
+        if index == -1:
+            self.colorspaces.append(colorspace)
+        else:
+            self.colorspaces[index] = colorspace
+
+    def getColorSpace(self, name):
+        """
+        Returns the colorspace with given name or role.
+
+        Parameters
+        ----------
+        name : str or unicode
+            The colorspace name or role
+
+        Returns
+        -------
+        ColorSpace
+            The colorspace or *None* if it doesn't exist
+        """
+
+        index = self._index(self.colorspaces, name)
+        if index == -1:
+            index = self._index(self.colorspaces,
+                                self.roles.get(name.lower(), ''))
+
+        return None if index == -1 else self.colorspaces[index]
+
+    def setRole(self, role, colorspace_name):
+        self.roles[role.lower()] = colorspace_name
+
+    def addLook(self, look):
+        """
+        Adds given look, replacing the look with the same name.
+
+        Parameters
+        ----------
+        look : Look
+            The look to add
+
+        Returns
+        -------
+        None
+        """
+
+        index = self._index(self.looks, look.name)
+        if index == -1:
+            self.looks.append(look)
+        else:
+            self.looks[index] = look
+
+    def addDisplay(self, display, view, colorspace_name, looks=''):
+        """
+        Adds given view to given display, replacing the view with the same
+        name, display and view names being compared case insensitively.
+
+        Parameters
+        ----------
+        display : str or unicode
+            The display name
+        view : str or unicode
+            The view name
+        colorspace_name : str or unicode
+            The view colorspace name
+        looks : str or unicode, optional
+            The view looks
+
+        Returns
+        -------
+        None
+        """
+
+        for name in self.displays:
+            if name.lower() == display.lower():
+                display = name
+                break
+
+        views = self.displays.setdefault(display, [])
+        for entry in views:
+            if entry[0].lower() == view.lower():
+                entry[1:] = [colorspace_name, looks]
+                break
+        else:
+            views.append([view, colorspace_name, looks])
+
+    def setActiveDisplays(self, displays):
+        self.active_displays = _split_env_style(displays)
+
+    def setActiveViews(self, views):
+        self.active_views = _split_env_style(views)
+
+    def sanityCheck(self):
+        """
+        Checks that the colorspaces, roles, displays and looks referenced by
+        the configuration exist.
+
+        Returns
+        -------
+        None
+
+        Raises
+        ------
+        ValueError
+            If the configuration is not valid.
+        """
+
+        def check(condition, message, *args):
+            if not condition:
+                raise ValueError(
+                    'Config failed sanitycheck. %s' % (message % args))
+
+        names = set()
+        for colorspace in self.colorspaces:
+            check(colorspace.name, 'A colorspace with an empty name is '
+                                   'defined.')
+            check(colorspace.name.lower() not in names,
+                  'Two colorspaces are defined with the same name, "%s".',
+                  colorspace.name)
+            names.add(colorspace.name.lower())
+
+        for role, name in sorted(self.roles.items()):
+            check(name.lower() in names,
+                  'The role "%s" refers to a colorspace, "%s", which is not '
+                  'defined.', role, name)
+
+        check(self.displays, 'At least one display must be defined.')
+
+        look_names = set(look.name.lower() for look in self.looks)
+        for display, views in sorted(self.displays.items()):
+            for view, name, looks in views:
+                check(self.getColorSpace(name) is not None,
+                      'Display "%s" has a view "%s" that refers to a '
+                      'colorspace, "%s", which is not defined.',
+                      display, view, name)
+                for look in _split_env_style(looks):
+                    check(look.lstrip('+-').lower() in look_names,
+                          'Display "%s" has a view "%s" that refers to a '
+                          'look, "%s", which is not defined.',
+                          display, view, look)
+
+        for look in self.looks:
+            check(self.getColorSpace(look.process_space) is not None,
+                  'The look "%s" refers to a process space, "%s", which is '
+                  'not defined.', look.name, look.process_space)
+
+        for colorspace in self.colorspaces:
+            transforms = list(colorspace.transforms.values())
+            while transforms:
+                transform = transforms.pop()
+                if isinstance(transform, GroupTransform):
+                    transforms.extend(transform.transforms)
+                elif isinstance(transform, ColorSpaceTransform):
+                    for name in (transform.src, transform.dst):
+                        check(self.getColorSpace(name) is not None,
+                              'The colorspace "%s" refers to a colorspace, '
+                              '"%s", which is not defined.',
+                              colorspace.name, name)
+
+    def write(self, fp):
+        """
+        Streams the configuration as *OCIO* v1 *YAML* to given file object.
+
+        Parameters
+        ----------
+        fp : file
+            The file object to write to
+
+        Returns
+        -------
+        None
+        """
+
+        emitter = Emitter(fp)
+
+        emitter.key(0, 'ocio_profile_version', str(OCIO_PROFILE_VERSION))
+        emitter.newline()
+        emitter.key(0, 'search_path', format_string(self.search_path))
+        emitter.key(0, 'strictparsing',
+                    'true' if self.strict_parsing else 'false')
+        emitter.key(0, 'luma', _flow_sequence(self.luma))
+
+        if self.description:
+            emitter.newline()
+            emitter.key(0, 'description', format_string(self.description))
+
+        emitter.newline()
+        if self.roles:
+            emitter.line(0, 'roles:')
+            for role, name in sorted(self.roles.items()):
+                emitter.key(2, role, format_string(name))
+        else:
+            emitter.key(0, 'roles', '{}')
+
+        emitter.newline()
+        if self.displays:
+            emitter.line(0, 'displays:')
+            for display, views in sorted(self.displays.items()):
+                emitter.line(2, '%s:' % format_string(display))
+                for view, name, looks in views:
+                    items = [('name', format_string(view, True)),
+                             ('colorspace', format_string(name, True))]
+                    if looks:
+                        items.append(('looks', format_string(looks, True)))
+                    emitter.line(4, '- %s' % _flow_map('View', items))
+        else:
+            emitter.key(0, 'displays', '{}')
+
+        emitter.newline()
+        emitter.key(0, 'active_displays', _flow_sequence(
+            self.active_displays, lambda x: format_string(x, True)))
+        emitter.key(0, 'active_views', _flow_sequence(
+            self.active_views, lambda x: format_string(x, True)))
+
+        if self.looks:
+            emitter.newline()
+            emitter.line(0, 'looks:')
+            for look in self.looks:
+                look.write(emitter, 2)
+
+        emitter.newline()
+        if self.colorspaces:
+            emitter.line(0, 'colorspaces:')
+            for colorspace in self.colorspaces:
+                colorspace.write(emitter, 2)
+        else:
+            emitter.key(0, 'colorspaces', '[]')
+
+    def serialize(self):
+        """
+        Returns the configuration as *OCIO* v1 *YAML*.
+
+        Returns
+        -------
+        str or unicode
+            The serialized configuration
+        """
+
+        fp = StringIO()
+        self.write(fp)
+
+        return fp.getvalue()
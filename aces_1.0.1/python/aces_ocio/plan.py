@@ -0,0 +1,542 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Defines objects to plan a configuration generation without executing it and
+to estimate its cost from the timings of previous runs.
+"""
+
+from __future__ import division
+
+import contextlib
+import json
+import os
+import threading
+import time
+from collections import OrderedDict
+
+from aces_ocio.process import default_concurrency
+
+__author__ = 'ACES Developers'
+__copyright__ = 'Copyright (C) 2014 - 2015 - ACES Developers'
+__license__ = ''
+__maintainer__ = 'ACES Developers'
+__email__ = 'aces@oscars.org'
+__status__ = 'Production'
+
+__all__ = ['ACES_OCIO_TIMINGS_ENVIRON',
+           'STAGES',
+           'DEFAULT_STAGE_RATES',
+           'record_timing',
+           'timed',
+           'pop_timings',
+           'load_timings',
+           'save_timings',
+           'format_size',
+           'Plan',
+           'active_plan']
+
+ACES_OCIO_TIMINGS_ENVIRON = 'ACES_OCIO_TIMINGS'
+
+# The stages of a configuration generation, in execution order.
+STAGES = ('identity',
+          'convert',
+          'render',
+          'extract',
+          'write',
+          'config',
+          'bake')
+
+# Seconds per pixel, or per lattice point for bakes, of every stage, used
+# when no timing history is available.
+DEFAULT_STAGE_RATES = {'identity': 2e-7,
+                       'convert': 1e-7,
+                       'render': 4e-6,
+                       'extract': 1e-6,
+                       'write': 0,
+                       'config': 0,
+                       'bake': 2e-5}
+
+_STAGE_TIMINGS = {}
+_STAGE_TIMINGS_LOCK = threading.Lock()
+
+
+def record_timing(stage, units, seconds):
+    """
+    Records the time taken by a stage to process given number of units.
+
+    Parameters
+    ----------
+    stage : str or unicode
+        The stage name, one of *STAGES*
+    units : int
+        The number of pixels or lattice points processed
+    seconds : float
+        The time taken by the stage
+
+    Returns
+    -------
+    None
+    """
+
+    with _STAGE_TIMINGS_LOCK:
+        timing = _STAGE_TIMINGS.setdefault(stage, {'seconds': 0, 'units': 0})
+        timing['seconds'] += seconds
+        timing['units'] += units
+
+
+@contextlib.contextmanager
+def timed(stage, units):
+    """
+    A context manager recording the time taken by its block with
+    *record_timing*.
+
+    Parameters
+    ----------
+    stage : str or unicode
+        The stage name, one of *STAGES*
+    units : int
+        The number of pixels or lattice points processed
+
+    Returns
+    -------
+    None
+    """
+
+    start = time.time()
+    yield
+    record_timing(stage, units, time.time() - start)
+
+
+def pop_timings():
+    """
+    Returns and forgets the timings recorded by the current run, e.g. to
+    merge the timings recorded by a worker process into the parent process
+    ones with *record_timing*.
+
+    Returns
+    -------
+    dict
+         The seconds and units of every stage.
+    """
+
+    with _STAGE_TIMINGS_LOCK:
+        timings = dict(_STAGE_TIMINGS)
+        _STAGE_TIMINGS.clear()
+
+    return timings
+
+
+def load_timings(path=None):
+    """
+    Loads the timing history.
+
+    Parameters
+    ----------
+    path : str or unicode, optional
+        The timing history file, defaults to the *ACES_OCIO_TIMINGS*
+        environment variable value
+
+    Returns
+    -------
+    dict
+         The seconds and units of every stage, empty if there is no history.
+    """
+
+    if path is None:
+        path = os.environ.get(ACES_OCIO_TIMINGS_ENVIRON)
+
+    if not path or not os.path.isfile(path):
+        return {}
+
+    with open(path) as fp:
+        return json.load(fp)['stages']
+
+
+def save_timings(path=None):
+    """
+    Merges the timings recorded by the current run into the timing history.
+
+    Parameters
+    ----------
+    path : str or unicode, optional
+        The timing history file, defaults to the *ACES_OCIO_TIMINGS*
+        environment variable value, nothing is saved if there is none
+
+    Returns
+    -------
+    None
+    """
+
+    if path is None:
+        path = os.environ.get(ACES_OCIO_TIMINGS_ENVIRON)
+
+    if not path:
+        return
+
+    timings = load_timings(path)
+    with _STAGE_TIMINGS_LOCK:
+        for stage, timing in _STAGE_TIMINGS.items():
+            history = timings.setdefault(stage, {'seconds': 0, 'units': 0})
+            history['seconds'] += timing['seconds']
+            history['units'] += timing['units']
+        _STAGE_TIMINGS.clear()
+
+    with open(path, 'w') as fp:
+        json.dump({'version': 1, 'stages': timings}, fp, indent=2,
+                  sort_keys=True)
+
+
+def format_size(size):
+    """
+    Formats given size in bytes for display.
+
+    Parameters
+    ----------
+    size : int
+        The size in bytes
+
+    Returns
+    -------
+    str
+         The formatted size.
+    """
+
+    for unit in ('B', 'KiB', 'MiB', 'GiB'):
+        if size < 1024:
+            return '%.1f %s' % (size, unit)
+        size /= 1024
+
+    return '%.1f TiB' % size
+
+
+_ACTIVE_PLAN = None
+
+
+class Plan(object):
+    """
+    A plan of the jobs a configuration generation would execute. While a plan
+    is active, i.e. used as a context manager, the *LUT* generation
+    functions add their jobs to it instead of executing them.
+    """
+
+    def __init__(self, cleanup=True, workers=1):
+        """
+        Constructor for Plan class
+
+        Parameters
+        ----------
+        cleanup : bool, optional
+            Whether the intermediate images would be cleaned up after every
+            *LUT*
+        workers : int, optional
+            The number of colorspaces builders executed concurrently, see
+            *aces_ocio.generate_config.ColorSpaceBuilderPool*
+
+        Returns
+        -------
+        None
+        """
+
+        self.cleanup = cleanup
+        self.workers = workers
+        self.jobs = OrderedDict()
+        self.identities = {}
+
+    def __enter__(self):
+        global _ACTIVE_PLAN
+        _ACTIVE_PLAN = self
+        return self
+
+    def __exit__(self, *args):
+        global _ACTIVE_PLAN
+        _ACTIVE_PLAN = None
+
+    def add(self,
+            stage,
+            description,
+            units=0,
+            disk=0,
+            dependencies=None,
+            cached=False):
+        """
+        Adds a job to the plan.
+
+        Parameters
+        ----------
+        stage : str or unicode
+            The job stage, one of *STAGES*
+        description : str or unicode
+            The job description
+        units : int, optional
+            The number of pixels or lattice points the job processes
+        disk : int, optional
+            The size in bytes of the intermediate files the job writes
+        dependencies : array of int, optional
+            The jobs that must be executed before the job
+        cached : bool, optional
+            Whether the job output would be retrieved from the cache
+
+        Returns
+        -------
+        int
+             The job identifier.
+        """
+
+        identifier = len(self.jobs)
+        self.jobs[identifier] = {'stage': stage,
+                                 'description': description,
+                                 'units': 0 if cached else units,
+                                 'disk': 0 if cached else disk,
+                                 'dependencies': list(dependencies or []),
+                                 'cached': cached}
+        return identifier
+
+    def add_1d_LUTs(self, lut_paths, resolutions, bit_depth, pixel_bytes):
+        """
+        Adds the jobs generating given 1D *LUTs* with a single render.
+
+        Parameters
+        ----------
+        lut_paths : array of str or unicode
+            The paths of the 1D *LUTs*
+        resolutions : array of int
+            The resolutions of the 1D *LUTs*
+        bit_depth : str or unicode
+            The bit depth of the identity image
+        pixel_bytes : int
+            The size in bytes of a pixel of the identity image
+
+        Returns
+        -------
+        list
+             The extraction jobs identifiers.
+        """
+
+        pixels = len(resolutions) * max(resolutions)
+        names = ', '.join(map(os.path.basename, lut_paths))
+
+        stage = 'identity' if bit_depth in ['half', 'float'] else 'convert'
+        identity = self.add(stage,
+                            '1D identity for %s' % names,
+                            pixels,
+                            pixels * pixel_bytes)
+        render = self.add('render',
+                          'ctlrender %s' % names,
+                          pixels,
+                          pixels * 3 * 4,
+                          [identity])
+
+        return [self.add('extract',
+                         os.path.basename(lut_path),
+                         resolution,
+                         dependencies=[render])
+                for lut_path, resolution in zip(lut_paths, resolutions)]
+
+    def add_3d_LUT(self, lut_path, resolution, bit_depth, pixel_bytes):
+        """
+        Adds the jobs generating given 3D *LUT*, the identity image being
+        shared by the 3D *LUTs* with the same resolution and bit depth.
+
+        Parameters
+        ----------
+        lut_path : str or unicode
+            The path of the 3D *LUT*
+        resolution : int
+            The resolution of the 3D *LUT*
+        bit_depth : str or unicode
+            The bit depth of the identity image
+        pixel_bytes : int
+            The size in bytes of a pixel of the identity image
+
+        Returns
+        -------
+        int
+             The extraction job identifier.
+        """
+
+        pixels = resolution ** 3
+
+        identity = self.identities.get((resolution, pixel_bytes))
+        if identity is None:
+            identity = self.identities[(resolution, pixel_bytes)] = self.add(
+                'identity',
+                '%d^3 %s identity' % (resolution, bit_depth),
+                pixels,
+                pixels * pixel_bytes)
+
+        render = self.add('render',
+                          'ctlrender %s' % os.path.basename(lut_path),
+                          pixels,
+                          pixels * 3 * 4,
+                          [identity])
+
+        return self.add('extract',
+                        os.path.basename(lut_path),
+                        pixels,
+                        dependencies=[render])
+
+    def add_cached(self, lut_path):
+        """
+        Adds a *LUT* that would be retrieved from the cache.
+
+        Parameters
+        ----------
+        lut_path : str or unicode
+            The path of the *LUT*
+
+        Returns
+        -------
+        int
+             The job identifier.
+        """
+
+        return self.add('extract', os.path.basename(lut_path), cached=True)
+
+    def stage_counts(self):
+        """
+        Returns the number of jobs every stage would execute.
+
+        Returns
+        -------
+        OrderedDict
+             The number of executed and cached jobs of every stage.
+        """
+
+        counts = OrderedDict((stage, [0, 0]) for stage in STAGES)
+        for job in self.jobs.values():
+            counts[job['stage']][1 if job['cached'] else 0] += 1
+
+        return counts
+
+    def disk_usage(self):
+        """
+        Returns the intermediate files disk usage.
+
+        Returns
+        -------
+        tuple
+             The total size written and the peak size in bytes, the shared
+             identity images being kept for the whole run and the builder
+             workers rendering concurrently.
+        """
+
+        total = sum(job['disk'] for job in self.jobs.values())
+        if not self.cleanup:
+            return total, total
+
+        shared = sum(self.jobs[identity]['disk']
+                     for identity in self.identities.values())
+        workspaces = sorted(
+            [job['disk'] + sum(self.jobs[dependency]['disk']
+                               for dependency in job['dependencies']
+                               if dependency not in self.identities.values())
+             for job in self.jobs.values()
+             if job['stage'] == 'render'],
+            reverse=True)
+
+        workers = max(min(self.workers, len(workspaces)), 1)
+
+        return total, shared + sum(workspaces[:workers])
+
+    def estimated_runtime(self, timings=None, concurrency=None):
+        """
+        Returns the estimated runtime of every stage.
+
+        Parameters
+        ----------
+        timings : dict, optional
+            The timing history as returned by *load_timings*, stages without
+            history use *DEFAULT_STAGE_RATES*
+        concurrency : int, optional
+            The number of bakes executed concurrently, defaults to
+            *default_concurrency*
+
+        Returns
+        -------
+        OrderedDict
+             The estimated wall clock seconds of every stage.
+        """
+
+        if timings is None:
+            timings = load_timings()
+        if concurrency is None:
+            concurrency = default_concurrency()
+
+        rates = dict(DEFAULT_STAGE_RATES)
+        for stage, timing in timings.items():
+            if timing['units']:
+                rates[stage] = timing['seconds'] / timing['units']
+
+        # The *LUTs* are generated by the builder workers concurrently, the
+        # shared identity images being created beforehand, and the bakes are
+        # executed concurrently afterwards.
+        shared = self.identities.values()
+        runtime = OrderedDict((stage, 0) for stage in STAGES)
+        for identifier, job in self.jobs.items():
+            seconds = job['units'] * rates[job['stage']]
+            if job['stage'] == 'bake':
+                seconds /= concurrency
+            elif (job['stage'] in ('identity', 'convert', 'render', 'extract')
+                    and identifier not in shared):
+                seconds /= self.workers
+            runtime[job['stage']] += seconds
+
+        return runtime
+
+    def report(self, timings=None, concurrency=None, graph=True):
+        """
+        Prints the plan job graph, stage counts, disk usage and estimated
+        runtime.
+
+        Parameters
+        ----------
+        timings : dict, optional
+            The timing history as returned by *load_timings*
+        concurrency : int, optional
+            The number of bakes executed concurrently
+        graph : bool, optional
+            Whether to print the job graph
+
+        Returns
+        -------
+        None
+        """
+
+        if graph:
+            print('Job graph :')
+            for identifier, job in self.jobs.items():
+                print('%6d %-8s %s%s%s' % (
+                    identifier,
+                    job['stage'],
+                    job['description'],
+                    ' (cached)' if job['cached'] else '',
+                    ' <- %s' % ', '.join(map(str, job['dependencies']))
+                    if job['dependencies'] else ''))
+            print('')
+
+        runtime = self.estimated_runtime(timings, concurrency)
+
+        print('%-8s %8s %8s %12s' % ('stage', 'jobs', 'cached', 'runtime (s)'))
+        for stage, (count, cached) in self.stage_counts().items():
+            print('%-8s %8d %8d %12.1f' % (stage, count, cached,
+                                           runtime[stage]))
+        print('')
+
+        total, peak = self.disk_usage()
+        print('Intermediate disk usage : %s written, %s peak' % (
+            format_size(total), format_size(peak)))
+        print('Estimated runtime : %.1f s' % sum(runtime.values()))
+
+
+def active_plan():
+    """
+    Returns the active plan.
+
+    Returns
+    -------
+    Plan
+        The active plan or *None* if the jobs must be executed.
+    """
+
+    return _ACTIVE_PLAN
@@ -8,9 +8,16 @@ a process or a list of other process wrappers which carry such data.
 
 from __future__ import division
 
+import contextlib
+import json
+import multiprocessing
 import os
 import sys
+import threading
+import tempfile
+import time
 import traceback
+from collections import deque
 
 __author__ = 'ACES Developers'
 __copyright__ = 'Copyright (C) 2014 - 2015 - ACES Developers'
@@ -19,12 +26,52 @@ __maintainer__ = 'ACES Developers'
 __email__ = 'aces@oscars.org'
 __status__ = 'Production'
 
-__all__ = ['read_text',
+__all__ = ['ACES_OCIO_CONCURRENCY_ENVIRON',
+           'ACES_OCIO_PROCESS_LOG_ENVIRON',
+           'ACES_OCIO_PROCESS_TIMEOUT_ENVIRON',
+           'ACES_OCIO_PROCESS_IDLE_TIMEOUT_ENVIRON',
+           'ACES_OCIO_MEMORY_BUDGET_ENVIRON',
+           'ACES_OCIO_DISK_BUDGET_ENVIRON',
+           'WATCHDOG_INTERVAL',
+           'REAP_INTERVAL',
+           'environ_seconds',
+           'read_text',
            'write_text',
+           'default_concurrency',
+           'set_concurrency',
+           'execution_slots',
+           'AdmissionController',
+           'set_admission_budgets',
+           'admission_controller',
+           'RESOURCE_KEYS',
+           'aggregate_resources',
+           'JSONLinesSink',
+           'default_sink',
+           'microseconds',
            'Process',
            'ProcessList',
+           'execute_all',
            'main']
 
+ACES_OCIO_CONCURRENCY_ENVIRON = 'ACES_OCIO_CONCURRENCY'
+ACES_OCIO_PROCESS_LOG_ENVIRON = 'ACES_OCIO_PROCESS_LOG'
+ACES_OCIO_PROCESS_TIMEOUT_ENVIRON = 'ACES_OCIO_PROCESS_TIMEOUT'
+ACES_OCIO_PROCESS_IDLE_TIMEOUT_ENVIRON = 'ACES_OCIO_PROCESS_IDLE_TIMEOUT'
+ACES_OCIO_MEMORY_BUDGET_ENVIRON = 'ACES_OCIO_MEMORY_BUDGET'
+ACES_OCIO_DISK_BUDGET_ENVIRON = 'ACES_OCIO_DISK_BUDGET'
+
+# Seconds between two checks of the process timeouts and stragglers.
+WATCHDOG_INTERVAL = 0.1
+
+# Seconds between two attempts at reaping an exited command.
+REAP_INTERVAL = 0.01
+
+EXECUTION_SLOTS = None
+EXECUTION_SLOTS_LOCK = threading.Lock()
+
+ADMISSION_CONTROLLER = None
+ADMISSION_CONTROLLER_LOCK = threading.Lock()
+
 
 def read_text(text_file):
     """
@@ -76,6 +123,421 @@ def write_text(text, text_file):
     return text
 
 
+def default_concurrency():
+    """
+    Returns the default number of processes allowed to run concurrently, set
+    by the *ACES_OCIO_CONCURRENCY* environment variable or the number of
+    CPUs otherwise.
+
+    Parameters
+    ----------
+    None
+
+    Returns
+    -------
+    int
+         The default concurrency.
+    """
+
+    concurrency = os.environ.get(ACES_OCIO_CONCURRENCY_ENVIRON)
+    if concurrency:
+        return max(1, int(concurrency))
+
+    try:
+        return multiprocessing.cpu_count()
+    except NotImplementedError:
+        return 1
+
+
+def environ_seconds(name):
+    """
+    Returns the duration in seconds set by given environment variable.
+
+    Parameters
+    ----------
+    name : str or unicode
+        The environment variable name.
+
+    Returns
+    -------
+    float
+         The duration or None if the variable is not set.
+    """
+
+    value = os.environ.get(name)
+    if not value:
+        return None
+
+    return float(value)
+
+
+def set_concurrency(concurrency=None):
+    """
+    Sets the number of processes allowed to run concurrently through
+    :meth:`Process.execute_async`.
+
+    Parameters
+    ----------
+    concurrency : int, optional
+        The number of concurrent processes, defaults to
+        :func:`default_concurrency`.
+
+    Returns
+    -------
+    BoundedSemaphore
+         The execution slots.
+    """
+
+    global EXECUTION_SLOTS
+
+    if concurrency is None:
+        concurrency = default_concurrency()
+
+    with EXECUTION_SLOTS_LOCK:
+        EXECUTION_SLOTS = threading.BoundedSemaphore(max(1, concurrency))
+
+    return EXECUTION_SLOTS
+
+
+def execution_slots():
+    """
+    Returns the execution slots shared by the processes run with
+    :meth:`Process.execute_async`.
+
+    Parameters
+    ----------
+    None
+
+    Returns
+    -------
+    BoundedSemaphore
+         The execution slots.
+    """
+
+    if EXECUTION_SLOTS is None:
+        return set_concurrency()
+
+    return EXECUTION_SLOTS
+
+
+class AdmissionController(object):
+    """
+    Admits jobs while their estimated memory and temporary disk footprints
+    fit in the configured budgets, the other jobs waiting for the admitted
+    ones to finish. A job is always admitted when no other job is, even if
+    it does not fit in the budgets.
+
+    The controller state is shared with the processes forked after its
+    creation, e.g. the workers of a *multiprocessing* pool, so that their
+    jobs share the same budgets.
+    """
+
+    def __init__(self, memory=None, disk=None):
+        """
+        Constructor for AdmissionController class
+
+        Parameters
+        ----------
+        memory : int, optional
+            The memory budget in bytes, unlimited if None.
+        disk : int, optional
+            The temporary disk budget in bytes, unlimited if None.
+
+        Returns
+        -------
+        None
+        """
+
+        self.memory = memory
+        self.disk = disk
+        self.condition = multiprocessing.Condition()
+        self.used_memory = multiprocessing.RawValue('d', 0)
+        self.used_disk = multiprocessing.RawValue('d', 0)
+        self.admitted = multiprocessing.RawValue('i', 0)
+
+    def fits(self, memory, disk):
+        """
+        Returns whether a job with given footprint fits in the budgets, the
+        condition being held.
+
+        Parameters
+        ----------
+        memory : int
+            The job memory footprint in bytes.
+        disk : int
+            The job temporary disk footprint in bytes.
+
+        Returns
+        -------
+        bool
+             Whether the job fits.
+        """
+
+        if not self.admitted.value:
+            return True
+
+        return ((self.memory is None or
+                 self.used_memory.value + memory <= self.memory) and
+                (self.disk is None or
+                 self.used_disk.value + disk <= self.disk))
+
+    def acquire(self, memory=0, disk=0):
+        """
+        Waits for a job with given footprint to be admitted.
+
+        Parameters
+        ----------
+        memory : int, optional
+            The job memory footprint in bytes.
+        disk : int, optional
+            The job temporary disk footprint in bytes.
+
+        Returns
+        -------
+        None
+        """
+
+        with self.condition:
+            while not self.fits(memory, disk):
+                self.condition.wait()
+
+            self.used_memory.value += memory
+            self.used_disk.value += disk
+            self.admitted.value += 1
+
+    def release(self, memory=0, disk=0):
+        """
+        Releases the footprint of a finished job.
+
+        Parameters
+        ----------
+        memory : int, optional
+            The job memory footprint in bytes.
+        disk : int, optional
+            The job temporary disk footprint in bytes.
+
+        Returns
+        -------
+        None
+        """
+
+        with self.condition:
+            self.used_memory.value -= memory
+            self.used_disk.value -= disk
+            self.admitted.value -= 1
+            self.condition.notify_all()
+
+    @contextlib.contextmanager
+    def admit(self, memory=0, disk=0):
+        """
+        A context manager admitting a job with given footprint for the
+        duration of its block.
+
+        Parameters
+        ----------
+        memory : int, optional
+            The job memory footprint in bytes.
+        disk : int, optional
+            The job temporary disk footprint in bytes.
+
+        Returns
+        -------
+        None
+        """
+
+        self.acquire(memory, disk)
+        try:
+            yield
+        finally:
+            self.release(memory, disk)
+
+
+def set_admission_budgets(memory=None, disk=None):
+    """
+    Sets the memory and temporary disk budgets of the jobs admitted through
+    :func:`admission_controller`.
+
+    Parameters
+    ----------
+    memory : int, optional
+        The memory budget in bytes, defaults to the
+        *ACES_OCIO_MEMORY_BUDGET* environment variable value, unlimited if
+        not set.
+    disk : int, optional
+        The temporary disk budget in bytes, defaults to the
+        *ACES_OCIO_DISK_BUDGET* environment variable value, unlimited if not
+        set.
+
+    Returns
+    -------
+    AdmissionController
+         The admission controller.
+    """
+
+    global ADMISSION_CONTROLLER
+
+    if memory is None and os.environ.get(ACES_OCIO_MEMORY_BUDGET_ENVIRON):
+        memory = int(os.environ[ACES_OCIO_MEMORY_BUDGET_ENVIRON])
+    if disk is None and os.environ.get(ACES_OCIO_DISK_BUDGET_ENVIRON):
+        disk = int(os.environ[ACES_OCIO_DISK_BUDGET_ENVIRON])
+
+    with ADMISSION_CONTROLLER_LOCK:
+        ADMISSION_CONTROLLER = AdmissionController(memory, disk)
+
+    return ADMISSION_CONTROLLER
+
+
+def admission_controller():
+    """
+    Returns the admission controller shared by the jobs of the current run.
+
+    Parameters
+    ----------
+    None
+
+    Returns
+    -------
+    AdmissionController
+         The admission controller.
+    """
+
+    if ADMISSION_CONTROLLER is None:
+        return set_admission_budgets()
+
+    return ADMISSION_CONTROLLER
+
+
+# Resources recorded for each child process, with the keys used in the logs:
+# user and system CPU time in seconds, maximum resident set size and bytes
+# read from and written to storage by the child and its own children.
+RESOURCE_KEYS = (('user_time', 'userTime'),
+                 ('system_time', 'systemTime'),
+                 ('max_rss', 'maxRSS'),
+                 ('read_bytes', 'readBytes'),
+                 ('write_bytes', 'writeBytes'))
+
+
+def aggregate_resources(resources):
+    """
+    Aggregates given processes resources: times and bytes are summed, the
+    largest maximum resident set size is kept.
+
+    Parameters
+    ----------
+    resources : array of dict
+        The resources of the processes.
+
+    Returns
+    -------
+    dict
+         The aggregated resources.
+    """
+
+    aggregated = {}
+    for process_resources in resources:
+        for key, value in process_resources.items():
+            if key == 'max_rss':
+                aggregated[key] = max(aggregated.get(key, 0), value)
+            else:
+                aggregated[key] = aggregated.get(key, 0) + value
+
+    return aggregated
+
+
+class JSONLinesSink(object):
+    """
+    A *JSON Lines* file receiving one record per process as it starts and
+    finishes, every record being flushed immediately so that the file can be
+    followed while processes execute.
+    """
+
+    def __init__(self, path, mode='a'):
+        """
+        Constructor for JSONLinesSink class
+
+        Parameters
+        ----------
+        path : str or unicode
+            The path of the *JSON Lines* file.
+        mode : str or unicode, optional
+            The file opening mode, records are appended by default.
+
+        Returns
+        -------
+        None
+        """
+
+        self.path = path
+        self.handle = open(path, mode)
+        self.lock = threading.Lock()
+
+    def write(self, record):
+        """
+        Writes given record.
+
+        Parameters
+        ----------
+        record : dict
+            The record to write.
+
+        Returns
+        -------
+        None
+        """
+
+        line = '%s\n' % json.dumps(record, sort_keys=True)
+        with self.lock:
+            self.handle.write(line)
+            self.handle.flush()
+
+    def close(self):
+        """
+        Closes the file.
+
+        Parameters
+        ----------
+        None
+
+        Returns
+        -------
+        None
+        """
+
+        with self.lock:
+            self.handle.close()
+
+
+_DEFAULT_SINK = {}
+_DEFAULT_SINK_LOCK = threading.Lock()
+
+
+def default_sink():
+    """
+    Returns the sink configured through the *ACES_OCIO_PROCESS_LOG*
+    environment variable.
+
+    Parameters
+    ----------
+    None
+
+    Returns
+    -------
+    JSONLinesSink
+         The default sink or *None* if no process log is configured.
+    """
+
+    path = os.environ.get(ACES_OCIO_PROCESS_LOG_ENVIRON)
+    if not path:
+        return None
+
+    with _DEFAULT_SINK_LOCK:
+        sink = _DEFAULT_SINK.get(path)
+        if sink is None:
+            sink = _DEFAULT_SINK[path] = JSONLinesSink(path)
+
+    return sink
+
+
 class Process:
     """
     A process with logged output.
@@ -87,23 +549,58 @@ class Process:
                  args=None,
                  cwd=None,
                  env=None,
-                 batch_wrapper=False):
+                 batch_wrapper=False,
+                 log_lines=None,
+                 log_bytes=None,
+                 log_spill=None,
+                 timeout=None,
+                 idle_timeout=None):
         """
         Initialize the standard class variables.
 
         Parameters
         ----------
-        parameter : type
-            Parameter description.
+        description : str or unicode, optional
+            The description of the process.
+        cmd : str or unicode, optional
+            The command to execute.
+        args : array of str or unicode, optional
+            The command arguments.
+        cwd : str or unicode, optional
+            The working directory.
+        env : dict, optional
+            The environment.
+        batch_wrapper : bool, optional
+            Whether to run the command through a batch file.
+        log_lines : int, optional
+            The maximum number of output lines kept in the log, the most
+            recent ones being kept, the log is unbounded if None.
+        log_bytes : int, optional
+            The maximum number of output bytes kept in the log, the most
+            recent lines being kept, the log is unbounded if None.
+        log_spill : str or unicode, optional
+            The path of a file receiving the full output of the process.
+        timeout : float, optional
+            The number of seconds after which the command is killed,
+            defaults to the *ACES_OCIO_PROCESS_TIMEOUT* environment variable
+            value.
+        idle_timeout : float, optional
+            The number of seconds without output after which the command is
+            killed, defaults to the *ACES_OCIO_PROCESS_IDLE_TIMEOUT*
+            environment variable value.
 
         Returns
         -------
-        type
-             Return value description.
+        None
         """
 
         if args is None:
             args = []
+        if timeout is None:
+            timeout = environ_seconds(ACES_OCIO_PROCESS_TIMEOUT_ENVIRON)
+        if idle_timeout is None:
+            idle_timeout = environ_seconds(
+                ACES_OCIO_PROCESS_IDLE_TIMEOUT_ENVIRON)
 
         self.cmd = cmd
         if not description:
@@ -114,12 +611,33 @@ class Process:
         self.args = args
         self.start = None
         self.end = None
-        self.log = []
+        self.log_lines = log_lines
+        self.log_bytes = log_bytes
+        self.log_spill = log_spill
+        self.log_spill_handle = None
+        self.reset_log()
         self.echo = True
         self.cwd = cwd
         self.env = env
         self.batch_wrapper = batch_wrapper
         self.process_keys = []
+        self.thread = None
+        self.dependencies = []
+        self.resources = {}
+        self.memo_cache = None
+        self.restored = False
+        self.memo_inputs = []
+        self.outputs = []
+        self.private_outputs = []
+        self.memo_environ_keys = []
+        self.sink = None
+        self.timeout = timeout
+        self.idle_timeout = idle_timeout
+        self.last_output_time = None
+        self.popen = None
+        self.popen_lock = threading.Lock()
+        self.cancelled = threading.Event()
+        self.terminated = None
 
     def get_elapsed_seconds(self):
         """
@@ -175,6 +693,23 @@ class Process:
                 write_dict['logHandle'].write(
                     '%s%40s : %s\n' % (indent, key, value))
 
+    def write_resources(self, write_dict):
+        """
+        Writes the resources used by the process.
+
+        Parameters
+        ----------
+        write_dict : dict
+            The log writing state.
+
+        Returns
+        -------
+        None
+        """
+
+        for key, log_key in RESOURCE_KEYS:
+            self.write_key(write_dict, log_key, self.resources.get(key))
+
     def write_log_header(self, write_dict):
         """
         Object description.
@@ -219,139 +754,705 @@ class Process:
         self.write_key(write_dict, 'start', self.start)
         self.write_key(write_dict, 'end', self.end)
         self.write_key(write_dict, 'elapsed', self.get_elapsed_seconds())
+        self.write_resources(write_dict)
+
+        self.write_key(write_dict, 'user', user)
+        self.write_key(write_dict, 'sysname', sysname)
+        self.write_key(write_dict, 'nodename', nodename)
+        self.write_key(write_dict, 'release', release)
+        self.write_key(write_dict, 'version', version)
+        self.write_key(write_dict, 'machine', machine)
+        self.write_key(write_dict, 'processor', processor)
+
+        if len(self.process_keys) > 0:
+            self.write_key(write_dict, 'processKeys', None, 'start')
+            for pair in self.process_keys:
+                (key, value) = pair
+                write_dict['indentationLevel'] += 1
+                self.write_key(write_dict, key, value)
+                write_dict['indentationLevel'] -= 1
+            self.write_key(write_dict, 'processKeys', None, 'stop')
+
+        self.write_key(write_dict, 'status', self.status)
+
+    def write_log_footer(self, write_dict):
+        """
+        Object description.
+
+        Parameters
+        ----------
+        parameter : type
+            Parameter description.
+
+        Returns
+        -------
+        type
+             Return value description.
+        """
+
+        write_dict['indentationLevel'] -= 1
+        self.write_key(write_dict, 'process', None, 'stop')
+
+    def write_log(self,
+                  log_handle=sys.stdout,
+                  indentation_level=0,
+                  format='xml'):
+        """
+        Writes logging information to the specified handle.
+
+        Parameters
+        ----------
+        parameter : type
+            Parameter description.
+
+        Returns
+        -------
+        type
+             Return value description.
+        """
+
+        write_dict = {}
+        write_dict['logHandle'] = log_handle
+        write_dict['indentationLevel'] = indentation_level
+        write_dict['format'] = format
+
+        if log_handle:
+            self.write_log_header(write_dict)
+
+            if self.log:
+                self.write_key(write_dict, 'output', None, 'start')
+                if format == 'xml':
+                    log_handle.write('<![CDATA[\n')
+                if self.log_line_count > len(self.log):
+                    log_handle.write(
+                        '... %s earlier lines, %s bytes in total, '
+                        'not kept ...\n' % (
+                            self.log_line_count - len(self.log),
+                            self.log_byte_count))
+                for line in self.log:
+                    log_handle.write('%s%s\n' % ('', line))
+                if format == 'xml':
+                    log_handle.write(']]>\n')
+                self.write_key(write_dict, 'output', None, 'stop')
+
+            self.write_log_footer(write_dict)
+
+    def write_log_to_disk(self, log_filename=None, format='xml', header=None):
+        """
+        Object description.
+
+        Parameters
+        ----------
+        parameter : type
+            Parameter description.
+
+        Returns
+        -------
+        type
+             Return value description.
+        """
+
+        if log_filename and format == 'jsonl':
+            sink = JSONLinesSink(log_filename, 'w')
+            try:
+                for record in self.records():
+                    sink.write(record)
+            finally:
+                sink.close()
+            return
+
+        if log_filename:
+            try:
+                # TODO: Review statements.
+                # 3.1
+                try:
+                    log_handle = (
+                        open(log_filename, mode='wt', encoding='utf-8'))
+                # 2.6
+                except:
+                    log_handle = open(log_filename, mode='wt')
+            except:
+                print('Couldn\'t open log : %s' % log_filename)
+                log_handle = None
+
+        if log_handle:
+            if header:
+                if format == 'xml':
+                    log_handle.write('<![CDATA[\n')
+                log_handle.write(header)
+                if format == 'xml':
+                    log_handle.write(']]>\n')
+            self.write_log(log_handle, format=format)
+            log_handle.close()
+
+    def record(self, event):
+        """
+        Returns the *JSON Lines* record describing the process.
+
+        Parameters
+        ----------
+        event : str or unicode
+            The event the record is emitted for: *start* or *finish*.
+
+        Returns
+        -------
+        dict
+             The record.
+        """
+
+        record = {'event': event,
+                  'type': self.__class__.__name__,
+                  'description': self.description,
+                  'status': self.status,
+                  'start': self.start and self.start.isoformat(),
+                  'end': self.end and self.end.isoformat(),
+                  'elapsed': None,
+                  'pid': os.getpid()}
+
+        if self.cmd:
+            record['cmd'] = self.cmd
+            record['args'] = list(self.args or [])
+        if self.start and self.end:
+            record['elapsed'] = microseconds(self.end - self.start) / 1e6
+        if event == 'finish':
+            record['resources'] = self.resources
+            record['log_lines'] = self.log_line_count
+            record['restored'] = self.restored
+            record['terminated'] = self.terminated
+
+        return record
+
+    def records(self):
+        """
+        Yields the *finish* records of the process, and its children.
+
+        Parameters
+        ----------
+        None
+
+        Returns
+        -------
+        generator
+             The records.
+        """
+
+        yield self.record('finish')
+
+    def emit(self, event):
+        """
+        Writes the record of given event to the process sink, or to the
+        default sink if the process has none.
+
+        Parameters
+        ----------
+        event : str or unicode
+            The event the record is emitted for: *start* or *finish*.
+
+        Returns
+        -------
+        None
+        """
+
+        sink = self.sink or default_sink()
+        if sink is not None:
+            sink.write(self.record(event))
+
+    def trace_events(self, origin, lane, lanes):
+        """
+        Returns the *Chrome* trace events describing the execution of the
+        process.
+
+        Parameters
+        ----------
+        origin : datetime
+            The time of the trace origin.
+        lane : int
+            The lane, i.e. trace thread, the process is displayed in.
+        lanes : list
+            The lanes allocated so far in the trace.
+
+        Returns
+        -------
+        list
+             The trace events.
+        """
+
+        if self.start is None or self.end is None:
+            return []
+
+        args = {'status': self.status}
+        if self.cmd:
+            args['cmd'] = ' '.join([self.cmd] + list(self.args or []))
+        args.update(self.resources)
+
+        return [{'name': self.description,
+                 'cat': self.__class__.__name__,
+                 'ph': 'X',
+                 'ts': microseconds(self.start - origin),
+                 'dur': microseconds(self.end - self.start),
+                 'pid': 1,
+                 'tid': lane,
+                 'args': args}]
+
+    def write_trace_to_disk(self, trace_filename):
+        """
+        Writes the execution timeline of the process, and its children, as
+        *Chrome* / *Perfetto* trace-event *JSON*. Processes running
+        concurrently are displayed in separate lanes.
+
+        Parameters
+        ----------
+        trace_filename : str or unicode
+            The path of the trace file.
+
+        Returns
+        -------
+        None
+        """
+
+        lanes = [0]
+        events = []
+        if self.start is not None:
+            events = self.trace_events(self.start, 0, lanes)
+
+        for lane in range(len(lanes)):
+            events.append({'name': 'thread_name',
+                           'ph': 'M',
+                           'pid': 1,
+                           'tid': lane,
+                           'args': {'name': 'lane %s' % lane}})
+
+        with open(trace_filename, 'w') as fp:
+            json.dump({'traceEvents': events, 'displayTimeUnit': 'ms'}, fp)
+
+    def reset_log(self):
+        """
+        Empties the log and resets its counters. The log is bounded to the
+        last *log_lines* lines or *log_bytes* bytes when set.
+
+        Parameters
+        ----------
+        None
+
+        Returns
+        -------
+        None
+        """
+
+        if self.log_lines is None and self.log_bytes is None:
+            self.log = []
+        else:
+            self.log = deque(maxlen=self.log_lines)
+        self.log_line_count = 0
+        self.log_byte_count = 0
+        self.log_kept_bytes = 0
+
+    def log_line(self, line):
+        """
+        Adds a line of text to the log.
+
+        Parameters
+        ----------
+        line : str or unicode
+            The line to add.
+
+        Returns
+        -------
+        None
+        """
+
+        line = line.rstrip()
+
+        self.last_output_time = time.time()
+        self.log_line_count += 1
+        self.log_byte_count += len(line) + 1
+
+        if self.log_spill_handle is not None:
+            self.log_spill_handle.write('%s\n' % line)
+
+        if self.log_lines is not None and len(self.log) == self.log_lines:
+            self.log_kept_bytes -= len(self.log[0]) + 1
+        self.log.append(line)
+        self.log_kept_bytes += len(line) + 1
+
+        if self.log_bytes is not None:
+            while self.log_kept_bytes > self.log_bytes and len(self.log) > 1:
+                self.log_kept_bytes -= len(self.log.popleft()) + 1
+
+        if self.echo:
+            print('%s' % line)
+
+    def memoize(self, inputs=None, outputs=None, environ_keys=None, cache=None):
+        """
+        Enables the memoization of the process: its execution is skipped
+        when a previous successful execution with the same command,
+        arguments, input files content and environment variables is found
+        in the cache. The output files and the log are then restored from
+        the cache.
+
+        Parameters
+        ----------
+        inputs : array of str or unicode, optional
+            The files read by the process.
+        outputs : array of str or unicode, optional
+            The files written by the process.
+        environ_keys : array of str or unicode, optional
+            The environment variables affecting the process.
+        cache : FileCache, optional
+            The cache storing the executions, defaults to the cache
+            configured with the *ACES_OCIO_CACHE_DIRECTORY* environment
+            variable, memoization is disabled if there is none.
+
+        Returns
+        -------
+        Process
+             The current process.
+        """
+
+        # Imported here so that the module can be used as a standalone script.
+        from aces_ocio.cache import default_cache
+
+        if cache is None:
+            cache = default_cache()
+
+        self.memo_cache = cache
+        self.memo_inputs = list(inputs or [])
+        self.outputs = list(outputs or [])
+        self.memo_environ_keys = list(environ_keys or [])
+
+        return self
+
+    def memo_key(self):
+        """
+        Returns the memoization key of the process.
+
+        Parameters
+        ----------
+        None
+
+        Returns
+        -------
+        str
+             The memoization key.
+        """
+
+        from aces_ocio.cache import file_digest
+
+        env = os.environ if self.env is None else self.env
+
+        return self.memo_cache.key(
+            'Process',
+            self.cmd,
+            list(self.args),
+            self.cwd,
+            self.batch_wrapper,
+            [[path, file_digest(path)] for path in self.memo_inputs],
+            dict((key, env.get(key)) for key in self.memo_environ_keys),
+            self.outputs)
+
+    def restore_memoized(self, key):
+        """
+        Restores the output files and the log of a memoized execution of the
+        process.
+
+        Parameters
+        ----------
+        key : str
+            The memoization key.
+
+        Returns
+        -------
+        bool
+             Whether a memoized execution was restored.
+        """
+
+        handle, log_path = tempfile.mkstemp(suffix='.log')
+        os.close(handle)
+        try:
+            if not self.memo_cache.get(key, self.outputs + [log_path]):
+                return False
+
+            if self.echo:
+                print('\n%s : Restored %s from the cache\n' % (
+                    self.__class__, self.description))
+
+            with open(log_path) as fp:
+                for line in fp:
+                    self.log_line(line)
+        finally:
+            os.remove(log_path)
+
+        self.status = 0
+        self.restored = True
+        return True
+
+    def store_memoized(self, key):
+        """
+        Stores the output files and the log of the process execution.
+
+        Parameters
+        ----------
+        key : str
+            The memoization key.
+
+        Returns
+        -------
+        None
+        """
+
+        if not all(os.path.isfile(path) for path in self.outputs):
+            return
+
+        handle, log_path = tempfile.mkstemp(suffix='.log')
+        try:
+            with os.fdopen(handle, 'w') as fp:
+                for line in self.log:
+                    fp.write('%s\n' % line)
+
+            self.memo_cache.put(key, self.outputs + [log_path])
+        finally:
+            os.remove(log_path)
+
+    def clone(self):
+        """
+        Returns a new process executing the same command as the current
+        process.
+
+        Parameters
+        ----------
+        None
+
+        Returns
+        -------
+        Process
+             The new process.
+        """
+
+        process = Process(self.description,
+                          self.cmd,
+                          list(self.args),
+                          self.cwd,
+                          self.env,
+                          self.batch_wrapper,
+                          self.log_lines,
+                          self.log_bytes,
+                          None,
+                          self.timeout,
+                          self.idle_timeout)
+        process.echo = self.echo
+        process.sink = self.sink
+        process.outputs = list(self.outputs)
+
+        return process
+
+    def speculative_clone(self):
+        """
+        Returns a clone of the current process writing its outputs to private
+        paths next to them, so that both processes can be executed at the
+        same time, see :meth:`Process.publish_outputs`.
+
+        Parameters
+        ----------
+        None
+
+        Returns
+        -------
+        Process
+             The clone or *None* if the process outputs are not declared or
+             not passed as arguments.
+        """
+
+        if not self.outputs or any(path not in self.args
+                                   for path in self.outputs):
+            return None
+
+        process = self.clone()
+        for path in self.outputs:
+            # The extension is kept as the tools infer the format from it.
+            root, extension = os.path.splitext(path)
+            private = '%s.speculative%s' % (root, extension)
+            process.args = [private if arg == path else arg
+                            for arg in process.args]
+            process.private_outputs.append((private, path))
+        process.outputs = [private for private, path
+                           in process.private_outputs]
+
+        return process
+
+    def publish_outputs(self, keep):
+        """
+        Moves the private outputs of a speculative clone in place of the
+        outputs of the cloned process, or removes them.
+
+        Parameters
+        ----------
+        keep : bool
+            Whether the outputs are moved in place rather than removed.
 
-        self.write_key(write_dict, 'user', user)
-        self.write_key(write_dict, 'sysname', sysname)
-        self.write_key(write_dict, 'nodename', nodename)
-        self.write_key(write_dict, 'release', release)
-        self.write_key(write_dict, 'version', version)
-        self.write_key(write_dict, 'machine', machine)
-        self.write_key(write_dict, 'processor', processor)
+        Returns
+        -------
+        None
+        """
 
-        if len(self.process_keys) > 0:
-            self.write_key(write_dict, 'processKeys', None, 'start')
-            for pair in self.process_keys:
-                (key, value) = pair
-                write_dict['indentationLevel'] += 1
-                self.write_key(write_dict, key, value)
-                write_dict['indentationLevel'] -= 1
-            self.write_key(write_dict, 'processKeys', None, 'stop')
+        for private, path in self.private_outputs:
+            if not os.path.exists(private):
+                continue
 
-        self.write_key(write_dict, 'status', self.status)
+            if keep:
+                try:
+                    os.rename(private, path)
+                except OSError:
+                    # *Windows* doesn't replace an existing file.
+                    os.remove(path)
+                    os.rename(private, path)
+            else:
+                os.remove(private)
 
-    def write_log_footer(self, write_dict):
+    def adopt(self, process):
         """
-        Object description.
+        Takes over the execution results of given process, e.g. a clone
+        executed in place of the current process.
 
         Parameters
         ----------
-        parameter : type
-            Parameter description.
+        process : Process
+            The process whose results are taken over.
 
         Returns
         -------
-        type
-             Return value description.
+        None
         """
 
-        write_dict['indentationLevel'] -= 1
-        self.write_key(write_dict, 'process', None, 'stop')
+        for name in ('status', 'start', 'end', 'log', 'log_line_count',
+                     'log_byte_count', 'log_kept_bytes', 'resources',
+                     'terminated'):
+            setattr(self, name, getattr(process, name))
 
-    def write_log(self,
-                  log_handle=sys.stdout,
-                  indentation_level=0,
-                  format='xml'):
+    def terminate(self, reason):
         """
-        Writes logging information to the specified handle.
+        Kills the running command, the processes it started itself are not
+        killed.
 
         Parameters
         ----------
-        parameter : type
-            Parameter description.
+        reason : str or unicode
+            The reason the command is killed, e.g. *timeout*.
 
         Returns
         -------
-        type
-             Return value description.
+        bool
+             Whether a running command was killed.
         """
 
-        write_dict = {}
-        write_dict['logHandle'] = log_handle
-        write_dict['indentationLevel'] = indentation_level
-        write_dict['format'] = format
+        with self.popen_lock:
+            # The command is not polled as it would reap it outside of
+            # :meth:`Process.account_resources` method.
+            popen = self.popen
+            if popen is None or popen.returncode is not None:
+                return False
 
-        if log_handle:
-            self.write_log_header(write_dict)
+            self.terminated = reason
+            try:
+                popen.kill()
+            except OSError:
+                pass
 
-            if self.log:
-                self.write_key(write_dict, 'output', None, 'start')
-                if format == 'xml':
-                    log_handle.write('<![CDATA[\n')
-                for line in self.log:
-                    log_handle.write('%s%s\n' % ('', line))
-                if format == 'xml':
-                    log_handle.write(']]>\n')
-                self.write_key(write_dict, 'output', None, 'stop')
+        return True
 
-            self.write_log_footer(write_dict)
+    def cancel(self):
+        """
+        Cancels the process: it is not executed if it did not start yet and
+        its command is killed otherwise, a later execution is not affected.
 
-    def write_log_to_disk(self, log_filename=None, format='xml', header=None):
+        Parameters
+        ----------
+        None
+
+        Returns
+        -------
+        None
         """
-        Object description.
+
+        with self.popen_lock:
+            self.cancelled.set()
+        self.terminate('cancelled')
+
+    def watch(self, stop):
+        """
+        Kills the running command once its wall-clock or idle-output timeout
+        expires, until given event is set.
 
         Parameters
         ----------
-        parameter : type
-            Parameter description.
+        stop : Event
+            The event set when the command finished.
 
         Returns
         -------
-        type
-             Return value description.
+        None
         """
 
-        if log_filename:
-            try:
-                # TODO: Review statements.
-                # 3.1
-                try:
-                    log_handle = (
-                        open(log_filename, mode='wt', encoding='utf-8'))
-                # 2.6
-                except:
-                    log_handle = open(log_filename, mode='wt')
-            except:
-                print('Couldn\'t open log : %s' % log_filename)
-                log_handle = None
+        start = time.time()
+        while not stop.wait(WATCHDOG_INTERVAL):
+            now = time.time()
+            if self.timeout is not None and now - start > self.timeout:
+                self.terminate('timeout')
+                return
 
-        if log_handle:
-            if header:
-                if format == 'xml':
-                    log_handle.write('<![CDATA[\n')
-                log_handle.write(header)
-                if format == 'xml':
-                    log_handle.write(']]>\n')
-            self.write_log(log_handle, format=format)
-            log_handle.close()
+            if (self.idle_timeout is not None and
+                    now - self.last_output_time > self.idle_timeout):
+                self.terminate('idle timeout')
+                return
 
-    def log_line(self, line):
+    def account_resources(self, process):
         """
-        Adds a line of text to the log.
+        Reaps given child process to record its own resource usage, as
+        returned by :func:`os.wait4` definition. The child is polled under
+        the process lock so that it is never killed by
+        :meth:`Process.terminate` method once reaped.
 
         Parameters
         ----------
-        parameter : type
-            Parameter description.
+        process : Popen
+            The child process whose output has been exhausted.
 
         Returns
         -------
-        type
-             Return value description.
+        None
         """
 
-        self.log.append(line.rstrip())
-        if self.echo:
-            print('%s' % line.rstrip())
+        self.resources = {}
+
+        if not hasattr(os, 'wait4'):
+            process.wait()
+            return
+
+        while True:
+            with self.popen_lock:
+                try:
+                    pid, status, rusage = os.wait4(process.pid, os.WNOHANG)
+                except OSError:
+                    process.wait()
+                    return
+
+                if pid:
+                    if os.WIFSIGNALED(status):
+                        process.returncode = -os.WTERMSIG(status)
+                    else:
+                        process.returncode = os.WEXITSTATUS(status)
+                    break
+
+            time.sleep(REAP_INTERVAL)
+
+        # The blocks read and written are 512 bytes blocks, *ru_maxrss* is
+        # expressed in kilobytes except on Mac OS X.
+        self.resources = {
+            'user_time': rusage.ru_utime,
+            'system_time': rusage.ru_stime,
+            'max_rss': rusage.ru_maxrss * (
+                1 if sys.platform == 'darwin' else 1024),
+            'read_bytes': rusage.ru_inblock * 512,
+            'write_bytes': rusage.ru_oublock * 512}
 
     def execute(self):
         """
@@ -377,6 +1478,36 @@ class Process:
             sp = None
 
         self.start = datetime.datetime.now()
+        self.emit('start')
+
+        self.terminated = None
+        # A cancellation only applies to the pending or running execution.
+        with self.popen_lock:
+            cancelled = self.cancelled.is_set()
+            self.cancelled.clear()
+        if cancelled:
+            self.terminated = 'cancelled'
+            self.log_line('%s : cancelled before execution' % self.__class__)
+            self.status = -1
+            self.end = datetime.datetime.now()
+            self.emit('finish')
+            return
+
+        memo_key = None
+        if self.memo_cache is not None:
+            memo_key = self.memo_key()
+            if self.restore_memoized(memo_key):
+                self.cancelled.clear()
+                self.end = datetime.datetime.now()
+                self.emit('finish')
+                return
+
+        if self.log_spill:
+            try:
+                self.log_spill_handle = open(self.log_spill, 'w')
+            except:
+                print('Couldn\'t open log spill file : %s' % self.log_spill)
+                self.log_spill_handle = None
 
         cmdargs = [self.cmd]
         cmdargs.extend(self.args)
@@ -430,6 +1561,21 @@ class Process:
                 # pid = process.pid
                 # log.logLine('process id %s\n' % pid)
 
+                with self.popen_lock:
+                    self.popen = process
+                # The process may have been cancelled while starting.
+                if self.cancelled.is_set():
+                    self.terminate('cancelled')
+
+                watchdog = None
+                if self.timeout is not None or self.idle_timeout is not None:
+                    self.last_output_time = time.time()
+                    watchdog_stop = threading.Event()
+                    watchdog = threading.Thread(target=self.watch,
+                                                args=(watchdog_stop,))
+                    watchdog.daemon = True
+                    watchdog.start()
+
                 try:
                     # This is more proper python, and resolves some issues with
                     # a process ending before all of its output has been
@@ -440,6 +1586,8 @@ class Process:
                     for line in process.stdout:
                         self.log_line(line)
 
+                    self.account_resources(process)
+
                     # So we go with the, um, uglier option below.
 
                     # This is now used to ensure that the process has finished.
@@ -449,6 +1597,11 @@ class Process:
                             line = process.stdout.readline()
                         except:
                             break
+                        # An empty read means the output is exhausted, there
+                        # is no point logging it until the process exits.
+                        if not line:
+                            process.wait()
+                            break
                         # 3.1
                         try:
                             # TODO: Investigate previous eroneous statement.
@@ -460,8 +1613,22 @@ class Process:
                 except:
                     self.log_line('Logging error : %s' % sys.exc_info()[0])
 
+                if watchdog is not None:
+                    watchdog_stop.set()
+                    watchdog.join()
+                with self.popen_lock:
+                    self.popen = None
+                    self.cancelled.clear()
+
                 self.status = process.returncode
 
+                if self.terminated is not None:
+                    self.log_line('%s : killed after %s seconds, %s' % (
+                        self.__class__,
+                        microseconds(datetime.datetime.now() - self.start) /
+                        1e6,
+                        self.terminated))
+
                 if self.batch_wrapper and tmp_wrapper:
                     try:
                         os.remove(tmp_wrapper)
@@ -498,33 +1665,173 @@ class Process:
 
             self.status = exit_code
 
+        if self.log_spill_handle is not None:
+            self.log_spill_handle.close()
+            self.log_spill_handle = None
+
         self.end = datetime.datetime.now()
 
+        if memo_key is not None and self.status == 0:
+            self.store_memoized(memo_key)
+
+        self.emit('finish')
+
+    def execute_async(self, slots=None):
+        """
+        Executes the current process in a background thread, once one of the
+        given execution slots is available, and returns immediately. The
+        output is streamed to the log as with :meth:`Process.execute`.
+
+        Parameters
+        ----------
+        slots : BoundedSemaphore, optional
+            The execution slots limiting the number of concurrent processes,
+            defaults to :func:`execution_slots`.
+
+        Returns
+        -------
+        Process
+             The current process, to be waited for with :meth:`Process.wait`.
+        """
+
+        if slots is None:
+            slots = execution_slots()
+
+        def run():
+            with slots:
+                try:
+                    self.execute()
+                except:
+                    print('%s : caught exception in asynchronous execution' %
+                          self.__class__)
+                    traceback.print_exc()
+                    self.status = -1
+
+        self.thread = threading.Thread(target=run, name=self.description)
+        self.thread.daemon = True
+        self.thread.start()
+
+        return self
+
+    def done(self):
+        """
+        Returns whether the asynchronous execution of the current process is
+        finished.
+
+        Parameters
+        ----------
+        None
+
+        Returns
+        -------
+        bool
+             Whether the process is finished.
+        """
+
+        return self.thread is None or not self.thread.is_alive()
+
+    def wait(self, timeout=None):
+        """
+        Waits for the asynchronous execution of the current process.
+
+        Parameters
+        ----------
+        timeout : float, optional
+            The maximum time to wait for in seconds.
+
+        Returns
+        -------
+        int
+             The process status, None if it is still running.
+        """
+
+        if self.thread is not None:
+            self.thread.join(timeout)
+            if self.thread.is_alive():
+                return None
+
+        return self.status
+
 
 class ProcessList(Process):
     """
     A list of processes with logged output.
     """
 
-    def __init__(self, description, blocking=True, cwd=None, env=None):
+    def __init__(self,
+                 description,
+                 blocking=True,
+                 cwd=None,
+                 env=None,
+                 parallel=False,
+                 workers=None,
+                 straggler_factor=None):
         """
         Object description.
 
         Parameters
         ----------
-        parameter : type
-            Parameter description.
+        description : str or unicode
+            The description of the process list.
+        blocking : bool, optional
+            Whether a child finishing with an error stops the execution of
+            the remaining children.
+        cwd : str or unicode, optional
+            The working directory.
+        env : dict, optional
+            The environment.
+        parallel : bool, optional
+            Whether the children are executed as a dependency graph on a pool
+            of workers rather than one after another, see
+            :meth:`ProcessList.add`.
+        workers : int, optional
+            The number of workers used in parallel mode, defaults to
+            :func:`default_concurrency`.
+        straggler_factor : float, optional
+            In parallel mode, a child running for longer than this factor
+            times the median duration of its finished siblings is
+            speculatively executed a second time, the first execution to
+            finish being kept and the other one killed. Only the children
+            whose :attr:`Process.outputs` are all passed as arguments are
+            executed again, their speculative execution writing to private
+            paths, see :meth:`Process.speculative_clone`.
 
         Returns
         -------
-        type
-             Return value description.
+        None
         """
 
         Process.__init__(self, description, None, None, cwd, env)
         'Initialize the standard class variables'
         self.processes = []
         self.blocking = blocking
+        self.parallel = parallel
+        self.workers = workers
+        self.straggler_factor = straggler_factor
+
+    def add(self, process, dependencies=None):
+        """
+        Adds given child process, executed once all its dependencies finished
+        successfully when the list is executed in parallel mode.
+
+        Parameters
+        ----------
+        process : Process
+            The child process to add.
+        dependencies : array of Process, optional
+            The children of this list the process depends on.
+
+        Returns
+        -------
+        Process
+             The added process.
+        """
+
+        if dependencies is not None:
+            process.dependencies = list(dependencies)
+        self.processes.append(process)
+
+        return process
 
     def generate_report(self, write_dict):
         """
@@ -567,6 +1874,9 @@ class ProcessList(Process):
                 self.status = -1
             else:
                 self.status = 0
+
+            self.resources = aggregate_resources(
+                [child.resources for child in self.processes if child])
         else:
             self.log = ['No child processes available to generate a report']
             self.status = -1
@@ -595,6 +1905,7 @@ class ProcessList(Process):
         self.write_key(write_dict, 'elapsed', self.get_elapsed_seconds())
 
         self.generate_report(write_dict)
+        self.write_resources(write_dict)
 
         self.write_key(write_dict, 'status', self.status)
 
@@ -656,6 +1967,45 @@ class ProcessList(Process):
 
             self.write_log_footer(write_dict)
 
+    def cancel(self):
+        """
+        Cancels the process list and its children.
+
+        Parameters
+        ----------
+        None
+
+        Returns
+        -------
+        None
+        """
+
+        self.cancelled.set()
+        for child in self.processes:
+            if child:
+                child.cancel()
+
+    def records(self):
+        """
+        Yields the *finish* records of the process list and of its children,
+        so that they can be streamed without building the whole report.
+
+        Parameters
+        ----------
+        None
+
+        Returns
+        -------
+        generator
+             The records.
+        """
+
+        yield self.record('finish')
+        for child in self.processes:
+            if child:
+                for record in child.records():
+                    yield record
+
     def execute(self):
         """
         Executes the list of processes.
@@ -674,26 +2024,309 @@ class ProcessList(Process):
         import datetime
 
         self.start = datetime.datetime.now()
+        self.emit('start')
+
+        # The children report to the same sink as the list.
+        for child in self.processes:
+            if child and child.sink is None:
+                child.sink = self.sink
 
         self.status = 0
-        if self.processes:
-            for child in self.processes:
-                if child:
-                    try:
-                        child.execute()
-                    except:
-                        print('%s : caught exception in child class %s' % (
-                            self.__class__, child.__class__))
-                        traceback.print_exc()
+        try:
+            if self.processes and self.parallel:
+                self.execute_graph()
+            elif self.processes:
+                for child in self.processes:
+                    if child:
+                        try:
+                            child.execute()
+                        except:
+                            print('%s : caught exception in child class %s' %
+                                  (self.__class__, child.__class__))
+                            traceback.print_exc()
+                            child.status = -1
+
+                        if self.blocking and child.status != 0:
+                            print('%s : child class %s finished with an '
+                                  'error' % (self.__class__, child.__class__))
+                            self.status = -1
+                            break
+        except:
+            self.status = -1
+            raise
+        finally:
+            self.end = datetime.datetime.now()
+            self.resources = aggregate_resources(
+                [child.resources for child in self.processes if child])
+            self.emit('finish')
+
+    def trace_events(self, origin, lane, lanes):
+        """
+        Returns the *Chrome* trace events describing the execution of the
+        process list and of its children. Children overlapping in time are
+        assigned to distinct lanes.
+
+        Parameters
+        ----------
+        origin : datetime
+            The time of the trace origin.
+        lane : int
+            The lane, i.e. trace thread, the process list is displayed in.
+        lanes : list
+            The lanes allocated so far in the trace.
+
+        Returns
+        -------
+        list
+             The trace events.
+        """
+
+        events = Process.trace_events(self, origin, lane, lanes)
+
+        children = sorted([child for child in self.processes
+                           if child and child.start is not None],
+                          key=lambda x: x.start)
+
+        # The end of the last child displayed in each lane used by the list.
+        lane_ends = [[lane, None]]
+        for child in children:
+            for lane_end in lane_ends:
+                if lane_end[1] is None or lane_end[1] <= child.start:
+                    break
+            else:
+                lane_end = [len(lanes), None]
+                lanes.append(lane_end[0])
+                lane_ends.append(lane_end)
+
+            lane_end[1] = child.end or child.start
+            events.extend(child.trace_events(origin, lane_end[0], lanes))
+
+        return events
+
+    def execute_graph(self):
+        """
+        Executes the list of processes as a dependency graph: every child is
+        started on a pool of workers as soon as its dependencies finished
+        successfully. Children whose dependencies failed are not executed and
+        when the list is blocking, the running children are cancelled and no
+        child is started after an error. Stragglers are speculatively
+        executed a second time when :attr:`ProcessList.straggler_factor` is
+        set.
+
+        Parameters
+        ----------
+        None
+
+        Returns
+        -------
+        None
+        """
+
+        import datetime
+
+        children = [child for child in self.processes if child]
+        for child in children:
+            for dependency in child.dependencies:
+                if not any(dependency is other for other in children):
+                    raise ValueError(
+                        '"%s" depends on "%s" which is not a child of "%s"!' %
+                        (child.description,
+                         dependency.description,
+                         self.description))
+
+        # The children are checked for circular dependencies before any of
+        # them is started.
+        remaining = list(children)
+        while remaining:
+            ready = [child for child in remaining
+                     if not any(dependency is other
+                                for dependency in child.dependencies
+                                for other in remaining)]
+            if not ready:
+                raise ValueError(
+                    'Circular dependencies between the children of '
+                    '"%s"!' % self.description)
+
+            remaining = [child for child in remaining
+                         if not any(child is other for other in ready)]
+
+        workers = self.workers or default_concurrency()
+
+        condition = threading.Condition()
+        finished = {}
+        # The running executions of every child, a straggling child having
+        # a second, speculative, execution.
+        attempts = {}
+        winners = {}
+        clones = {}
+        durations = []
+        state = {'running': 0, 'failed': False}
+
+        def cancel_running():
+            for child_attempts in attempts.values():
+                for attempt in child_attempts:
+                    attempt.cancel()
+
+        def run(child, attempt):
+            try:
+                attempt.execute()
+            except:
+                print('%s : caught exception in child class %s' % (
+                    self.__class__, attempt.__class__))
+                traceback.print_exc()
+                attempt.status = -1
+
+            with condition:
+                state['running'] -= 1
+                attempts[id(child)].remove(attempt)
+
+                winner = winners.get(id(child))
+                if winner is None:
+                    winner = winners[id(child)] = attempt
+                    for other in attempts[id(child)]:
+                        other.cancel()
+
+                # The child finishes once its killed execution exited too, so
+                # that its dependents never read the outputs being written.
+                if not attempts[id(child)]:
+                    clone = clones.get(id(child))
+                    if clone is not None:
+                        try:
+                            clone.publish_outputs(
+                                winner is clone and clone.status == 0)
+                        except OSError:
+                            traceback.print_exc()
+                            winner.status = -1
+
+                    # The child keeps the results of the first execution to
+                    # finish, even when it is a speculative one.
+                    if winner is not child:
+                        child.adopt(winner)
+
+                    finished[id(child)] = winner.status
+                    if winner.status == 0:
+                        durations.append(
+                            microseconds(winner.end - winner.start))
+                    else:
+                        print('%s : child class %s finished with an error' %
+                              (self.__class__, child.__class__))
+                        state['failed'] = True
+                        if self.blocking:
+                            cancel_running()
+
+                condition.notify()
+
+        def launch(child, attempt):
+            attempts.setdefault(id(child), []).append(attempt)
+            state['running'] += 1
+            thread = threading.Thread(target=run,
+                                      args=(child, attempt),
+                                      name=attempt.description)
+            thread.daemon = True
+            thread.start()
+
+        pending = list(children)
+        with condition:
+            while pending or state['running']:
+                if state['failed'] and self.blocking:
+                    pending = []
+
+                progress = False
+                for child in list(pending):
+                    statuses = [finished.get(id(dependency))
+                                for dependency in child.dependencies]
+                    if any(status not in (0, None) for status in statuses):
+                        print('%s : skipping child %s as a dependency '
+                              'failed' % (self.__class__, child.description))
                         child.status = -1
+                        finished[id(child)] = child.status
+                        state['failed'] = True
+                        pending.remove(child)
+                        progress = True
+                    elif (None not in statuses and
+                            state['running'] < workers):
+                        pending.remove(child)
+                        launch(child, child)
+                        progress = True
+
+                if progress:
+                    continue
+
+                if not state['running']:
+                    raise ValueError(
+                        'Circular dependencies between the children of '
+                        '"%s"!' % self.description)
+
+                if self.straggler_factor and len(durations) >= 3:
+                    threshold = (self.straggler_factor *
+                                 sorted(durations)[len(durations) // 2])
+                    now = datetime.datetime.now()
+                    for child in children:
+                        if (state['running'] < workers and
+                                not isinstance(child, ProcessList) and
+                                id(child) in attempts and
+                                id(child) not in clones and
+                                id(child) not in winners and
+                                child.start is not None and
+                                microseconds(now - child.start) > threshold):
+                            clone = clones[id(child)] = (
+                                child.speculative_clone())
+                            if clone is None:
+                                continue
+
+                            print('%s : speculatively executing straggling '
+                                  'child %s' % (self.__class__,
+                                                child.description))
+                            launch(child, clone)
+
+                condition.wait(
+                    WATCHDOG_INTERVAL if self.straggler_factor else None)
+
+        if state['failed'] and self.blocking:
+            self.status = -1
 
-                    if self.blocking and child.status != 0:
-                        print('%s : child class %s finished with an error' % (
-                            self.__class__, child.__class__))
-                        self.status = -1
-                        break
 
-        self.end = datetime.datetime.now()
+def microseconds(delta):
+    """
+    Returns given time delta in microseconds.
+
+    Parameters
+    ----------
+    delta : timedelta
+        The time delta.
+
+    Returns
+    -------
+    int
+         The time delta in microseconds.
+    """
+
+    return (delta.days * 86400 + delta.seconds) * 1000000 + delta.microseconds
+
+
+def execute_all(processes, slots=None):
+    """
+    Executes given processes concurrently, within the limit of the given
+    execution slots, and waits for all of them.
+
+    Parameters
+    ----------
+    processes : array of Process
+        The processes to execute.
+    slots : BoundedSemaphore, optional
+        The execution slots limiting the number of concurrent processes,
+        defaults to :func:`execution_slots`.
+
+    Returns
+    -------
+    list
+         The processes status.
+    """
+
+    for process in processes:
+        process.execute_async(slots)
+
+    return [process.wait() for process in processes]
 
 
 def main():
@@ -720,11 +2353,15 @@ def main():
                                      '[options for the logged process]'))
     p.add_option('--cmd', '-c', default=None)
     p.add_option('--log', '-l', default=None)
+    p.add_option('--trace', '-t', default=None)
+    p.add_option('--jsonl', '-j', default=None)
 
     options, arguments = p.parse_args()
 
     cmd = options.cmd
     log_filename = options.log
+    trace_filename = options.trace
+    jsonl_filename = options.jsonl
 
     try:
         args_start = sys.argv.index('--') + 1
@@ -742,10 +2379,15 @@ def main():
     process_list = ProcessList('a process list')
     process_list.processes.append(process)
     process_list.echo = True
+    if jsonl_filename:
+        process_list.sink = JSONLinesSink(jsonl_filename)
     process_list.execute()
 
     process_list.write_log_to_disk(log_filename)
 
+    if trace_filename:
+        process_list.write_trace_to_disk(trace_filename)
+
 
 if __name__ == '__main__':
     main()
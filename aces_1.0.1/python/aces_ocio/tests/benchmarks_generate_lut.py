@@ -0,0 +1,251 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Defines micro-benchmarks for the *aces_ocio.generate_lut* module 1D LUT
+writers.
+"""
+
+from __future__ import division
+
+import os
+import random
+import shutil
+import sys
+import tempfile
+import timeit
+
+sys.path.append(os.path.abspath(
+    os.path.join(os.path.dirname(__file__), '..', '..')))
+
+from aces_ocio.generate_lut import write_SPI_1d, write_CSP_1d, write_CTL_1d
+
+__author__ = 'ACES Developers'
+__copyright__ = 'Copyright (C) 2014 - 2015 - ACES Developers'
+__license__ = ''
+__maintainer__ = 'ACES Developers'
+__email__ = 'aces@oscars.org'
+__status__ = 'Production'
+
+__all__ = ['BENCHMARK_RESOLUTIONS',
+           'BENCHMARK_REPEAT',
+           'legacy_write_SPI_1d',
+           'legacy_write_CSP_1d',
+           'legacy_write_CTL_1d',
+           'benchmark_1d_writers',
+           'main']
+
+BENCHMARK_RESOLUTIONS = (4096, 65536)
+BENCHMARK_REPEAT = 5
+
+
+def legacy_write_SPI_1d(filename,
+                        from_min,
+                        from_max,
+                        data,
+                        entries,
+                        channels,
+                        components=3):
+    """
+    Writes a 1D LUT in the Sony Pictures Imageworks .spi1d format, one entry
+    at a time, the way *write_SPI_1d* used to.
+    """
+
+    components = min(3, components, channels)
+
+    with open(filename, 'w') as fp:
+        fp.write('Version 1\n')
+        fp.write('From %f %f\n' % (from_min, from_max))
+        fp.write('Length %d\n' % entries)
+        fp.write('Components %d\n' % components)
+        fp.write('{\n')
+        for i in range(0, entries):
+            entry = ''
+            for j in range(0, components):
+                entry = '%s %s' % (entry, data[i * channels + j])
+            fp.write('        %s\n' % entry)
+        fp.write('}\n')
+
+
+def legacy_write_CSP_1d(filename,
+                        from_min,
+                        from_max,
+                        data,
+                        entries,
+                        channels,
+                        components=3):
+    """
+    Writes a 1D LUT in the Rising Sun Research Cinespace .csp format, one
+    entry at a time, the way *write_CSP_1d* used to.
+    """
+
+    components = min(3, components, channels)
+
+    with open(filename, 'w') as fp:
+        fp.write('CSPLUTV100\n')
+        fp.write('1D\n')
+        fp.write('\n')
+        fp.write('BEGIN METADATA\n')
+        fp.write('END METADATA\n')
+
+        fp.write('\n')
+
+        for i in range(3):
+            fp.write('2\n')
+            fp.write('%f %f\n' % (from_min, from_max))
+            fp.write('0.0 1.0\n')
+
+        fp.write('\n')
+
+        fp.write('%d\n' % entries)
+        if components == 1:
+            for i in range(0, entries):
+                entry = ''
+                for j in range(3):
+                    entry = '%s %s' % (entry, data[i * channels])
+                fp.write('%s\n' % entry)
+        else:
+            for i in range(entries):
+                entry = ''
+                for j in range(components):
+                    entry = '%s %s' % (entry, data[i * channels + j])
+                fp.write('%s\n' % entry)
+        fp.write('\n')
+
+
+def legacy_write_CTL_1d(filename,
+                        from_min,
+                        from_max,
+                        data,
+                        entries,
+                        channels,
+                        components=3):
+    """
+    Writes the LUT tables of a 1D LUT in the Academy Color Transformation
+    Language .ctl format, one entry at a time, the way *write_CTL_1d* used
+    to. The *main* function boilerplate is left out as it is identical.
+    """
+
+    components = min(3, components, channels)
+
+    with open(filename, 'w') as fp:
+        fp.write('// %d x %d LUT generated by "generate_lut"\n' % (
+            entries, components))
+        fp.write('\n')
+        fp.write('const float min1d = %3.9f;\n' % from_min)
+        fp.write('const float max1d = %3.9f;\n' % from_max)
+        fp.write('\n')
+
+        if components == 1:
+            fp.write('const float lut[] = {\n')
+            for i in range(0, entries):
+                fp.write('%s' % data[i * channels])
+                if i != (entries - 1):
+                    fp.write(',')
+                fp.write('\n')
+            fp.write('};\n')
+            fp.write('\n')
+        else:
+            for j in range(components):
+                fp.write('const float lut%d[] = {\n' % j)
+                for i in range(0, entries):
+                    fp.write('%s' % data[i * channels])
+                    if i != (entries - 1):
+                        fp.write(',')
+                    fp.write('\n')
+                fp.write('};\n')
+                fp.write('\n')
+
+
+def benchmark_1d_writers(resolutions=BENCHMARK_RESOLUTIONS,
+                         repeat=BENCHMARK_REPEAT,
+                         channels=3):
+    """
+    Compares the output of the 1D LUT writers with their legacy counterparts
+    and reports the time taken by both.
+
+    Parameters
+    ----------
+    resolutions : array of int, optional
+        The LUT resolutions to benchmark
+    repeat : int, optional
+        The number of times each writer is run, the best time is reported
+    channels : int, optional
+        The number of channels in the benchmark data
+
+    Returns
+    -------
+    list
+        The (writer name, resolution, legacy time, bulk time) results
+    """
+
+    writers = (('spi1d', legacy_write_SPI_1d, write_SPI_1d),
+               ('csp', legacy_write_CSP_1d, write_CSP_1d),
+               ('ctl', legacy_write_CTL_1d, write_CTL_1d))
+
+    results = []
+    temporary_directory = tempfile.mkdtemp()
+    try:
+        for resolution in resolutions:
+            data = [random.uniform(-0.25, 1.25)
+                    for _ in range(resolution * channels)]
+            for name, legacy_writer, writer in writers:
+                legacy_path = os.path.join(temporary_directory,
+                                           'legacy.%s' % name)
+                path = os.path.join(temporary_directory, 'bulk.%s' % name)
+
+                for components in (1, channels):
+                    arguments = (0.0, 1.0, data, resolution, channels,
+                                 components)
+
+                    legacy_writer(legacy_path, *arguments)
+                    writer(path, *arguments)
+
+                    with open(legacy_path) as legacy_file, open(path) as file:
+                        legacy_output = legacy_file.read()
+                        output = file.read()
+                        # The legacy *CTL* writer omits the *main* function.
+                        assert output.startswith(legacy_output), (
+                            '"%s" writer output differs from the legacy one '
+                            'for %d components!' % (name, components))
+
+                arguments = (0.0, 1.0, data, resolution, channels)
+                legacy_time = min(timeit.repeat(
+                    lambda: legacy_writer(legacy_path, *arguments),
+                    repeat=repeat,
+                    number=1))
+                bulk_time = min(timeit.repeat(
+                    lambda: writer(path, *arguments),
+                    repeat=repeat,
+                    number=1))
+
+                results.append((name, resolution, legacy_time, bulk_time))
+    finally:
+        shutil.rmtree(temporary_directory)
+
+    return results
+
+
+def main():
+    """
+    Runs the 1D LUT writers benchmark and prints the results.
+
+    Parameters
+    ----------
+    None
+
+    Returns
+    -------
+    None
+    """
+
+    print('%-8s %10s %12s %12s %8s' % (
+        'format', 'entries', 'legacy (s)', 'bulk (s)', 'speedup'))
+    for name, resolution, legacy_time, bulk_time in benchmark_1d_writers():
+        print('%-8s %10d %12.6f %12.6f %7.2fx' % (
+            name, resolution, legacy_time, bulk_time,
+            legacy_time / bulk_time))
+
+
+if __name__ == '__main__':
+    main()
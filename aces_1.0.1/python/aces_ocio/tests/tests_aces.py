@@ -0,0 +1,102 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Defines unit tests for the *aces_ocio.colorspaces.aces* module.
+"""
+
+from __future__ import division
+
+import os
+import shutil
+import sys
+import tempfile
+import unittest
+
+sys.path.append(os.path.abspath(
+    os.path.join(os.path.dirname(__file__), '..', '..')))
+
+from aces_ocio.colorspaces.aces import create_ODTs
+
+__author__ = 'ACES Developers'
+__copyright__ = 'Copyright (C) 2014 - 2015 - ACES Developers'
+__license__ = ''
+__maintainer__ = 'ACES Developers'
+__email__ = 'aces@oscars.org'
+__status__ = 'Production'
+
+__all__ = ['TestCreateODTs']
+
+
+class TestCreateODTs(unittest.TestCase):
+    """
+    Performs tests on the :func:`aces_ocio.colorspaces.aces.create_ODTs`
+    definition.
+    """
+
+    def setUp(self):
+        """
+        Initialises common tests attributes.
+        """
+
+        self.__temporary_directory = tempfile.mkdtemp()
+
+    def tearDown(self):
+        """
+        Post tests actions.
+        """
+
+        shutil.rmtree(self.__temporary_directory)
+
+    def test_create_ODTs_full_legal_switch(self):
+        """
+        Tests :func:`aces_ocio.colorspaces.aces.create_ODTs` definition with
+        a single *ODT* having a full / legal switch, as submitted by
+        :func:`aces_ocio.generate_config.create_config_data` definition.
+        """
+
+        luts = []
+        for name in ('Rec709.spi3d', 'InvRec709.spi3d'):
+            lut = os.path.join(self.__temporary_directory, name)
+            with open(lut, 'w') as fp:
+                fp.write('SPILUT 1.0')
+            luts.append(lut)
+
+        lut_directory = os.path.join(self.__temporary_directory, 'luts')
+        os.makedirs(lut_directory)
+
+        shaper_name = 'Log2 48 nits Shaper'
+        shaper_data = {}
+        for nits in ('48', '1000', '2000', '4000'):
+            name = shaper_name.replace('48', nits)
+            shaper_data[name] = (name, '', '', 1, {})
+
+        odt_info = {'ODT.Academy.Rec709_100nits_dim.a1.0.1': {
+            'transformID': 'ODT.Academy.Rec709_100nits_dim.a1.0.1',
+            'transformUserName': 'Rec.709',
+            'transformUserNamePrefix': 'Output',
+            'transformHasFullLegalSwitch': True,
+            'transformLUT': luts[0],
+            'transformLUTInverse': luts[1]}}
+
+        colorspaces, displays = create_ODTs(self.__temporary_directory,
+                                            lut_directory,
+                                            1024,
+                                            33,
+                                            odt_info,
+                                            shaper_name,
+                                            True,
+                                            'Raw',
+                                            'Log',
+                                            shaper_data)
+
+        self.assertListEqual([colorspace.name for colorspace in colorspaces],
+                             ['Rec.709'])
+        self.assertIs(displays['Rec.709']['Output Transform'], colorspaces[0])
+        self.assertEqual(shaper_data[shaper_name][-1]['legalRange'], 0)
+        self.assertNotIn('legalRange',
+                         odt_info['ODT.Academy.Rec709_100nits_dim.a1.0.1'])
+
+
+if __name__ == '__main__':
+    unittest.main()
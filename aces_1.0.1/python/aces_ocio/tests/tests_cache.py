@@ -0,0 +1,225 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Defines unit tests for the *aces_ocio.cache* module.
+"""
+
+from __future__ import division
+
+import os
+import shutil
+import sys
+import tempfile
+import unittest
+
+sys.path.append(os.path.abspath(
+    os.path.join(os.path.dirname(__file__), '..', '..')))
+
+from aces_ocio.cache import FileCache, Manifest, active_manifest
+
+__author__ = 'ACES Developers'
+__copyright__ = 'Copyright (C) 2014 - 2015 - ACES Developers'
+__license__ = ''
+__maintainer__ = 'ACES Developers'
+__email__ = 'aces@oscars.org'
+__status__ = 'Production'
+
+__all__ = ['TestFileCache',
+           'TestManifest']
+
+
+class TestFileCache(unittest.TestCase):
+    """
+    Performs tests on the :class:`aces_ocio.cache.FileCache` class.
+    """
+
+    def setUp(self):
+        """
+        Initialises common tests attributes.
+        """
+
+        self.__temporary_directory = tempfile.mkdtemp()
+        self.__cache = FileCache(
+            os.path.join(self.__temporary_directory, 'cache'))
+
+    def tearDown(self):
+        """
+        Post tests actions.
+        """
+
+        shutil.rmtree(self.__temporary_directory)
+
+    def write_file(self, name, content):
+        """
+        Writes given content to a file in the temporary directory.
+        """
+
+        path = os.path.join(self.__temporary_directory, name)
+        with open(path, 'w') as fp:
+            fp.write(content)
+        return path
+
+    def test_existing_directory(self):
+        """
+        Tests :class:`aces_ocio.cache.FileCache` class with an existing
+        directory.
+        """
+
+        cache = FileCache(os.path.join(self.__temporary_directory, 'cache'))
+
+        self.assertEqual(cache.size(), 0)
+        self.assertRaises(OSError,
+                          FileCache,
+                          self.write_file('cache.json', '{}'))
+
+    def test_key(self):
+        """
+        Tests :meth:`aces_ocio.cache.FileCache.key` method.
+        """
+
+        self.assertEqual(FileCache.key('lut', {'a': 1, 'b': 2}),
+                         FileCache.key('lut', {'b': 2, 'a': 1}))
+        self.assertNotEqual(FileCache.key('lut', 1024),
+                            FileCache.key('lut', 4096))
+
+    def test_get_put(self):
+        """
+        Tests :meth:`aces_ocio.cache.FileCache.get` and
+        :meth:`aces_ocio.cache.FileCache.put` methods.
+        """
+
+        key = FileCache.key('lut')
+        lut = self.write_file('lut.spi1d', 'Version 1')
+        restored = os.path.join(self.__temporary_directory, 'restored.spi1d')
+
+        self.assertFalse(self.__cache.get(key, [restored]))
+        self.__cache.put(key, [lut])
+        self.assertTrue(self.__cache.get(key, [restored]))
+
+        with open(restored) as fp:
+            self.assertEqual(fp.read(), 'Version 1')
+
+        self.assertEqual(self.__cache.hits, 1)
+        self.assertEqual(self.__cache.misses, 1)
+
+        # The entry stored first is kept.
+        self.__cache.put(key, [self.write_file('lut.spi1d', 'Version 2')])
+        self.assertTrue(self.__cache.get(key, [restored]))
+
+        with open(restored) as fp:
+            self.assertEqual(fp.read(), 'Version 1')
+        self.assertEqual(self.__cache.estimated_size, len('Version 1'))
+
+    def test_get_evicted(self):
+        """
+        Tests :meth:`aces_ocio.cache.FileCache.get` method with an entry
+        evicted concurrently while being restored.
+        """
+
+        key = FileCache.key('luts')
+        luts = [self.write_file('lut.spi1d', 'Version 1'),
+                self.write_file('lut.spi3d', 'Version 1')]
+        restored = [os.path.join(self.__temporary_directory, name)
+                    for name in ('restored.spi1d', 'restored.spi3d')]
+        self.__cache.put(key, luts)
+
+        restore = self.__cache.restore
+
+        def evicting_restore(source, destination):
+            restore(source, destination)
+            shutil.rmtree(self.__cache.entry_directory(key))
+
+        self.__cache.restore = evicting_restore
+
+        self.assertFalse(self.__cache.get(key, restored))
+        self.assertFalse(any(map(os.path.exists, restored)))
+        self.assertEqual(self.__cache.hits, 0)
+        self.assertEqual(self.__cache.misses, 1)
+
+    def test_evict(self):
+        """
+        Tests :meth:`aces_ocio.cache.FileCache.evict` method.
+        """
+
+        lut = self.write_file('lut.spi1d', '0123456789')
+
+        self.__cache.maximum_size = 25
+        keys = [FileCache.key('lut', i) for i in range(3)]
+        for i, key in enumerate(keys):
+            self.__cache.put(key, [lut])
+            # Ensuring distinct last use times.
+            os.utime(self.__cache.entry_directory(key), (i, i))
+        self.__cache.evict()
+
+        self.assertEqual(self.__cache.size(), 20)
+        self.assertFalse(os.path.exists(
+            self.__cache.entry_directory(keys[0])))
+
+
+class TestManifest(unittest.TestCase):
+    """
+    Performs tests on the :class:`aces_ocio.cache.Manifest` class.
+    """
+
+    def setUp(self):
+        """
+        Initialises common tests attributes.
+        """
+
+        self.__temporary_directory = tempfile.mkdtemp()
+
+    def tearDown(self):
+        """
+        Post tests actions.
+        """
+
+        shutil.rmtree(self.__temporary_directory)
+
+    def test_up_to_date(self):
+        """
+        Tests :meth:`aces_ocio.cache.Manifest.up_to_date` method.
+        """
+
+        lut = os.path.join(self.__temporary_directory, 'lut.spi1d')
+        with open(lut, 'w') as fp:
+            fp.write('Version 1')
+
+        manifest = Manifest(self.__temporary_directory)
+        with manifest:
+            self.assertIs(active_manifest(), manifest)
+            self.assertFalse(manifest.up_to_date(lut, 'key'))
+            manifest.record(lut, 'key')
+        manifest.save()
+        self.assertIsNone(active_manifest())
+
+        manifest = Manifest(self.__temporary_directory)
+        self.assertTrue(manifest.up_to_date(lut, 'key'))
+        self.assertFalse(manifest.up_to_date(lut, 'other key'))
+        self.assertFalse(Manifest(self.__temporary_directory,
+                                  reuse=False).up_to_date(lut, 'key'))
+
+    def test_prune(self):
+        """
+        Tests :meth:`aces_ocio.cache.Manifest.prune` method.
+        """
+
+        luts = [os.path.join(self.__temporary_directory, name)
+                for name in ('kept.spi1d', 'stale.spi1d')]
+        manifest = Manifest(self.__temporary_directory)
+        for lut in luts:
+            with open(lut, 'w') as fp:
+                fp.write('Version 1')
+            manifest.record(lut, 'key')
+        manifest.save()
+
+        manifest = Manifest(self.__temporary_directory)
+        manifest.record(luts[0], 'key')
+
+        self.assertListEqual(manifest.prune(), [luts[1]])
+        self.assertTrue(os.path.exists(luts[0]))
+        self.assertFalse(os.path.exists(luts[1]))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,74 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Defines unit tests for the *aces_ocio.colorspaces* module.
+"""
+
+from __future__ import division
+
+import os
+import sys
+import unittest
+
+sys.path.append(os.path.abspath(
+    os.path.join(os.path.dirname(__file__), '..', '..')))
+
+from aces_ocio.colorspaces import (
+    COLORSPACE_BUILDERS,
+    colorspace_builders,
+    load_colorspace_builder)
+
+__author__ = 'ACES Developers'
+__copyright__ = 'Copyright (C) 2014 - 2015 - ACES Developers'
+__license__ = ''
+__maintainer__ = 'ACES Developers'
+__email__ = 'aces@oscars.org'
+__status__ = 'Production'
+
+__all__ = ['TestColorSpaceBuilders']
+
+
+class TestColorSpaceBuilders(unittest.TestCase):
+    """
+    Performs tests on the colorspaces builders registry.
+    """
+
+    def test_colorspace_builders(self):
+        """
+        Tests :func:`aces_ocio.colorspaces.colorspace_builders` definition.
+        """
+
+        self.assertListEqual(colorspace_builders(entry_points=False),
+                             ['arri',
+                              'canon',
+                              'gopro',
+                              'panasonic',
+                              'red',
+                              'sony',
+                              'general'])
+        self.assertListEqual(
+            colorspace_builders()[:len(COLORSPACE_BUILDERS)],
+            list(COLORSPACE_BUILDERS))
+
+    def test_load_colorspace_builder(self):
+        """
+        Tests :func:`aces_ocio.colorspaces.load_colorspace_builder`
+        definition.
+        """
+
+        from aces_ocio.colorspaces import arri
+
+        self.assertIs(load_colorspace_builder('arri'), arri)
+
+        with self.assertRaises(ValueError) as context:
+            load_colorspace_builder('unknown')
+
+        message = str(context.exception)
+        self.assertIn('"unknown"', message)
+        for name in COLORSPACE_BUILDERS:
+            self.assertIn(name, message)
+
+
+if __name__ == '__main__':
+    unittest.main()
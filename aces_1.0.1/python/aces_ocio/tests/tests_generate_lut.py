@@ -0,0 +1,335 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Defines unit tests for the *aces_ocio.generate_lut* module.
+"""
+
+from __future__ import division
+
+import os
+import shutil
+import sys
+import tempfile
+import unittest
+
+import numpy
+
+sys.path.append(os.path.abspath(
+    os.path.join(os.path.dirname(__file__), '..', '..')))
+
+from aces_ocio.generate_lut import (
+    IdentityImagePool,
+    correct_LUT_image_data,
+    generate_1d_LUT_image,
+    generate_3d_identity_lattice,
+    lattice_from_image_data,
+    quantize_image_data,
+    resample_3d_lattice,
+    write_3DL_3d,
+    write_3d,
+    write_SPI_3d)
+
+__author__ = 'ACES Developers'
+__copyright__ = 'Copyright (C) 2014 - 2015 - ACES Developers'
+__license__ = ''
+__maintainer__ = 'ACES Developers'
+__email__ = 'aces@oscars.org'
+__status__ = 'Production'
+
+__all__ = ['identity_lattice',
+           'TestIdentityImagePool',
+           'TestQuantizeImageData',
+           'TestGenerate1dLUTImage',
+           'TestGenerate3dIdentityLattice',
+           'TestResample3dLattice',
+           'TestWriteSPI3d',
+           'TestWrite3DL3d',
+           'TestCorrectLUTImageData']
+
+
+def identity_lattice(resolution):
+    """
+    Returns the identity lattice of a 3D LUT with given resolution.
+    """
+
+    return lattice_from_image_data(
+        generate_3d_identity_lattice(resolution), resolution)
+
+
+class TestIdentityImagePool(unittest.TestCase):
+    """
+    Performs tests on the :class:`aces_ocio.generate_lut.IdentityImagePool`
+    class.
+    """
+
+    def test_cleanup(self):
+        """
+        Tests :meth:`aces_ocio.generate_lut.IdentityImagePool.cleanup`
+        method.
+        """
+
+        directories = [tempfile.mkdtemp(), tempfile.mkdtemp()]
+        try:
+            pool = IdentityImagePool()
+            pool.directory = directories[0]
+            pool.keep = True
+            pool.cleanup()
+
+            self.assertIsNone(pool.directory)
+            self.assertTrue(os.path.isdir(directories[0]))
+
+            pool.directory = directories[1]
+            pool.keep = False
+            pool.cleanup()
+
+            self.assertFalse(os.path.isdir(directories[1]))
+        finally:
+            for directory in directories:
+                shutil.rmtree(directory, ignore_errors=True)
+
+
+class TestQuantizeImageData(unittest.TestCase):
+    """
+    Performs tests on the :func:`aces_ocio.generate_lut.quantize_image_data`
+    definition.
+    """
+
+    def test_rounding(self):
+        """
+        Tests :func:`aces_ocio.generate_lut.quantize_image_data` definition
+        rounding half away from zero.
+        """
+
+        # 0.5 * 65535 = 32767.5 and -0.5 * 32767 = -16383.5
+        self.assertEqual(quantize_image_data([0.5], 'uint16')[0], 32768)
+        self.assertEqual(quantize_image_data([-0.5], 'sint16')[0], -16384)
+
+    def test_clamping(self):
+        """
+        Tests :func:`aces_ocio.generate_lut.quantize_image_data` definition
+        clamping to the integer types range.
+        """
+
+        for depth, type, minimum, maximum in (
+                ('uint8', numpy.uint8, 0, 255),
+                ('uint16', numpy.uint16, 0, 65535),
+                ('sint16', numpy.int16, -32768, 32767)):
+            data = quantize_image_data([-1.5, -0.5, 1.5], depth)
+
+            self.assertEqual(data.dtype, type)
+            self.assertEqual(data[0], minimum)
+            self.assertEqual(data[2], maximum)
+
+        self.assertEqual(quantize_image_data([-0.5], 'uint8')[0], 0)
+
+    def test_floating_point(self):
+        """
+        Tests :func:`aces_ocio.generate_lut.quantize_image_data` definition
+        with floating point bit depths.
+        """
+
+        values = [-0.5, 0.25, 1.5]
+        for depth, type in (('half', numpy.float16),
+                            ('float', numpy.float32)):
+            data = quantize_image_data(values, depth)
+
+            self.assertEqual(data.dtype, type)
+            numpy.testing.assert_array_equal(data, values)
+
+
+class TestGenerate1dLUTImage(unittest.TestCase):
+    """
+    Performs tests on the :func:`aces_ocio.generate_lut.generate_1d_LUT_image`
+    definition.
+    """
+
+    def test_generate_1d_LUT_image(self):
+        """
+        Tests :func:`aces_ocio.generate_lut.generate_1d_LUT_image` definition.
+        """
+
+        data = generate_1d_LUT_image(None, 5, -1, 3)
+
+        self.assertEqual(data.shape, (1, 5, 3))
+        self.assertEqual(data.dtype, numpy.float32)
+        numpy.testing.assert_array_equal(data[0, :, 0], [-1, 0, 1, 2, 3])
+
+        # Every channel holds the same ramp.
+        numpy.testing.assert_array_equal(data[0, :, 1], data[0, :, 0])
+        numpy.testing.assert_array_equal(data[0, :, 2], data[0, :, 0])
+
+
+class TestGenerate3dIdentityLattice(unittest.TestCase):
+    """
+    Performs tests on the
+    :func:`aces_ocio.generate_lut.generate_3d_identity_lattice` definition.
+    """
+
+    def test_generate_3d_identity_lattice(self):
+        """
+        Tests :func:`aces_ocio.generate_lut.generate_3d_identity_lattice`
+        definition.
+        """
+
+        data = generate_3d_identity_lattice(5)
+
+        self.assertEqual(data.shape, (5, 25, 3))
+
+        # Red changes fastest, then green, then blue.
+        pixels = data.reshape(-1, 3)
+        numpy.testing.assert_array_equal(pixels[0], [0, 0, 0])
+        numpy.testing.assert_array_equal(pixels[1], [0.25, 0, 0])
+        numpy.testing.assert_array_equal(pixels[5], [0, 0.25, 0])
+        numpy.testing.assert_array_equal(pixels[25], [0, 0, 0.25])
+        numpy.testing.assert_array_equal(pixels[-1], [1, 1, 1])
+
+
+class TestResample3dLattice(unittest.TestCase):
+    """
+    Performs tests on the :func:`aces_ocio.generate_lut.resample_3d_lattice`
+    definition.
+    """
+
+    def test_resample_3d_lattice(self):
+        """
+        Tests :func:`aces_ocio.generate_lut.resample_3d_lattice` definition.
+        """
+
+        numpy.testing.assert_allclose(
+            resample_3d_lattice(identity_lattice(65), 65, 17),
+            identity_lattice(17),
+            atol=1e-6)
+
+        lattice = resample_3d_lattice(identity_lattice(2) ** 2, 2, 3)
+        numpy.testing.assert_allclose(lattice[1, 1, 1], [0.5, 0.5, 0.5])
+
+
+class TestWriteSPI3d(unittest.TestCase):
+    """
+    Performs tests on the :func:`aces_ocio.generate_lut.write_SPI_3d`
+    definition.
+    """
+
+    def setUp(self):
+        """
+        Initialises common tests attributes.
+        """
+
+        self.__temporary_directory = tempfile.mkdtemp()
+        self.__lut = os.path.join(self.__temporary_directory, 'lut.spi3d')
+
+    def tearDown(self):
+        """
+        Post tests actions.
+        """
+
+        shutil.rmtree(self.__temporary_directory)
+
+    def test_write_SPI_3d(self):
+        """
+        Tests :func:`aces_ocio.generate_lut.write_SPI_3d` definition.
+        """
+
+        # Scaling each channel differently to tell them apart.
+        write_SPI_3d(self.__lut, identity_lattice(3) * [1, 0.5, 0.25], 3)
+
+        with open(self.__lut) as fp:
+            lines = fp.read().splitlines()
+
+        self.assertEqual(lines[:3], ['SPILUT 1.0', '3 3', '3 3 3'])
+        # Blue changes fastest.
+        self.assertEqual(lines[3:7], ['0 0 0 0 0 0',
+                                      '0 0 1 0 0 0.125',
+                                      '0 0 2 0 0 0.25',
+                                      '0 1 0 0 0.25 0'])
+        self.assertEqual(lines[12], '1 0 0 0.5 0 0')
+        self.assertEqual(lines[-1], '2 2 2 1 0.5 0.25')
+        self.assertEqual(len(lines), 3 + 3 ** 3)
+
+
+class TestWrite3DL3d(unittest.TestCase):
+    """
+    Performs tests on the :func:`aces_ocio.generate_lut.write_3DL_3d`
+    definition.
+    """
+
+    def setUp(self):
+        """
+        Initialises common tests attributes.
+        """
+
+        self.__temporary_directory = tempfile.mkdtemp()
+        self.__lut = os.path.join(self.__temporary_directory, 'lut.3dl')
+
+    def tearDown(self):
+        """
+        Post tests actions.
+        """
+
+        shutil.rmtree(self.__temporary_directory)
+
+    def read_lines(self):
+        """
+        Returns the lines of the written *LUT*.
+        """
+
+        with open(self.__lut) as fp:
+            return fp.read().splitlines()
+
+    def test_write_3DL_3d(self):
+        """
+        Tests :func:`aces_ocio.generate_lut.write_3DL_3d` definition.
+        """
+
+        write_3DL_3d(self.__lut, identity_lattice(7), 7)
+        lines = self.read_lines()
+
+        # 1023 / 6 = 170.5 is rounded half away from zero.
+        self.assertEqual(lines[0], '0 171 341 512 682 853 1023')
+        self.assertEqual(lines[1:3], ['0 0 0', '0 0 683'])
+        self.assertEqual(len(lines), 1 + 7 ** 3)
+
+        write_3DL_3d(self.__lut, identity_lattice(33), 33, 'lustre')
+        self.assertEqual(self.read_lines()[:2], ['3DMESH', 'Mesh 5 12'])
+
+        self.assertRaises(ValueError, write_3DL_3d,
+                          self.__lut, identity_lattice(64), 64, 'lustre')
+
+    def test_write_3d(self):
+        """
+        Tests :func:`aces_ocio.generate_lut.write_3d` definition with a
+        format having a default cube size.
+        """
+
+        write_3d(self.__lut, identity_lattice(65), 65, 'flame')
+
+        self.assertEqual(len(self.read_lines()), 1 + 17 ** 3)
+
+
+class TestCorrectLUTImageData(unittest.TestCase):
+    """
+    Performs tests on the
+    :func:`aces_ocio.generate_lut.correct_LUT_image_data` definition.
+    """
+
+    def test_correct_LUT_image_data(self):
+        """
+        Tests :func:`aces_ocio.generate_lut.correct_LUT_image_data`
+        definition.
+        """
+
+        data = generate_3d_identity_lattice(3)
+        self.assertIs(correct_LUT_image_data(data, 3), data)
+
+        # The image width and height are swapped but its pixels are stored in
+        # the expected order.
+        transposed = data.reshape(9, 3, 3)
+        corrected = correct_LUT_image_data(transposed, 3)
+
+        self.assertEqual(corrected.shape, (3, 9, 3))
+        numpy.testing.assert_array_equal(corrected.ravel(), data.ravel())
+
+
+if __name__ == '__main__':
+    unittest.main()
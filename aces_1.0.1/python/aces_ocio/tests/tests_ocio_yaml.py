@@ -0,0 +1,271 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Defines unit tests for the *aces_ocio.ocio_yaml* module.
+"""
+
+from __future__ import division
+
+import os
+import sys
+import unittest
+
+sys.path.append(os.path.abspath(
+    os.path.join(os.path.dirname(__file__), '..', '..')))
+
+from aces_ocio import ocio_yaml
+from aces_ocio.generate_config import create_config
+from aces_ocio.ocio_yaml import (
+    ColorSpace,
+    Config,
+    Constants,
+    FileTransform,
+    GroupTransform,
+    MatrixTransform,
+    format_string)
+from aces_ocio.utilities import ColorSpace as ACESColorSpace
+
+__author__ = 'ACES Developers'
+__copyright__ = 'Copyright (C) 2014 - 2015 - ACES Developers'
+__license__ = ''
+__maintainer__ = 'ACES Developers'
+__email__ = 'aces@oscars.org'
+__status__ = 'Production'
+
+__all__ = ['CONFIG',
+           'TestFormatString',
+           'TestConfig',
+           'TestCreateConfig']
+
+# The *OCIO* v1 serializer output for the configuration of *TestConfig*.
+CONFIG = """ocio_profile_version: 1
+
+search_path: luts
+strictparsing: true
+luma: [0.2126, 0.7152, 0.0722]
+
+description: An ACES config generated from python
+
+roles:
+  data: Utility - Raw
+  reference: ACES - ACES2065-1
+
+displays:
+  ACES:
+    - !<View> {name: sRGB D60 sim., colorspace: ACES - ACEScc}
+    - !<View> {name: Raw, colorspace: Utility - Raw}
+
+active_displays: [ACES]
+active_views: [sRGB D60 sim., Raw]
+
+colorspaces:
+  - !<ColorSpace>
+    name: ACES - ACES2065-1
+    family: ACES
+    equalitygroup: ""
+    bitdepth: 32f
+    description: |
+      The Academy Color Encoding System reference color space
+    isdata: false
+    allocation: lg2
+    allocationvars: [-8, 5, 0.00390625]
+
+  - !<ColorSpace>
+    name: ACES - ACEScc
+    family: ACES
+    equalitygroup: ""
+    bitdepth: 32f
+    description: |
+      The ACEScc color space
+      ACES Transform ID : ACEScsc.ACEScc_to_ACES.a1.0.1
+    isdata: false
+    allocation: uniform
+    allocationvars: [-0.3584, 1.468]
+    to_reference: !<GroupTransform>
+      children:
+        - !<FileTransform> {src: ACEScc_to_linear.spi1d, interpolation: linear}
+        - !<MatrixTransform> {matrix: [0.695452, 0.140679, 0.163869, 0, 0.0447946, 0.859671, 0.0955343, 0, -0.00552588, 0.00402521, 1.0015, 0, 0, 0, 0, 1]}
+
+  - !<ColorSpace>
+    name: Utility - Raw
+    family: Utility
+    equalitygroup: ""
+    bitdepth: 32f
+    isdata: true
+    allocation: uniform
+    from_reference: !<MatrixTransform> {}
+"""
+
+
+class TestFormatString(unittest.TestCase):
+    """
+    Performs tests on the :func:`aces_ocio.ocio_yaml.format_string`
+    definition.
+    """
+
+    def test_format_string(self):
+        """
+        Tests :func:`aces_ocio.ocio_yaml.format_string` definition.
+        """
+
+        self.assertEqual(format_string('Output - sRGB (D60 sim.)'),
+                         'Output - sRGB (D60 sim.)')
+        self.assertEqual(format_string('luts:custom'), 'luts:custom')
+        self.assertEqual(format_string(''), '""')
+        self.assertEqual(format_string('- Raw'), '"- Raw"')
+        self.assertEqual(format_string('Raw: Linear'), '"Raw: Linear"')
+        self.assertEqual(format_string('sRGB, Rec.709'), 'sRGB, Rec.709')
+        self.assertEqual(format_string('sRGB, Rec.709', flow=True),
+                         '"sRGB, Rec.709"')
+        self.assertEqual(format_string('Raw\n"Data"'),
+                         '"Raw\\x0a\\"Data\\""')
+
+
+class TestConfig(unittest.TestCase):
+    """
+    Performs tests on the :class:`aces_ocio.ocio_yaml.Config` class.
+    """
+
+    def setUp(self):
+        """
+        Initialises common tests attributes.
+        """
+
+        self.__config = Config()
+        self.__config.setDescription('An ACES config generated from python')
+        self.__config.setSearchPath('luts')
+
+        self.__config.addColorSpace(ColorSpace(
+            name='ACES - ACES2065-1',
+            family='ACES',
+            description=('The Academy Color Encoding System reference color '
+                         'space'),
+            bitDepth=Constants.BIT_DEPTH_F32,
+            allocation=Constants.ALLOCATION_LG2,
+            allocationVars=[-8, 5, 0.00390625]))
+
+        colorspace = ColorSpace(
+            name='ACES - ACEScc',
+            family='ACES',
+            description=('The ACEScc color space\nACES Transform ID : '
+                         'ACEScsc.ACEScc_to_ACES.a1.0.1'),
+            bitDepth=Constants.BIT_DEPTH_F32,
+            allocationVars=[-0.3584, 1.468])
+        file_transform = FileTransform()
+        file_transform.setSrc('ACEScc_to_linear.spi1d')
+        file_transform.setInterpolation(Constants.INTERP_LINEAR)
+        matrix_transform = MatrixTransform()
+        matrix_transform.setMatrix([0.6954522414, 0.1406786965,
+                                    0.1638690622, 0,
+                                    0.0447945634, 0.8596711185,
+                                    0.0955343182, 0,
+                                    -0.0055258826, 0.0040252103,
+                                    1.0015006723, 0,
+                                    0, 0, 0, 1])
+        group_transform = GroupTransform()
+        group_transform.push_back(file_transform)
+        group_transform.push_back(matrix_transform)
+        colorspace.setTransform(group_transform,
+                                Constants.COLORSPACE_DIR_TO_REFERENCE)
+        self.__config.addColorSpace(colorspace)
+
+        colorspace = ColorSpace(name='Utility - Raw',
+                                family='Utility',
+                                bitDepth=Constants.BIT_DEPTH_F32,
+                                isData=True)
+        colorspace.setTransform(MatrixTransform(),
+                                Constants.COLORSPACE_DIR_FROM_REFERENCE)
+        self.__config.addColorSpace(colorspace)
+
+        self.__config.setRole(Constants.ROLE_REFERENCE, 'ACES - ACES2065-1')
+        self.__config.setRole(Constants.ROLE_DATA, 'Utility - Raw')
+
+        self.__config.addDisplay('ACES', 'sRGB D60 sim.', 'Utility - Raw')
+        self.__config.addDisplay('ACES', 'Raw', 'Utility - Raw')
+        self.__config.addDisplay('aces', 'sRGB D60 sim.', 'ACES - ACEScc')
+        self.__config.setActiveDisplays('ACES')
+        self.__config.setActiveViews('sRGB D60 sim., Raw')
+
+    def test_serialize(self):
+        """
+        Tests :meth:`aces_ocio.ocio_yaml.Config.serialize` method.
+        """
+
+        self.assertMultiLineEqual(self.__config.serialize(), CONFIG)
+
+    def test_sanity_check(self):
+        """
+        Tests :meth:`aces_ocio.ocio_yaml.Config.sanityCheck` method.
+        """
+
+        self.__config.sanityCheck()
+
+        self.__config.setRole(Constants.ROLE_SCENE_LINEAR, 'ACES - ACEScg')
+        self.assertRaises(ValueError, self.__config.sanityCheck)
+
+
+class TestCreateConfig(unittest.TestCase):
+    """
+    Performs tests on the :func:`aces_ocio.generate_config.create_config`
+    definition with the :mod:`aces_ocio.ocio_yaml` backend.
+    """
+
+    def test_create_config(self):
+        """
+        Tests :func:`aces_ocio.generate_config.create_config` definition with
+        the :mod:`aces_ocio.ocio_yaml` backend.
+        """
+
+        reference = ACESColorSpace('ACES2065-1', family='ACES')
+        acescc = ACESColorSpace('ACEScc',
+                                family='ACES',
+                                description='The ACEScc color space',
+                                allocation_vars=[-0.3584, 1.468])
+        acescc.to_reference_transforms = [
+            {'type': 'lutFile',
+             'path': 'ACEScc_to_linear.spi1d',
+             'interpolation': 'linear'}]
+        raw = ACESColorSpace('Raw', family='Utility', is_data=True)
+
+        config_data = {'referenceColorSpace': reference,
+                       'colorSpaces': [acescc, raw],
+                       'roles': {'color_picking': 'ACEScc',
+                                 'color_timing': 'ACEScc',
+                                 'compositing_log': 'ACEScc',
+                                 'data': 'Raw',
+                                 'default': 'ACES2065-1',
+                                 'matte_paint': 'ACEScc',
+                                 'reference': 'Raw',
+                                 'scene_linear': 'ACES2065-1',
+                                 'texture_paint': 'Raw'},
+                       'displays': {'ACES': {'Output Transform': acescc,
+                                             'Raw': raw}},
+                       'defaultDisplay': 'ACES'}
+
+        config = create_config(config_data, prefix=True, backend=ocio_yaml)
+        config.sanityCheck()
+        serialized = config.serialize()
+
+        self.assertIsInstance(config, Config)
+        self.assertIn('  data: Utility - Raw\n', serialized)
+        self.assertIn('active_views: [ACES, Raw, Log]\n', serialized)
+        self.assertIn(
+            '    - !<View> {name: ACES, colorspace: ACES - ACEScc}\n',
+            serialized)
+        self.assertIn("""    name: ACES - ACEScc
+    family: ACES
+    equalitygroup: ""
+    bitdepth: 32f
+    description: |
+      The ACEScc color space
+    isdata: false
+    allocation: uniform
+    allocationvars: [-0.3584, 1.468]
+    to_reference: !<FileTransform> {src: ACEScc_to_linear.spi1d, \
+interpolation: linear}
+""", serialized)
+
+
+if __name__ == '__main__':
+    unittest.main()
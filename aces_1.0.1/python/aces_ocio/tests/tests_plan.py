@@ -0,0 +1,109 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Defines unit tests for the *aces_ocio.plan* module.
+"""
+
+from __future__ import division
+
+import os
+import sys
+import unittest
+
+sys.path.append(os.path.abspath(
+    os.path.join(os.path.dirname(__file__), '..', '..')))
+
+from aces_ocio.plan import Plan, active_plan
+
+__author__ = 'ACES Developers'
+__copyright__ = 'Copyright (C) 2014 - 2015 - ACES Developers'
+__license__ = ''
+__maintainer__ = 'ACES Developers'
+__email__ = 'aces@oscars.org'
+__status__ = 'Production'
+
+__all__ = ['TestPlan']
+
+
+class TestPlan(unittest.TestCase):
+    """
+    Performs tests on the :class:`aces_ocio.plan.Plan` class.
+    """
+
+    def setUp(self):
+        """
+        Initialises common tests attributes.
+        """
+
+        self.__plan = Plan()
+        with self.__plan as plan:
+            self.assertIs(active_plan(), plan)
+            plan.add_3d_LUT('a.spi3d', 32, 'half', 12)
+            plan.add_3d_LUT('b.spi3d', 32, 'half', 12)
+            plan.add_1d_LUTs(['c.spi1d'], [4096], 'uint16', 6)
+            plan.add_cached('d.spi1d')
+        self.assertIsNone(active_plan())
+
+    def test_stage_counts(self):
+        """
+        Tests :meth:`aces_ocio.plan.Plan.stage_counts` method.
+        """
+
+        counts = self.__plan.stage_counts()
+
+        self.assertListEqual(counts['identity'], [1, 0])
+        self.assertListEqual(counts['convert'], [1, 0])
+        self.assertListEqual(counts['render'], [3, 0])
+        self.assertListEqual(counts['extract'], [3, 1])
+
+    def test_disk_usage(self):
+        """
+        Tests :meth:`aces_ocio.plan.Plan.disk_usage` method.
+        """
+
+        identity = 32 ** 3 * 12
+        render = 32 ** 3 * 3 * 4
+
+        self.assertTupleEqual(
+            self.__plan.disk_usage(),
+            (identity + 2 * render + 4096 * 6 + 4096 * 3 * 4,
+             identity + render))
+
+    def test_estimated_runtime(self):
+        """
+        Tests :meth:`aces_ocio.plan.Plan.estimated_runtime` method.
+        """
+
+        runtime = self.__plan.estimated_runtime(
+            {'render': {'seconds': 2, 'units': 32 ** 3}}, 1)
+
+        self.assertAlmostEqual(runtime['render'], 4 + 2 * 4096 / 32 ** 3)
+
+    def test_workers(self):
+        """
+        Tests :class:`aces_ocio.plan.Plan` class estimates with concurrent
+        colorspaces builders.
+        """
+
+        self.__plan.workers = 2
+
+        identity = 32 ** 3 * 12
+        render = 32 ** 3 * 3 * 4
+
+        self.assertEqual(self.__plan.disk_usage()[1],
+                         identity + 2 * render)
+
+        runtime = self.__plan.estimated_runtime(
+            {'identity': {'seconds': 1, 'units': 32 ** 3},
+             'render': {'seconds': 2, 'units': 32 ** 3}}, 1)
+
+        # The shared 3D identity image is created once, before the workers
+        # start.
+        self.assertAlmostEqual(runtime['identity'], 1)
+        self.assertAlmostEqual(runtime['render'],
+                               (4 + 2 * 4096 / 32 ** 3) / 2)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,435 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Defines unit tests for the *aces_ocio.process* module.
+"""
+
+from __future__ import division
+
+import datetime
+import json
+import os
+import shutil
+import sys
+import tempfile
+import threading
+import unittest
+
+sys.path.append(os.path.abspath(
+    os.path.join(os.path.dirname(__file__), '..', '..')))
+
+from aces_ocio.cache import FileCache
+from aces_ocio.process import (
+    AdmissionController,
+    JSONLinesSink,
+    Process,
+    ProcessList,
+    execute_all)
+
+__author__ = 'ACES Developers'
+__copyright__ = 'Copyright (C) 2014 - 2015 - ACES Developers'
+__license__ = ''
+__maintainer__ = 'ACES Developers'
+__email__ = 'aces@oscars.org'
+__status__ = 'Production'
+
+__all__ = ['quiet_process',
+           'TestAdmissionController',
+           'TestProcess',
+           'TestProcessList']
+
+
+def quiet_process(description, cmd, args=None):
+    """
+    Returns a process that doesn't echo its output.
+    """
+
+    process = Process(description, cmd, args)
+    process.echo = False
+    return process
+
+
+class TestAdmissionController(unittest.TestCase):
+    """
+    Performs tests on the :class:`aces_ocio.process.AdmissionController`
+    class.
+    """
+
+    def test_admit(self):
+        """
+        Tests :meth:`aces_ocio.process.AdmissionController.admit` method.
+        """
+
+        controller = AdmissionController(memory=10, disk=10)
+        events = []
+
+        def job(name, memory):
+            with controller.admit(memory, 1):
+                events.append('start %s' % name)
+                events.append('end %s' % name)
+
+        # A job larger than the budgets is admitted when it is alone.
+        job('large', 20)
+
+        controller.acquire(8, 1)
+        thread = threading.Thread(target=job, args=('waiting', 8))
+        thread.start()
+        thread.join(0.2)
+        self.assertTrue(thread.is_alive())
+        events.append('release')
+        controller.release(8, 1)
+        thread.join()
+
+        self.assertListEqual(events, ['start large',
+                                      'end large',
+                                      'release',
+                                      'start waiting',
+                                      'end waiting'])
+        self.assertEqual(controller.admitted.value, 0)
+
+
+class TestProcess(unittest.TestCase):
+    """
+    Performs tests on the :class:`aces_ocio.process.Process` class.
+    """
+
+    def test_execute_all(self):
+        """
+        Tests :func:`aces_ocio.process.execute_all` definition.
+        """
+
+        processes = [quiet_process('true', 'true'),
+                     quiet_process('false', 'false')]
+
+        self.assertListEqual(execute_all(processes), [0, 1])
+        self.assertTrue(all(process.done() for process in processes))
+
+    def test_bounded_log(self):
+        """
+        Tests :class:`aces_ocio.process.Process` class bounded output
+        capture.
+        """
+
+        process = Process('seq', 'seq', ['1', '100'], log_lines=3)
+        process.echo = False
+        process.execute()
+
+        self.assertListEqual(list(process.log), ['98', '99', '100'])
+        self.assertEqual(process.log_line_count, 100)
+        self.assertEqual(process.log_byte_count, 292)
+
+        process = Process('seq', 'seq', ['1', '100'], log_bytes=8)
+        process.echo = False
+        process.execute()
+
+        self.assertListEqual(list(process.log), ['99', '100'])
+
+    def test_account_resources(self):
+        """
+        Tests :meth:`aces_ocio.process.Process.account_resources` method.
+        """
+
+        process = quiet_process('true', 'true')
+        process.execute()
+
+        self.assertEqual(process.status, 0)
+        if hasattr(os, 'wait4'):
+            self.assertLessEqual(
+                set(['user_time', 'system_time', 'max_rss', 'read_bytes',
+                     'write_bytes']),
+                set(process.resources))
+            self.assertGreater(process.resources['max_rss'], 0)
+
+            # Every child has its own maximum resident set size, even when
+            # smaller than the one of a child reaped before it.
+            process = quiet_process('false', 'false')
+            process.execute()
+
+            self.assertEqual(process.status, 1)
+            self.assertGreater(process.resources['max_rss'], 0)
+
+    def test_timeouts(self):
+        """
+        Tests :class:`aces_ocio.process.Process` class timeouts.
+        """
+
+        process = Process('sleep', 'sleep', ['10'], timeout=0.2)
+        process.echo = False
+        process.execute()
+
+        self.assertNotEqual(process.status, 0)
+        self.assertEqual(process.terminated, 'timeout')
+        self.assertLess(process.end - process.start,
+                        datetime.timedelta(seconds=5))
+
+        process = Process('sleep', 'sh', ['-c', 'echo start; exec sleep 10'],
+                          idle_timeout=0.2)
+        process.echo = False
+        process.execute()
+
+        self.assertEqual(process.terminated, 'idle timeout')
+
+    def test_cancel(self):
+        """
+        Tests :meth:`aces_ocio.process.Process.cancel` method.
+        """
+
+        process = quiet_process('true', 'true')
+        process.cancel()
+        process.execute()
+
+        self.assertEqual(process.status, -1)
+        self.assertEqual(process.terminated, 'cancelled')
+
+        process.execute()
+
+        self.assertEqual(process.status, 0)
+        self.assertEqual(process.terminated, None)
+
+        process = quiet_process('sleep', 'sleep', ['10'])
+        timer = threading.Timer(0.2, process.cancel)
+        timer.start()
+        process.execute()
+        timer.join()
+
+        self.assertEqual(process.terminated, 'cancelled')
+
+        process.args = ['0']
+        process.execute()
+
+        self.assertEqual(process.status, 0)
+
+    def test_memoize(self):
+        """
+        Tests :meth:`aces_ocio.process.Process.memoize` method.
+        """
+
+        temporary_directory = tempfile.mkdtemp()
+        try:
+            cache = FileCache(os.path.join(temporary_directory, 'cache'))
+            source = os.path.join(temporary_directory, 'source.txt')
+            target = os.path.join(temporary_directory, 'target.txt')
+            with open(source, 'w') as fp:
+                fp.write('Version 1')
+
+            def copy():
+                process = quiet_process('copy', 'cp', ['-v', source, target])
+                process.memoize(inputs=[source], outputs=[target], cache=cache)
+                process.execute()
+                return process
+
+            self.assertEqual(copy().status, 0)
+            self.assertEqual(cache.misses, 1)
+
+            os.remove(target)
+            process = copy()
+            self.assertEqual(process.status, 0)
+            self.assertEqual(cache.hits, 1)
+            self.assertEqual(len(process.log), 1)
+            with open(target) as fp:
+                self.assertEqual(fp.read(), 'Version 1')
+        finally:
+            shutil.rmtree(temporary_directory)
+
+
+class TestProcessList(unittest.TestCase):
+    """
+    Performs tests on the :class:`aces_ocio.process.ProcessList` class.
+    """
+
+    def test_execute_graph(self):
+        """
+        Tests :meth:`aces_ocio.process.ProcessList.execute_graph` method.
+        """
+
+        process_list = ProcessList('graph', parallel=True, workers=2)
+        identity = process_list.add(quiet_process('identity', 'true'))
+        render = process_list.add(quiet_process('render', 'true'),
+                                  [identity])
+        process_list.add(quiet_process('extract', 'true'), [render])
+        process_list.execute()
+
+        self.assertEqual(process_list.status, 0)
+        self.assertListEqual([child.status
+                              for child in process_list.processes],
+                             [0, 0, 0])
+        self.assertLessEqual(identity.end, render.start)
+
+    def test_execute_graph_failure(self):
+        """
+        Tests :meth:`aces_ocio.process.ProcessList.execute_graph` method
+        when a child fails.
+        """
+
+        process_list = ProcessList('graph', blocking=False, parallel=True)
+        render = process_list.add(quiet_process('render', 'false'))
+        process_list.add(quiet_process('extract', 'true'), [render])
+        process_list.add(quiet_process('bake', 'true'))
+        process_list.execute()
+
+        # Non-blocking lists report a success, as when executed sequentially.
+        self.assertEqual(process_list.status, 0)
+        self.assertListEqual([child.status
+                              for child in process_list.processes],
+                             [1, -1, 0])
+
+    def test_execute_graph_cancellation(self):
+        """
+        Tests :meth:`aces_ocio.process.ProcessList.execute_graph` method
+        cancellation of the running children when a child fails.
+        """
+
+        process_list = ProcessList('graph', parallel=True, workers=2)
+        sleep = process_list.add(quiet_process('sleep', 'sleep', ['10']))
+        process_list.add(quiet_process('render', 'sh',
+                                       ['-c', 'sleep 0.2; false']))
+        process_list.execute()
+
+        self.assertEqual(process_list.status, -1)
+        self.assertEqual(sleep.terminated, 'cancelled')
+        self.assertLess(process_list.end - process_list.start,
+                        datetime.timedelta(seconds=5))
+
+    def test_execute_graph_straggler(self):
+        """
+        Tests :meth:`aces_ocio.process.ProcessList.execute_graph` method
+        speculative execution of stragglers.
+        """
+
+        temporary_directory = tempfile.mkdtemp()
+        try:
+            marker = os.path.join(temporary_directory, 'marker')
+            output = os.path.join(temporary_directory, 'output.txt')
+
+            process_list = ProcessList('graph', parallel=True, workers=2,
+                                       straggler_factor=2)
+            straggler = process_list.add(quiet_process(
+                'straggler', 'sh',
+                ['-c',
+                 'test -e %s && { echo done > "$1"; exit 0; }; touch %s; '
+                 'echo partial > "$1"; exec sleep 10' % (marker, marker),
+                 'sh',
+                 output]))
+            straggler.outputs = [output]
+            for i in range(3):
+                process_list.add(quiet_process('bake', 'true'))
+            process_list.execute()
+
+            with open(output) as fp:
+                content = fp.read().strip()
+            files = sorted(os.listdir(temporary_directory))
+        finally:
+            shutil.rmtree(temporary_directory)
+
+        self.assertEqual(process_list.status, 0)
+        self.assertEqual(straggler.status, 0)
+        self.assertEqual(straggler.terminated, None)
+        self.assertEqual(content, 'done')
+        self.assertListEqual(files, ['marker', 'output.txt'])
+        self.assertLess(process_list.end - process_list.start,
+                        datetime.timedelta(seconds=5))
+
+    def test_execute_graph_cycle(self):
+        """
+        Tests :meth:`aces_ocio.process.ProcessList.execute_graph` method
+        with circular dependencies.
+        """
+
+        process_list = ProcessList('graph', parallel=True)
+        bake = process_list.add(quiet_process('bake', 'true'))
+        render = quiet_process('render', 'true')
+        extract = quiet_process('extract', 'true')
+        process_list.add(render, [extract])
+        process_list.add(extract, [render])
+
+        self.assertRaises(ValueError, process_list.execute)
+        self.assertIsNone(bake.start)
+        self.assertEqual(process_list.status, -1)
+        self.assertIsNotNone(process_list.end)
+
+    def test_write_trace_to_disk(self):
+        """
+        Tests :meth:`aces_ocio.process.Process.write_trace_to_disk` method.
+        """
+
+        process_list = ProcessList('graph', parallel=True, workers=2)
+        process_list.add(quiet_process('render', 'sleep', ['0.1']))
+        process_list.add(quiet_process('bake', 'sleep', ['0.1']))
+        process_list.execute()
+
+        temporary_directory = tempfile.mkdtemp()
+        try:
+            trace_filename = os.path.join(temporary_directory, 'trace.json')
+            process_list.write_trace_to_disk(trace_filename)
+            with open(trace_filename) as fp:
+                events = json.load(fp)['traceEvents']
+        finally:
+            shutil.rmtree(temporary_directory)
+
+        lanes = dict((event['name'], event['tid'])
+                     for event in events if event['ph'] == 'X')
+        self.assertEqual(lanes['graph'], 0)
+        self.assertNotEqual(lanes['render'], lanes['bake'])
+
+    def test_json_lines_sink(self):
+        """
+        Tests :class:`aces_ocio.process.JSONLinesSink` class.
+        """
+
+        temporary_directory = tempfile.mkdtemp()
+        try:
+            log_filename = os.path.join(temporary_directory, 'log.jsonl')
+
+            process_list = ProcessList('list', blocking=False)
+            process_list.sink = JSONLinesSink(log_filename)
+            process_list.add(quiet_process('true', 'true'))
+            process_list.add(quiet_process('false', 'false'))
+            process_list.execute()
+            process_list.sink.close()
+
+            with open(log_filename) as fp:
+                records = [json.loads(line) for line in fp]
+        finally:
+            shutil.rmtree(temporary_directory)
+
+        self.assertListEqual(
+            [(record['event'], record['description'], record['status'])
+             for record in records],
+            [('start', 'list', None),
+             ('start', 'true', None),
+             ('finish', 'true', 0),
+             ('start', 'false', None),
+             ('finish', 'false', 1),
+             ('finish', 'list', 0)])
+
+    def test_write_log_to_disk_json_lines(self):
+        """
+        Tests :meth:`aces_ocio.process.Process.write_log_to_disk` method with
+        the *JSON Lines* format.
+        """
+
+        process_list = ProcessList('list')
+        process_list.add(quiet_process('true', 'true'))
+        process_list.execute()
+
+        temporary_directory = tempfile.mkdtemp()
+        try:
+            log_filename = os.path.join(temporary_directory, 'log.jsonl')
+            process_list.write_log_to_disk(log_filename, format='jsonl')
+
+            with open(log_filename) as fp:
+                records = [json.loads(line) for line in fp]
+        finally:
+            shutil.rmtree(temporary_directory)
+
+        self.assertNotIsInstance(process_list.records(), list)
+        self.assertListEqual(
+            [(record['event'], record['description'], record['status'])
+             for record in records],
+            [('finish', 'list', 0),
+             ('finish', 'true', 0)])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,115 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Defines unit tests for the *aces_ocio.utilities* module.
+"""
+
+from __future__ import division
+
+import os
+import sys
+import unittest
+
+sys.path.append(os.path.abspath(
+    os.path.join(os.path.dirname(__file__), '..', '..')))
+
+from aces_ocio.utilities import ColorSpace, ColorSpaceRegistry, LazyModule
+
+__author__ = 'ACES Developers'
+__copyright__ = 'Copyright (C) 2014 - 2015 - ACES Developers'
+__license__ = ''
+__maintainer__ = 'ACES Developers'
+__email__ = 'aces@oscars.org'
+__status__ = 'Production'
+
+__all__ = ['TestLazyModule',
+           'TestColorSpaceRegistry']
+
+
+class TestLazyModule(unittest.TestCase):
+    """
+    Performs tests on the :class:`aces_ocio.utilities.LazyModule` class.
+    """
+
+    def test_lazy_import(self):
+        """
+        Tests :class:`aces_ocio.utilities.LazyModule` class import on first
+        attribute access.
+        """
+
+        sys.modules.pop('colorsys', None)
+
+        colorsys = LazyModule('colorsys')
+        self.assertNotIn('colorsys', sys.modules)
+
+        self.assertTupleEqual(colorsys.rgb_to_hsv(1, 0, 0), (0, 1, 1))
+        self.assertIn('colorsys', sys.modules)
+
+
+class TestColorSpaceRegistry(unittest.TestCase):
+    """
+    Performs tests on the :class:`aces_ocio.utilities.ColorSpaceRegistry`
+    class.
+    """
+
+    def setUp(self):
+        """
+        Initialises common tests attributes.
+        """
+
+        self.__reference = ColorSpace('ACES2065-1', family='ACES')
+        self.__colorspaces = [
+            ColorSpace('V-Log',
+                       aliases=['crv_vlog'],
+                       family='Input/Panasonic'),
+            ColorSpace('ACEScc', aliases=['acescc'], family='ACES'),
+            ColorSpace('Raw', family='Utility'),
+            ColorSpace('ACEScg', family='aces')]
+
+    def test_get(self):
+        """
+        Tests :meth:`aces_ocio.utilities.ColorSpaceRegistry.get` and
+        :meth:`aces_ocio.utilities.ColorSpaceRegistry.get_by_alias` methods.
+        """
+
+        registry = ColorSpaceRegistry(self.__reference, self.__colorspaces)
+
+        self.assertIs(registry.get('ACEScc'), self.__colorspaces[1])
+        self.assertIs(registry.get('ACES2065-1'), self.__reference)
+        self.assertIsNone(registry.get('acescc'))
+        self.assertIs(registry.get_by_alias('acescc'), self.__colorspaces[1])
+        self.assertIn('Raw', registry)
+        self.assertEqual(len(registry), 4)
+
+    def test_by_family(self):
+        """
+        Tests :meth:`aces_ocio.utilities.ColorSpaceRegistry.by_family` method.
+        """
+
+        registry = ColorSpaceRegistry(self.__reference, self.__colorspaces)
+
+        self.assertListEqual(
+            [colorspace.name for colorspace in registry.by_family()],
+            ['ACEScc', 'ACEScg', 'V-Log', 'Raw'])
+        self.assertListEqual(registry.family('ACES'),
+                             [self.__colorspaces[1], self.__colorspaces[3]])
+
+    def test_resolve(self):
+        """
+        Tests :meth:`aces_ocio.utilities.ColorSpaceRegistry.resolve` method.
+        """
+
+        registry = ColorSpaceRegistry(self.__reference,
+                                      self.__colorspaces,
+                                      prefix=True)
+
+        self.assertEqual(registry.resolve('V-Log'),
+                         'Input - Panasonic - V-Log')
+        self.assertEqual(registry.resolve('ACES2065-1'), 'ACES - ACES2065-1')
+        self.assertEqual(registry.resolve('Unknown'), 'Unknown')
+        self.assertEqual(self.__colorspaces[0].name, 'V-Log')
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -7,12 +7,13 @@ Defines various package utilities objects.
 
 from __future__ import division
 
+import importlib
 import itertools
 import os
 import re
 from collections import OrderedDict
 
-import PyOpenColorIO as ocio
+from aces_ocio.ocio_yaml import Constants
 
 __author__ = 'ACES Developers'
 __copyright__ = 'Copyright (C) 2014 - 2015 - ACES Developers'
@@ -21,7 +22,8 @@ __maintainer__ = 'ACES Developers'
 __email__ = 'aces@oscars.org'
 __status__ = 'Production'
 
-__all__ = ['ColorSpace',
+__all__ = ['LazyModule',
+           'ColorSpace',
            'mat44_from_mat33',
            'filter_words',
            'files_walker',
@@ -29,9 +31,43 @@ __all__ = ['ColorSpace',
            'sanitize',
            'compact',
            'colorspace_prefixed_name',
+           'ColorSpaceRegistry',
            'unpack_default']
 
 
+class LazyModule(object):
+    """
+    A module imported on first attribute access, deferring the import of the
+    heavy modules, e.g. *PyOpenColorIO*, until they are used.
+    """
+
+    def __init__(self, name):
+        """
+        Constructor for LazyModule class
+
+        Parameters
+        ----------
+        name : str or unicode
+            The absolute name of the module
+
+        Returns
+        -------
+        None
+        """
+
+        self.__name = name
+        self.__module = None
+
+    def __getattr__(self, attribute):
+        if self.__module is None:
+            self.__module = importlib.import_module(self.__name)
+
+        return getattr(self.__module, attribute)
+
+    def __repr__(self):
+        return '<lazy module %r>' % self.__name
+
+
 class ColorSpace(object):
     """
     A container for data needed to define an *OCIO* *ColorSpace*.
@@ -41,13 +77,13 @@ class ColorSpace(object):
                  name,
                  aliases=None,
                  description=None,
-                 bit_depth=ocio.Constants.BIT_DEPTH_F32,
+                 bit_depth=None,
                  equality_group='',
                  family=None,
                  is_data=False,
                  to_reference_transforms=None,
                  from_reference_transforms=None,
-                 allocation_type=ocio.Constants.ALLOCATION_UNIFORM,
+                 allocation_type=None,
                  allocation_vars=None,
                  aces_transform_id=None):
         """
@@ -67,12 +103,18 @@ class ColorSpace(object):
         if aliases is None:
             aliases = []
 
+        if bit_depth is None:
+            bit_depth = Constants.BIT_DEPTH_F32
+
         if to_reference_transforms is None:
             to_reference_transforms = []
 
         if from_reference_transforms is None:
             from_reference_transforms = []
 
+        if allocation_type is None:
+            allocation_type = Constants.ALLOCATION_UNIFORM
+
         if allocation_vars is None:
             allocation_vars = [0, 1]
 
@@ -283,6 +325,209 @@ def colorspace_prefixed_name(colorspace):
     return '%s - %s' % (prefix, colorspace.name)
 
 
+class ColorSpaceRegistry(object):
+    """
+    Indexes colorspaces by name, alias and family. The colorspaces names
+    written in the *OCIO* config, e.g. prefixed with their family names, are
+    resolved by the registry instead of being set on the colorspaces.
+    """
+
+    def __init__(self, reference, colorspaces=None, prefix=False):
+        """
+        Constructor for ColorSpaceRegistry class
+
+        Parameters
+        ----------
+        reference : ColorSpace
+            The reference colorspace, indexed after the other colorspaces
+        colorspaces : array of ColorSpace, optional
+            The colorspaces to index
+        prefix : bool, optional
+            Whether or not the colorspace names are prefixed with their
+            family names
+
+        Returns
+        -------
+        None
+        """
+
+        self.reference = reference
+        self.prefix = prefix
+        self.colorspaces = []
+        self.names = {}
+        self.aliases = {}
+        self.families = {}
+
+        self.extend(colorspaces or [])
+
+    def __len__(self):
+        return len(self.colorspaces)
+
+    def __iter__(self):
+        return iter(self.colorspaces)
+
+    def __contains__(self, name):
+        return self.get(name) is not None
+
+    def add(self, colorspace):
+        """
+        Indexes given colorspace, the first colorspace indexed with a given
+        name or alias taking precedence.
+
+        Parameters
+        ----------
+        colorspace : ColorSpace
+            The colorspace to index
+
+        Returns
+        -------
+        None
+        """
+
+        self.colorspaces.append(colorspace)
+        self.names.setdefault(colorspace.name, colorspace)
+        for alias in colorspace.aliases:
+            self.aliases.setdefault(alias, colorspace)
+        self.families.setdefault(colorspace.family.lower(), []).append(
+            colorspace)
+
+    def extend(self, colorspaces):
+        """
+        Indexes given colorspaces.
+
+        Parameters
+        ----------
+        colorspaces : array of ColorSpace
+            The colorspaces to index
+
+        Returns
+        -------
+        None
+        """
+
+        for colorspace in colorspaces:
+            self.add(colorspace)
+
+    def get(self, name, default=None):
+        """
+        Returns the colorspace with given name, the reference colorspace
+        included.
+
+        Parameters
+        ----------
+        name : str or unicode
+            The colorspace name, not prefixed
+        default : object, optional
+            The value returned if there is no such colorspace
+
+        Returns
+        -------
+        ColorSpace
+             The colorspace.
+        """
+
+        colorspace = self.names.get(name)
+        if colorspace is None and name == self.reference.name:
+            colorspace = self.reference
+
+        return default if colorspace is None else colorspace
+
+    def get_by_alias(self, alias, default=None):
+        """
+        Returns the colorspace with given alias.
+
+        Parameters
+        ----------
+        alias : str or unicode
+            The colorspace alias
+        default : object, optional
+            The value returned if there is no such colorspace
+
+        Returns
+        -------
+        ColorSpace
+             The colorspace.
+        """
+
+        return self.aliases.get(alias, default)
+
+    def family(self, family):
+        """
+        Returns the colorspaces of given family, compared case insensitively.
+
+        Parameters
+        ----------
+        family : str or unicode
+            The family
+
+        Returns
+        -------
+        list
+             The colorspaces in indexing order.
+        """
+
+        return list(self.families.get(family.lower(), []))
+
+    def by_family(self):
+        """
+        Returns the colorspaces sorted by family, compared case
+        insensitively, the colorspaces of a family being kept in indexing
+        order.
+
+        Returns
+        -------
+        list
+             The sorted colorspaces.
+        """
+
+        return [colorspace
+                for family in sorted(self.families)
+                for colorspace in self.families[family]]
+
+    def name(self, colorspace):
+        """
+        Returns the name given colorspace is written with in the *OCIO*
+        config.
+
+        Parameters
+        ----------
+        colorspace : ColorSpace
+            The colorspace
+
+        Returns
+        -------
+        str or unicode
+             The colorspace name, prefixed if the registry prefixes names.
+        """
+
+        if self.prefix:
+            return colorspace_prefixed_name(colorspace)
+
+        return colorspace.name
+
+    def resolve(self, name):
+        """
+        Returns the name the colorspace with given name is written with in the
+        *OCIO* config.
+
+        Parameters
+        ----------
+        name : str or unicode
+            The colorspace name, not prefixed
+
+        Returns
+        -------
+        str or unicode
+             The colorspace name, given name if there is no such colorspace.
+        """
+
+        colorspace = self.get(name)
+        if colorspace is None:
+            return name
+
+        return self.name(colorspace)
+
+
 def unpack_default(iterable, length=3, default=None):
     """
     Unpacks given iterable maintaining given length and filling missing